@@ -21,7 +21,6 @@
 
 """
 
-from copy import deepcopy
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Generator
 
@@ -36,7 +35,7 @@ from .constants import (
     ACCESS_POLICIES_SUBPATH,
     ASSETS_LABEL,
 )
-from .dictmerge import _deepmerge
+from .dictmerge import _merge
 
 LOGGER = getLogger(__name__)
 
@@ -109,7 +108,7 @@ class _AccessPoliciesClient:
 
         """
         return AccessPolicy(
-            **self._archivist.post(
+            self._archivist.post(
                 f"{self._subpath}/{ACCESS_POLICIES_LABEL}",
                 data,
             )
@@ -127,7 +126,7 @@ class _AccessPoliciesClient:
             :class:`AccessPolicy` instance
 
         """
-        return AccessPolicy(**self._archivist.get(f"{self._subpath}/{identity}"))
+        return AccessPolicy(self._archivist.get(f"{self._subpath}/{identity}"))
 
     def update(
         self,
@@ -152,7 +151,7 @@ class _AccessPoliciesClient:
 
         """
         return AccessPolicy(
-            **self._archivist.patch(
+            self._archivist.patch(
                 f"{self._subpath}/{identity}",
                 self.__params(
                     props, filters=filters, access_permissions=access_permissions
@@ -181,14 +180,14 @@ class _AccessPoliciesClient:
         filters: "list[dict] | None" = None,
         access_permissions: "list[dict] | None" = None,
     ) -> "dict[str, Any]":
-        params = deepcopy(props) if props else {}
+        params = {**props} if props else {}
         if filters is not None:
             params["filters"] = filters
 
         if access_permissions is not None:
             params["access_permissions"] = access_permissions
 
-        return _deepmerge(self._archivist.fixtures.get(ACCESS_POLICIES_LABEL), params)
+        return _merge(self._archivist.fixtures.get(ACCESS_POLICIES_LABEL), params)
 
     def count(self, *, display_name: "str | None" = None) -> int:
         """Count access policies.
@@ -222,7 +221,7 @@ class _AccessPoliciesClient:
         """
         params = {"display_name": display_name} if display_name is not None else None
         return (
-            AccessPolicy(**a)
+            AccessPolicy(a)
             for a in self._archivist.list(
                 self._label,
                 ACCESS_POLICIES_LABEL,
@@ -248,7 +247,7 @@ class _AccessPoliciesClient:
 
         """
         return (
-            Asset(**a)
+            Asset(a)
             for a in self._archivist.list(
                 f"{self._subpath}/{access_policy_id}/{ASSETS_LABEL}",
                 ASSETS_LABEL,
@@ -272,7 +271,7 @@ class _AccessPoliciesClient:
 
         """
         return (
-            AccessPolicy(**a)
+            AccessPolicy(a)
             for a in self._archivist.list(
                 f"{self._subpath}/{asset_id}/{ACCESS_POLICIES_LABEL}",
                 ACCESS_POLICIES_LABEL,
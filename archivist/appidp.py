@@ -75,7 +75,7 @@ class _AppIDPClient:
 
         """
         return AppIDP(
-            **self._archivist.post(
+            self._archivist.post(
                 f"{self._label}/{APPIDP_TOKEN}",
                 {
                     "grant_type": "client_credentials",
@@ -33,7 +33,7 @@ from .constants import (
     APPLICATIONS_REGENERATE,
     APPLICATIONS_SUBPATH,
 )
-from .dictmerge import _deepmerge
+from .dictmerge import _merge
 
 LOGGER = getLogger(__name__)
 
@@ -95,7 +95,7 @@ class _ApplicationsClient:
             :class:`Application` instance
 
         """
-        return Application(**self._archivist.post(self._label, data))
+        return Application(self._archivist.post(self._label, data))
 
     def read(self, identity: str) -> Application:
         """Read Application
@@ -109,7 +109,7 @@ class _ApplicationsClient:
             :class:`Application` instance
 
         """
-        return Application(**self._archivist.get(f"{self._subpath}/{identity}"))
+        return Application(self._archivist.get(f"{self._subpath}/{identity}"))
 
     def update(
         self,
@@ -132,7 +132,7 @@ class _ApplicationsClient:
 
         """
         return Application(
-            **self._archivist.patch(
+            self._archivist.patch(
                 f"{self._subpath}/{identity}",
                 self.__params(
                     display_name=display_name,
@@ -169,7 +169,7 @@ class _ApplicationsClient:
         if custom_claims is not None:
             params["custom_claims"] = custom_claims
 
-        return _deepmerge(self._archivist.fixtures.get(APPLICATIONS_LABEL), params)
+        return _merge(self._archivist.fixtures.get(APPLICATIONS_LABEL), params)
 
     def list(
         self,
@@ -190,7 +190,7 @@ class _ApplicationsClient:
 
         """
         return (
-            Application(**a)
+            Application(a)
             for a in self._archivist.list(
                 self._label,
                 APPLICATIONS_LABEL,
@@ -213,7 +213,7 @@ class _ApplicationsClient:
         """
         LOGGER.debug("Regenerate %s", identity)
         return Application(
-            **self._archivist.post(
+            self._archivist.post(
                 f"{self._subpath}/{identity}:{APPLICATIONS_REGENERATE}",
                 None,
             )
@@ -0,0 +1,408 @@
+"""Archivist columnar archive
+
+   File format for exported assets and events that may be memory-mapped and
+   read without decoding the whole file.
+
+   The writer accepts the :class:`Columns` batches produced by
+   :func:`archivist.columns.to_column_batches` and writes each batch as a
+   segment:
+
+      * 8 byte magic
+      * for each segment:
+
+        * 8 byte header length
+        * JSON header describing the columns and their blocks
+        * data blocks - each aligned to 8 bytes
+
+   Numeric columns are stored as fixed width arrays, strings as an array of
+   offsets followed by utf-8 data and dictionary encoded columns as an
+   array of codes followed by the strings of the dictionary.
+
+   Each segment also holds the row numbers sorted by identity and by
+   timestamp so that the reader can find an entity or a time range by
+   binary search.
+
+   For example:
+
+   .. code-block:: python
+
+      with open("events.arc", "wb") as fd:
+          writer = ArchiveWriter(fd)
+          for columns in to_column_batches(arch.events.list(fields=FIELDS)):
+              writer.write(columns)
+
+      with open("events.arc", "rb") as fd, ArchiveReader(fd) as reader:
+          event = reader.find("assets/xxxx/events/yyyy")
+          for event in reader.between("2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z"):
+              ...
+
+"""
+
+from array import array
+from collections.abc import Sequence
+from contextlib import suppress
+from heapq import merge
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from sys import byteorder
+from typing import Any, BinaryIO, Generator, Iterable
+
+from .columns import Columns, DictionaryColumn
+from .errors import ArchivistInvalidOperationError
+from .timestamp import parse_timestamps
+
+# pylint:disable=too-few-public-methods
+
+MAGIC = b"ARCCOL\x00\x01"
+ALIGNMENT = 8
+
+IDENTITY = "identity"
+TIMESTAMP = "timestamp_committed"
+
+
+def _typecode(column: Any) -> str:
+    """Return typecode of stdlib or NumPy array"""
+    try:
+        return column.typecode
+    except AttributeError:  # pragma: no cover
+        return column.dtype.char
+
+
+def _strings(values: "Iterable[str]") -> "tuple[array, bytes]":
+    """Encode strings as offsets and utf-8 data"""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = array("q", [0])
+    total = 0
+    for e in encoded:
+        total += len(e)
+        offsets.append(total)
+
+    return offsets, b"".join(encoded)
+
+
+class _Strings(Sequence):
+    """Strings stored as offsets and utf-8 data"""
+
+    __slots__ = ("_offsets", "_data", "_decode")
+
+    def __init__(self, offsets: memoryview, data: memoryview, *, decode=None):
+        self._offsets = offsets
+        self._data = data
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        value = str(
+            self._data[self._offsets[index] : self._offsets[index + 1]], "utf-8"
+        )
+        return value if self._decode is None else self._decode(value)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class _DictionaryStrings(_Strings):
+    """Strings of a dictionary decoded when first used"""
+
+    __slots__ = ("_decoded",)
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        super().__init__(offsets, data)
+        self._decoded: "list[str|None]" = [None] * len(self)
+
+    def __getitem__(self, index: int) -> str:
+        value = self._decoded[index]
+        if value is None:
+            value = self._decoded[index] = super().__getitem__(index)
+
+        return value
+
+
+class _Segment:
+    """One batch of columns in an archive"""
+
+    def __init__(self, view: memoryview, header: "dict[str, Any]"):
+        self._view = view
+        self.rows: int = header["rows"]
+        self.columns = Columns((c["name"], self.__column(c)) for c in header["columns"])
+        self._identity = self.__block(header["identity"], "q")
+        self._timestamp = self.__block(header["timestamp"], "q")
+
+    def __block(self, block: "list[int]|None", typecode: str) -> Any:
+        if block is None:
+            return None
+
+        offset, size = block
+        return self._view[offset : offset + size].cast(typecode)  # pyright: ignore
+
+    def __column(self, desc: "dict[str, Any]") -> Any:
+        kind = desc["kind"]
+        if kind == "array":
+            return self.__block(desc["data"], desc["typecode"])
+
+        offsets = self.__block(desc["offsets"], "q")
+        data = self.__block(desc["data"], "B")
+        if kind == "dict":
+            return DictionaryColumn(
+                self.__block(desc["codes"], desc["typecode"]),
+                _DictionaryStrings(offsets, data),
+            )
+
+        return _Strings(offsets, data, decode=loads if kind == "json" else None)
+
+    def row(self, index: int) -> "dict[str, Any]":
+        """Return row as dictionary"""
+        return {k: v[index] for k, v in self.columns.items()}
+
+    def find(self, identity: str) -> "dict[str, Any]|None":
+        """Return row with identity by binary search"""
+        if self._identity is None:
+            raise ArchivistInvalidOperationError("Archive has no identity index")
+
+        order = self._identity
+        identities = self.columns[IDENTITY]
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (identities[order[mid]] or "") < identity:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < len(order) and identities[order[lo]] == identity:
+            return self.row(order[lo])
+
+        return None
+
+    def between(
+        self, start: int, end: int
+    ) -> "Generator[tuple[int, dict[str, Any]], None, None]":
+        """Return rows with timestamp in range by binary search"""
+        if self._timestamp is None:
+            raise ArchivistInvalidOperationError("Archive has no timestamp index")
+
+        order = self._timestamp
+        timestamps = self.columns[TIMESTAMP]
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamps[order[mid]] < start:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        for i in range(lo, len(order)):
+            timestamp = timestamps[order[i]]
+            if timestamp >= end:
+                break
+
+            yield timestamp, self.row(order[i])
+
+
+class ArchiveWriter:
+    """Columnar archive writer
+
+    Args:
+        fd (file): archive file opened for binary writing.
+
+    """
+
+    def __init__(self, fd: BinaryIO):
+        self._fd = fd
+        self._fd.write(MAGIC)
+
+    def write(self, columns: Columns):
+        """Write columns as a segment
+
+        If there are identity or timestamp_committed columns then
+        the indices used by :class:`ArchiveReader` find and between
+        methods are also written.
+
+        Args:
+            columns (Columns): columns of equal length as returned by
+                :func:`archivist.columns.to_columns`.
+
+        """
+        blocks = []
+        size = 0
+
+        def block(data: Any) -> "list[int]":
+            nonlocal size
+            data = memoryview(data).cast("B")
+            offset = size
+            blocks.append(data)
+            size += len(data)
+            padding = -size % ALIGNMENT
+            if padding:
+                blocks.append(bytes(padding))
+                size += padding
+
+            return [offset, len(data)]
+
+        descs = []
+        for name, column in columns.items():
+            desc: "dict[str, Any]" = {"name": name}
+            if isinstance(column, DictionaryColumn):
+                offsets, data = _strings(column.values)
+                desc.update(
+                    kind="dict",
+                    typecode=_typecode(column.codes),
+                    codes=block(column.codes),
+                    offsets=block(offsets),
+                    data=block(data),
+                )
+            elif isinstance(column, list):
+                if all(isinstance(v, str) for v in column):
+                    desc["kind"] = "str"
+                    offsets, data = _strings(column)
+                else:
+                    desc["kind"] = "json"
+                    offsets, data = _strings(dumps(v) for v in column)
+
+                desc.update(offsets=block(offsets), data=block(data))
+            else:
+                desc.update(
+                    kind="array", typecode=_typecode(column), data=block(column)
+                )
+
+            descs.append(desc)
+
+        rows = columns.rows
+        identity = timestamp = None
+        if IDENTITY in columns:
+            values = list(columns[IDENTITY])
+            identity = block(
+                array("q", sorted(range(rows), key=lambda i: values[i] or ""))
+            )
+
+        if TIMESTAMP in columns:
+            values = columns[TIMESTAMP]
+            timestamp = block(array("q", sorted(range(rows), key=values.__getitem__)))
+
+        header = dumps(
+            {
+                "rows": rows,
+                "byteorder": byteorder,
+                "size": size,
+                "columns": descs,
+                "identity": identity,
+                "timestamp": timestamp,
+            }
+        ).encode("utf-8")
+        header += b" " * (-len(header) % ALIGNMENT)
+        self._fd.write(len(header).to_bytes(8, "little"))
+        self._fd.write(header)
+        for b in blocks:
+            self._fd.write(b)
+
+
+class ArchiveReader:
+    """Columnar archive reader
+
+    The archive is memory-mapped and only the segment headers are decoded
+    when opened.
+
+    Columns returned by batches() refer directly to the mapped file.
+    If any are still referenced when the reader is closed the file remains
+    mapped until they are released.
+
+    Args:
+        fd (file): archive file opened for binary reading. The file may be
+            closed once the reader is created.
+
+    """
+
+    def __init__(self, fd: BinaryIO):
+        self._mmap = mmap(fd.fileno(), 0, access=ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+        if self._view[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ArchivistInvalidOperationError(f"{fd.name} is not an archive")
+
+        self._segments: "list[_Segment]" = []
+        offset = len(MAGIC)
+        while offset < len(self._view):
+            length = int.from_bytes(self._view[offset : offset + 8], "little")
+            offset += 8
+            header = loads(str(self._view[offset : offset + length], "utf-8"))
+            if header["byteorder"] != byteorder:
+                self.close()
+                raise ArchivistInvalidOperationError(
+                    f"{fd.name} has {header['byteorder']} endian byte order"
+                )
+
+            offset += length
+            self._segments.append(
+                _Segment(self._view[offset : offset + header["size"]], header)
+            )
+            offset += header["size"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the archive"""
+        self._segments = []
+        self._view.release()
+        # close() raises BufferError while columns returned by batches() still
+        # refer to the mapped file - the file is then unmapped when the last of
+        # them is released
+        with suppress(BufferError):
+            self._mmap.close()
+
+    @property
+    def rows(self) -> int:
+        """int: total number of rows"""
+        return sum(s.rows for s in self._segments)
+
+    def batches(self) -> "Generator[Columns, None, None]":
+        """Return columns of each segment
+
+        Numeric columns and codes are memoryviews of the mapped file.
+        """
+        for segment in self._segments:
+            yield segment.columns
+
+    def find(self, identity: str) -> "dict[str, Any]|None":
+        """Find row by identity
+
+        Args:
+            identity (str): identity of asset or event
+
+        Returns:
+            dictionary of the row or None if not found
+
+        """
+        for segment in self._segments:
+            row = segment.find(identity)
+            if row is not None:
+                return row
+
+        return None
+
+    def between(
+        self, start: "int|str", end: "int|str"
+    ) -> "Generator[dict[str, Any], None, None]":
+        """Return rows with timestamp_committed in range start to end (exclusive)
+
+        Args:
+            start (int|str): epoch microseconds or timestamp
+            end (int|str): epoch microseconds or timestamp
+
+        Returns:
+            iterable of dictionaries in timestamp order
+
+        """
+        start, end = (
+            parse_timestamps((t,))[0] if isinstance(t, str) else t for t in (start, end)
+        )
+        for _, row in merge(
+            *(s.between(start, end) for s in self._segments), key=lambda r: r[0]
+        ):
+            yield row
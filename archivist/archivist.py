@@ -48,15 +48,16 @@ from .assetattachments import _AssetAttachmentsClient
 from .assets import _AssetsRestricted
 from .attachments import _AttachmentsClient
 from .composite import _CompositeClient
-from .confirmer import MAX_TIME
+from .confirmations import _ConfirmationsClient
 from .constants import (
     AUTHORIZATION_KEY,
     BEARER_PREFIX,
     BINARY_CONTENT,
+    CONFIRMATION_MAX_TIME,
     ROOT,
     SEP,
 )
-from .dictmerge import _dotdict
+from .dictmerge import _querystring
 from .errors import (
     ArchivistError,
     _parse_response,
@@ -82,6 +83,8 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
         Appregistration ID and secret.
         verify: if True the certificate is verified
         max_time (float): maximum time in seconds to wait for confirmation
+        count_ttl (float): time in seconds that count() results are cached.
+            The default of zero disables caching.
 
     """
 
@@ -94,27 +97,30 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
         "applications": _ApplicationsClient,
         "attachments": _AttachmentsClient,
         "composite": _CompositeClient,
+        "confirmations": _ConfirmationsClient,
         "events": _EventsRestricted,
         "runner": _Runner,
         "subjects": _SubjectsClient,
         "tenancies": _TenanciesClient,
     }
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         url: str,
         auth: "str|tuple[str,str]|None",
         *,
         fixtures: "dict[str,dict[Any,Any]]|None" = None,
         verify: bool = True,
-        max_time: float = MAX_TIME,
+        max_time: float = CONFIRMATION_MAX_TIME,
         partner_id: str = "",
+        count_ttl: float = 0.0,
     ):
         super().__init__(
             fixtures=fixtures,
             verify=verify,
             max_time=max_time,
             partner_id=partner_id,
+            count_ttl=count_ttl,
         )
 
         if isinstance(auth, tuple):
@@ -139,6 +145,7 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
         self.assetattachments: _AssetAttachmentsClient
         self.attachments: _AttachmentsClient
         self.composite: _CompositeClient
+        self.confirmations: _ConfirmationsClient
         self.events: _EventsRestricted
         self.runner: _Runner
         self.subjects: _SubjectsClient
@@ -165,6 +172,26 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
         super().__setattr__(value, c)
         return c
 
+    def close(self, *, wait: bool = False, timeout: "float|None" = None):
+        """stops background confirmations and closes current session if open
+
+        By default pending background confirmations fail with
+        :class:`ArchivistUnconfirmedError` once any poll in progress completes.
+        Waiting for them instead may take up to the max_time of their
+        confirmation policy.
+
+        Args:
+            wait (bool): if True wait for background confirmations to complete.
+            timeout (float): maximum time in seconds to wait for background
+                confirmations after which they fail as if wait were False.
+
+        """
+        confirmations = self.__dict__.pop("confirmations", None)
+        if confirmations is not None:
+            confirmations.shutdown(wait=wait, timeout=timeout)
+
+        super().close()
+
     @property
     def public(self) -> bool:
         """Not a public interface"""
@@ -205,6 +232,7 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
             verify=self._verify,
             max_time=self._max_time,
             partner_id=self._partner_id,
+            count_ttl=self.count_ttl,
         )
         arch._user_agent = self._user_agent  # pylint: disable=protected-access
         return arch
@@ -217,8 +245,10 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
             verify=self._verify,
             max_time=self._max_time,
             partner_id=self._partner_id,
+            count_ttl=self.count_ttl,
         )
         arch._user_agent = self._user_agent
+        arch.profiler = self.profiler
         return arch
 
     def _add_headers(
@@ -357,7 +387,7 @@ class Archivist(ArchivistPublic):  # pylint: disable=too-many-instance-attribute
             url,
             data=multipart,  # pyright: ignore    https://github.com/requests/toolbelt/issues/312
             headers=self._add_headers(headers),
-            params=_dotdict(params),
+            params=_querystring(params),
         )
 
         self._response_ring_buffer.appendleft(response)
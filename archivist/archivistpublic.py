@@ -25,26 +25,31 @@
 from collections import deque
 from copy import deepcopy
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Generator
 
 import requests
 
 if TYPE_CHECKING:
     from requests.models import Response
 
+    from .profiler import Profiler
+
 
 from .about import __version__ as VERSION
 from .assetattachments import _AssetAttachmentsClient
 from .assets import _AssetsPublic
-from .confirmer import MAX_TIME
+from .cache import _TTLCache
 from .constants import (
+    CONFIRMATION_MAX_TIME,
+    COUNT_CACHE_SIZE,
     HEADERS_REQUEST_TOTAL_COUNT,
     HEADERS_TOTAL_COUNT,
     PARTNER_ID,
     USER_AGENT,
     USER_AGENT_PREFIX,
 )
-from .dictmerge import _deepmerge, _dotdict
+from .cursor import ListCursor
+from .dictmerge import _deepmerge, _querystring
 from .errors import (
     ArchivistBadFieldError,
     ArchivistDuplicateError,
@@ -59,7 +64,7 @@ from .retry429 import retry_429
 LOGGER = getLogger(__name__)
 
 
-class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
+class ArchivistPublic:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Base class for public Archivist endpoints.
 
     This class manages the connection to an Archivist instance and provides
@@ -68,6 +73,8 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
     Args:
         verify: if True the certificate is verified
         max_time (float): maximum time in seconds to wait for confirmation
+        count_ttl (float): time in seconds that count() results are cached.
+            The default of zero disables caching.
 
     """
 
@@ -85,8 +92,9 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         *,
         fixtures: "dict[str, Any]|None" = None,
         verify: bool = True,
-        max_time: float = MAX_TIME,
+        max_time: float = CONFIRMATION_MAX_TIME,
         partner_id: str = "",
+        count_ttl: float = 0.0,
     ):
         self._verify = verify
         self._response_ring_buffer = deque(maxlen=self.RING_BUFFER_MAX_LEN)
@@ -95,6 +103,9 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         self._fixtures = fixtures or {}
         self._partner_id = partner_id
         self._user_agent = f"{USER_AGENT_PREFIX}{self.version}"
+        self._count_cache = _TTLCache(count_ttl, COUNT_CACHE_SIZE)
+
+        self._profiler: "Profiler|None" = None
 
         # Type hints for IDE autocomplete, keep in sync with CLIENTS map above
         self.assets: _AssetsPublic
@@ -130,8 +141,28 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         if self._session is None:
             self._session = requests.Session()
             self._session.verify = self.verify
+            if self._profiler is not None:
+                self._session.hooks["response"].append(self._profiler.response_hook)
         return self._session
 
+    @property
+    def profiler(self) -> "Profiler|None":
+        """Profiler: records the cost of each runner step if set"""
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: "Profiler|None"):
+        """Set the profiler as a response hook of the session if it exists"""
+        if self._session is not None:
+            hooks = self._session.hooks["response"]
+            if self._profiler is not None:
+                hooks.remove(self._profiler.response_hook)
+
+            if profiler is not None:
+                hooks.append(profiler.response_hook)
+
+        self._profiler = profiler
+
     def close(self):
         """closes current session if open"""
         if self._session is not None:
@@ -158,6 +189,11 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         """bool: Returns maximum time in seconds to wait for confirmation"""
         return self._max_time
 
+    @property
+    def count_ttl(self) -> float:
+        """float: Returns time in seconds that count() results are cached"""
+        return self._count_cache.ttl
+
     @property
     def version(self) -> str:
         """str: Returns version of the archivist package"""
@@ -194,8 +230,10 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
             verify=self._verify,
             max_time=self._max_time,
             partner_id=self.partner_id,
+            count_ttl=self.count_ttl,
         )
         arch._user_agent = self._user_agent
+        arch.profiler = self.profiler
         return arch
 
     def _add_headers(self, headers: "dict[str, str]|None") -> "dict[str, str]":
@@ -222,7 +260,7 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         response = self.session.get(
             url,
             headers=self._add_headers(headers),
-            params=_dotdict(params),
+            params=_querystring(params),
         )
 
         self._response_ring_buffer.appendleft(response)
@@ -304,7 +342,7 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
             url,
             headers=self._add_headers(headers),
             stream=True,
-            params=_dotdict(params),
+            params=_querystring(params),
         )
 
         self._response_ring_buffer.appendleft(response)
@@ -337,7 +375,7 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         response = self.session.get(
             url,
             headers=self._add_headers(headers),
-            params=_dotdict(params),
+            params=_querystring(params),
         )
 
         self._response_ring_buffer.appendleft(response)
@@ -414,14 +452,36 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
 
         return records[0]
 
-    def count(self, url: str, *, params: "dict[str, Any]|None" = None) -> int:
+    def __count(self, url: str, params: "dict[str, Any]|None") -> int:
+        response = self.__list(
+            url,
+            params,
+            page_size=1,
+            headers={HEADERS_REQUEST_TOTAL_COUNT: "true"},
+        )
+
+        count = _headers_get(response.headers, HEADERS_TOTAL_COUNT)
+
+        if count is None:
+            raise ArchivistHeaderError("Did not get a count in the header")
+
+        return int(count)
+
+    def count(
+        self, url: str, *, params: "dict[str, Any]|None" = None, cached: bool = True
+    ) -> int:
         """GET method (REST) with params string
 
         Returns the count of objects that match params
 
+        If count_ttl was specified the result is cached for count_ttl seconds
+        and identical concurrent counts share a single request.
+
         Args:
             url (str): e.g. https://app.datatrails.ai/archivist/v2/assets
             params (dict): selector e.g. {"attributes":{"arc_display_name":"container no. 1"}}
+            cached (bool): if False the count is always requested e.g. when
+                polling for a change.
 
         Returns:
             integer count of entities found.
@@ -430,22 +490,27 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
             ArchivistHeaderError: If the expected count header is not present
 
         """
+        if not cached or self._count_cache.ttl <= 0:
+            return self.__count(url, params)
 
-        response = self.__list(
-            url,
-            params,
-            page_size=1,
-            headers={HEADERS_REQUEST_TOTAL_COUNT: "true"},
+        return self._count_cache.get_or_call(
+            (url, _querystring(params)),
+            lambda: self.__count(url, params),
         )
 
-        count = _headers_get(response.headers, HEADERS_TOTAL_COUNT)
+    def count_invalidate(self, suffix: str):
+        """Discard cached counts
 
-        if count is None:
-            raise ArchivistHeaderError("Did not get a count in the header")
+        Called when entities are created so that subsequent counts are
+        not stale.
 
-        return int(count)
+        Args:
+            suffix (str): discard counts of all urls ending in suffix e.g. /events
 
-    def list(
+        """
+        self._count_cache.invalidate(lambda key: key[0].endswith(suffix))
+
+    def list_pages(
         self,
         url: str,
         field: str,
@@ -453,16 +518,13 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
         page_size: "int|None" = None,
         params: "dict[str, Any]|None" = None,
         headers: "dict[str, str]|None" = None,
-    ):
-        """GET method (REST) with params string
-
-        Lists entities that match the params dictionary.
+        page_token: "str|None" = None,
+    ) -> "Generator[tuple[list[dict[str, Any]], str|None], None, None]":
+        """GET method (REST) with params string one page at a time
 
-        If page size is specified return the list of records in batches of page_size
-        until next_page_token in response is null.
-
-        If page size is unspecified return up to the internal limit of records.
-        (different for each endpoint)
+        Lists entities that match the params dictionary and returns each page
+        of records with the token of the next page. The token may be used to
+        continue the listing later.
 
         Args:
             url (str): e.g. https://app.datatrails.ai/archivist/v2/assets
@@ -470,14 +532,19 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
             page_size (int): optional number of items per request e.g. 500
             params (dict): selector e.g. {"confirmation_status": "CONFIRMED", }
             headers (dict): optional REST headers
+            page_token (str): optional token of the page to start from. If
+                specified params is ignored as the token encodes the selector.
 
         Returns:
-            iterable that lists entities
+            iterable of tuples of list of records and the next page token
+            (None for the last page).
 
         Raises:
             ArchivistBadFieldError: field has incorrect value.
 
         """
+        if page_token is not None:
+            params = {"page_token": page_token}
 
         while True:
             response = self.__list(
@@ -493,10 +560,86 @@ class ArchivistPublic:  # pylint: disable=too-many-instance-attributes
             except KeyError as ex:
                 raise ArchivistBadFieldError(f"No {field} found") from ex
 
-            yield from records
-
-            page_token = data.get("next_page_token")
-            if not page_token:
+            page_token = data.get("next_page_token") or None
+            yield records, page_token
+            if page_token is None:
                 break
 
             params = {"page_token": page_token}
+
+    def list(
+        self,
+        url: str,
+        field: str,
+        *,
+        page_size: "int|None" = None,
+        params: "dict[str, Any]|None" = None,
+        headers: "dict[str, str]|None" = None,
+        cursor: "ListCursor|None" = None,
+    ):
+        """GET method (REST) with params string
+
+        Lists entities that match the params dictionary.
+
+        If page size is specified return the list of records in batches of page_size
+        until next_page_token in response is null.
+
+        If page size is unspecified return up to the internal limit of records.
+        (different for each endpoint)
+
+        Args:
+            url (str): e.g. https://app.datatrails.ai/archivist/v2/assets
+            field (str): name of collection of entities e.g assets
+            page_size (int): optional number of items per request e.g. 500
+            params (dict): selector e.g. {"confirmation_status": "CONFIRMED", }
+            headers (dict): optional REST headers
+            cursor (ListCursor): optional cursor updated as each entity is listed.
+                If the cursor is from an earlier listing, the listing resumes
+                after the last entity listed.
+
+        Returns:
+            iterable that lists entities
+
+        Raises:
+            ArchivistBadFieldError: field has incorrect value.
+
+        """
+        if cursor is None:
+            cursor = ListCursor()
+        elif cursor.done:
+            return
+
+        skip = cursor.offset
+        for records, next_page_token in self.list_pages(
+            url,
+            field,
+            page_size=page_size,
+            params=params,
+            headers=headers,
+            page_token=cursor.page_token,
+        ):
+            last = len(records) - 1
+            if skip > last:
+                # empty page or the page was completely listed before resuming
+                cursor.update(
+                    page_token=next_page_token, offset=0, done=next_page_token is None
+                )
+
+            # drop the page reference to each record as it is yielded so that
+            # the decoded dict is freed as soon as the caller has wrapped it.
+            for i in range(skip, last + 1):
+                record = records[i]
+                records[i] = None  # pyright: ignore
+                cursor["count"] += 1
+                if i < last:
+                    cursor["offset"] = i + 1
+                else:
+                    cursor.update(
+                        page_token=next_page_token,
+                        offset=0,
+                        done=next_page_token is None,
+                    )
+
+                yield record
+
+            skip = 0
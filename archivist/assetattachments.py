@@ -25,7 +25,6 @@
 # pylint:disable=too-few-public-methods
 
 
-from copy import deepcopy
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, BinaryIO
 from urllib.parse import urlparse
@@ -42,7 +41,7 @@ from .constants import (
     ATTACHMENTS_LABEL,
     SEP,
 )
-from .dictmerge import _deepmerge
+from .dictmerge import _merge
 
 LOGGER = getLogger(__name__)
 
@@ -99,9 +98,9 @@ class _AssetAttachmentsClient:
         return f"{self._label}/{identity}/{uuid}"
 
     def __params(self, params: "dict[str, Any]|None") -> "dict[str, Any]":
-        params = deepcopy(params) if params else {}
+        params = {**params} if params else {}
         # pylint: disable=protected-access
-        return _deepmerge(self._archivist.fixtures.get(ATTACHMENTS_LABEL), params)
+        return _merge(self._archivist.fixtures.get(ATTACHMENTS_LABEL), params)
 
     def download(
         self,
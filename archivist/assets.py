@@ -21,25 +21,32 @@
 
 """
 
-from copy import deepcopy
+from asyncio import to_thread
 from logging import getLogger
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
 from . import confirmer
 from .asset import Asset
+from .confirmation_policy import ConfirmationPolicy
 from .constants import (
     ASSET_BEHAVIOURS,
     ASSETS_LABEL,
     ASSETS_SUBPATH,
-    CONFIRMATION_STATUS,
+    EVENTS_LABEL,
+    MAX_WORKERS,
 )
-from .dictmerge import _deepmerge
+from .dictmerge import _merge
 from .errors import ArchivistBadFieldError, ArchivistNotFoundError
+from .parallel import _count_many
+from .projection import _Projection
 from .utils import selector_signature
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from .archivist import Archivist
+    from .cursor import ListCursor  # pylint:disable=unused-import
 
 LOGGER = getLogger(__name__)
 
@@ -84,7 +91,7 @@ class _AssetsPublic:
             :class:`Asset` instance
 
         """
-        return Asset(**self._archivist.get(self._identity(identity)))
+        return Asset(self._archivist.get(self._identity(identity)))
 
 
 class _AssetsRestricted(_AssetsPublic):
@@ -102,6 +109,9 @@ class _AssetsRestricted(_AssetsPublic):
         super().__init__(archivist_instance)
         self._label = f"{self._subpath}/{ASSETS_LABEL}"
         self.pending_count: int = 0
+        self.confirmation_policy = ConfirmationPolicy(
+            max_time=archivist_instance.max_time
+        )
 
     def __str__(self) -> str:
         return f"AssetsRestricted({self._archivist.url})"
@@ -109,19 +119,40 @@ class _AssetsRestricted(_AssetsPublic):
     def __params(
         self, props: "dict[str, Any]|None", attrs: "dict[str, Any]|None"
     ) -> "dict[str, Any]":
-        params = deepcopy(props) if props else {}
+        params = {**props} if props else {}
         if attrs:
             params["attributes"] = attrs
 
-        return _deepmerge(self._archivist.fixtures.get(f"{ASSETS_LABEL}"), params)
+        return _merge(self._archivist.fixtures.get(f"{ASSETS_LABEL}"), params)
 
+    @overload
     def create(
         self,
         *,
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
         confirm: bool = False,
-    ) -> Asset:
+        future: "Literal[False]" = False,
+    ) -> Asset: ...  # pragma: no cover
+
+    @overload
+    def create(
+        self,
+        *,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        confirm: bool = False,
+        future: "Literal[True]",
+    ) -> "Future[Asset]": ...  # pragma: no cover
+
+    def create(
+        self,
+        *,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        confirm: bool = False,
+        future: bool = False,
+    ) -> "Asset|Future[Asset]":
         """Create asset
 
         Creates asset with defined properties and attributes.
@@ -130,21 +161,46 @@ class _AssetsRestricted(_AssetsPublic):
             props (dict): Properties
             attrs (dict): attributes of created asset.
             confirm (bool): if True wait for asset to be confirmed.
+            future (bool): if True return a Future that is resolved with the
+                asset when it is confirmed. The asset is still created before
+                returning - only the confirmation is done in the background.
 
         Returns:
-            :class:`Asset` instance
+            :class:`Asset` instance or Future
 
         """
         LOGGER.debug("Create Asset %s", attrs)
         # default behaviours  are added first - any set in user-specified fixtures or
         # in the method args will overide...
-        newprops = _deepmerge({"behaviours": ASSET_BEHAVIOURS}, props)
+        newprops = _merge({"behaviours": ASSET_BEHAVIOURS}, props)
         data = self.__params(newprops, attrs)
-        return self.create_from_data(data, confirm=confirm)
+        return self.create_from_data(data, confirm=confirm, future=future)
 
+    @overload
     def create_from_data(
-        self, data: "dict[str, Any]", *, confirm: bool = False
-    ) -> Asset:
+        self,
+        data: "dict[str, Any]",
+        *,
+        confirm: bool = False,
+        future: "Literal[False]" = False,
+    ) -> Asset: ...  # pragma: no cover
+
+    @overload
+    def create_from_data(
+        self,
+        data: "dict[str, Any]",
+        *,
+        confirm: bool = False,
+        future: "Literal[True]",
+    ) -> "Future[Asset]": ...  # pragma: no cover
+
+    def create_from_data(
+        self,
+        data: "dict[str, Any]",
+        *,
+        confirm: bool = False,
+        future: bool = False,
+    ) -> "Asset|Future[Asset]":
         """Create asset
 
         Creates asset with request body from data stream.
@@ -153,12 +209,24 @@ class _AssetsRestricted(_AssetsPublic):
         Args:
             data (dict): request body of asset.
             confirm (bool): if True wait for asset to be confirmed.
+            future (bool): if True return a Future that is resolved with the
+                asset when it is confirmed. The asset is still created before
+                returning - only the confirmation is done in the background.
 
         Returns:
-            :class:`Asset` instance
+            :class:`Asset` instance or Future
 
         """
-        asset = Asset(**self._archivist.post(self._label, data))
+        asset = Asset(self._archivist.post(self._label, data))
+        # creating an asset also creates its first event
+        self._archivist.count_invalidate(self._label)
+        self._archivist.count_invalidate(f"/{EVENTS_LABEL}")
+        if future:
+            # pylint: disable=protected-access
+            return confirmer._confirm_in_background(
+                self, asset["identity"], self.confirmation_policy
+            )
+
         if not confirm:
             return asset
 
@@ -205,9 +273,11 @@ class _AssetsRestricted(_AssetsPublic):
 
         asset = None
         existed = False
-        data = deepcopy(data)
-        attachments = data.pop("attachments", None)
-        selector = data.pop("selector")  # must exist
+        # data is never modified - only the top level and the attributes
+        # (if there are attachments) are copied.
+        selector = data["selector"]  # must exist
+        attachments = data.get("attachments")
+        data = {k: v for k, v in data.items() if k not in ("attachments", "selector")}
         props, attrs = selector_signature(selector, data)
         try:
             asset = self.read_by_signature(props=props, attrs=attrs)
@@ -223,6 +293,7 @@ class _AssetsRestricted(_AssetsPublic):
 
         # any attachments ?
         if attachments is not None:
+            data["attributes"] = {**data["attributes"]}
             for a in attachments:
                 # attempt to get attachment to use as a key
                 attachment_key = a.get("attachment", None)
@@ -240,27 +311,34 @@ class _AssetsRestricted(_AssetsPublic):
 
         return asset, existed
 
-    def wait_for_confirmation(self, identity: str) -> Asset:
+    def wait_for_confirmation(
+        self, identity: str, *, policy: "ConfirmationPolicy|None" = None
+    ) -> Asset:
         """Wait for asset to be confirmed.
 
-        Waits for asset to be confirmed.
+        Waits for asset to be confirmed. The time taken is recorded by the
+        policy.
 
         Args:
             identity (str): identity of asset
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
 
         Returns:
             True if asset is confirmed.
 
         """
-        confirmer.MAX_TIME = self._archivist.max_time
         # pylint: disable=protected-access
-        return confirmer._wait_for_confirmation(self, identity)
+        return confirmer._wait_for_confirmation(
+            self, identity, policy or self.confirmation_policy
+        )
 
     def wait_for_confirmed(
         self,
         *,
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
+        policy: "ConfirmationPolicy|None" = None,
     ) -> bool:
         """Wait for assets to be confirmed.
 
@@ -269,29 +347,60 @@ class _AssetsRestricted(_AssetsPublic):
         Args:
             props (dict): e.g. {"tracked": "TRACKED" }
             attrs (dict): e.g. {"arc_display_type": "door" }
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
 
         Returns:
             True if all assets are confirmed.
 
         """
-        # check that entities exist
-        newprops = deepcopy(props) if props else {}
-        newprops.pop(CONFIRMATION_STATUS, None)
-
-        LOGGER.debug("Count assets %s", newprops)
-        count = self.count(props=newprops, attrs=attrs)
-        if count == 0:
+        # check that entities exist with the first round of status counts
+        LOGGER.debug("Count assets %s", props)
+        # pylint: disable=protected-access
+        counts = confirmer._status_counts(self, props, exists=True, attrs=attrs)
+        if counts.pop(confirmer.TOTAL) == 0:
             raise ArchivistNotFoundError("No assets exist")
 
-        confirmer.MAX_TIME = self._archivist.max_time
-        # pylint: disable=protected-access
-        return confirmer._wait_for_confirmed(self, props=newprops, attrs=attrs)
+        return confirmer._wait_for_confirmed(
+            self,
+            policy or self.confirmation_policy,
+            props=props,
+            recent=counts,
+            attrs=attrs,
+        )
+
+    async def wait_for_confirmed_async(
+        self,
+        *,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        policy: "ConfirmationPolicy|None" = None,
+    ) -> bool:
+        """Wait for assets to be confirmed without blocking the event loop.
+
+        Awaitable variant of :meth:`wait_for_confirmed` that waits in a
+        separate thread.
+
+        Args:
+            props (dict): e.g. {"tracked": "TRACKED" }
+            attrs (dict): e.g. {"arc_display_type": "door" }
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
+
+        Returns:
+            True if all assets are confirmed.
+
+        """
+        return await to_thread(
+            self.wait_for_confirmed, props=props, attrs=attrs, policy=policy
+        )
 
     def count(
         self,
         *,
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
+        cached: bool = True,
     ) -> int:
         """Count assets.
 
@@ -300,12 +409,38 @@ class _AssetsRestricted(_AssetsPublic):
         Args:
             props (dict): e.g. {"confirmation_status": "CONFIRMED" }
             attrs (dict): e.g. {"arc_display_type": "door" }
+            cached (bool): if False the count is not read from the count cache.
 
         Returns:
             integer count of assets.
 
         """
-        return self._archivist.count(self._label, params=self.__params(props, attrs))
+        return self._archivist.count(
+            self._label, params=self.__params(props, attrs), cached=cached
+        )
+
+    def count_many(
+        self,
+        filters: "dict[str, dict[str, Any]]",
+        *,
+        max_workers: int = MAX_WORKERS,
+    ) -> "dict[str, int]":
+        """Count assets for many filters.
+
+        Counts number of assets that match each of the named filters. The
+        counts are made concurrently.
+
+        Args:
+            filters (dict): arguments of :meth:`count` keyed by name e.g.
+                {"pending": {"props": {"confirmation_status": "PENDING"}},
+                "doors": {"attrs": {"arc_display_type": "door"}}}
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            dict of integer count of assets keyed by name.
+
+        """
+        return _count_many(self.count, filters, max_workers=max_workers)
 
     def list(
         self,
@@ -313,6 +448,8 @@ class _AssetsRestricted(_AssetsPublic):
         page_size: "int|None" = None,
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
+        fields: "tuple[str, ...]|None" = None,
+        cursor: "ListCursor|None" = None,
     ):
         """List assets.
 
@@ -322,20 +459,27 @@ class _AssetsRestricted(_AssetsPublic):
             props (dict): optional e.g. {"tracked": "TRACKED" }
             attrs (dict): optional e.g. {"arc_display_type": "door" }
             page_size (int): optional page size. (Rarely used).
+            fields (tuple): optional dot delimited fields to return
+                e.g. ("identity", "attributes.arc_display_name")
+            cursor (ListCursor): optional cursor that records the progress of the
+                listing and from which an interrupted listing may be resumed.
 
         Returns:
-            iterable that returns :class:`Asset` instances
+            iterable that returns :class:`Asset` instances or, if fields is
+            specified, named tuples of the fields.
 
         """
-        return (
-            Asset(**a)
-            for a in self._archivist.list(
-                self._label,
-                ASSETS_LABEL,
-                page_size=page_size,
-                params=self.__params(props, attrs),
-            )
+        assets = self._archivist.list(
+            self._label,
+            ASSETS_LABEL,
+            page_size=page_size,
+            params=self.__params(props, attrs),
+            cursor=cursor,
         )
+        if fields is not None:
+            return map(_Projection(fields), assets)
+
+        return (Asset(a) for a in assets)
 
     def read_by_signature(
         self,
@@ -357,7 +501,7 @@ class _AssetsRestricted(_AssetsPublic):
         """
         assets_label = f"public{ASSETS_LABEL}" if self._public else ASSETS_LABEL
         return Asset(
-            **self._archivist.get_by_signature(
+            self._archivist.get_by_signature(
                 self._label,
                 assets_label,
                 params=self.__params(props, attrs),
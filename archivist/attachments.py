@@ -25,7 +25,6 @@
 # pylint:disable=too-few-public-methods
 
 
-from copy import deepcopy
 from io import BytesIO
 from logging import getLogger
 from os import path
@@ -41,7 +40,7 @@ from .constants import (
     ATTACHMENTS_LABEL,
     ATTACHMENTS_SUBPATH,
 )
-from .dictmerge import _deepmerge
+from .dictmerge import _merge
 from .utils import get_url
 
 LOGGER = getLogger(__name__)
@@ -174,7 +173,7 @@ class _AttachmentsClient:
 
         LOGGER.debug("Upload Attachment")
         return Attachment(
-            **self._archivist.post_file(
+            self._archivist.post_file(
                 self._label,
                 fd,
                 mtype,
@@ -182,9 +181,9 @@ class _AttachmentsClient:
         )
 
     def __params(self, params: "dict[str, Any]|None") -> "dict[str, Any]":
-        params = deepcopy(params) if params else {}
+        params = {**params} if params else {}
         # pylint: disable=protected-access
-        return _deepmerge(self._archivist.fixtures.get(ATTACHMENTS_LABEL), params)
+        return _merge(self._archivist.fixtures.get(ATTACHMENTS_LABEL), params)
 
     def download(
         self,
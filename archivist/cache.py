@@ -0,0 +1,138 @@
+"""Archivist caches
+
+   Small thread-safe caches used internally by the endpoint clients.
+
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class _LRUCache:
+    """Least recently used cache
+
+    Holds at most maxsize entries. When full the least recently used
+    entry is evicted.
+
+    Args:
+        maxsize (int): maximum number of entries held.
+
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return value for key and mark it as recently used"""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any):
+        """Add or replace value for key, evicting the oldest entry if full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Empty the cache"""
+        with self._lock:
+            self._data.clear()
+
+
+class _TTLCache:
+    """Time to live cache
+
+    Entries expire ttl seconds after they were fetched. Concurrent requests
+    for the same missing key are coalesced so that only one caller fetches the
+    value and the others wait for its result.
+
+    Args:
+        ttl (float): time to live in seconds. A value of zero disables the cache.
+        maxsize (int): maximum number of entries held.
+
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._inflight: "dict[Hashable, Future]" = {}
+        self._generation = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def ttl(self) -> float:
+        """float: time to live in seconds"""
+        return self._ttl
+
+    def get_or_call(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return the cached value for key or the result of func()
+
+        If another thread is already calling func for the same key then
+        wait for and return its result instead.
+        """
+        if self._ttl <= 0:
+            return func()
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > monotonic():
+                return entry[1]
+
+            generation = self._generation
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()  # pyright: ignore
+
+        try:
+            value = func()
+        except BaseException as ex:
+            with self._lock:
+                del self._inflight[key]
+
+            future.set_exception(ex)  # pyright: ignore
+            raise
+
+        with self._lock:
+            del self._inflight[key]
+            # do not store a value fetched before an invalidation
+            if generation == self._generation:
+                self._data[key] = (monotonic() + self._ttl, value)
+                self._data.move_to_end(key)
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+
+        future.set_result(value)  # pyright: ignore
+        return value
+
+    def invalidate(self, predicate: Callable[[Any], bool]):
+        """Discard all entries whose key satisfies predicate"""
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
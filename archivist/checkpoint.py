@@ -0,0 +1,44 @@
+"""Checkpoint files
+
+   Commands record their progress in a checkpoint file so that an interrupted
+   command can resume where it stopped.
+
+"""
+
+from json import dump, load
+from os import fsync, replace
+from typing import Any
+
+
+def save_checkpoint(filename: str, checkpoint: "dict[str, Any]"):
+    """Atomically replace the checkpoint file
+
+    Args:
+        filename (str): name of the checkpoint file.
+        checkpoint (dict): progress to record.
+
+    """
+    tmpname = f"{filename}.tmp"
+    with open(tmpname, "w", encoding="utf-8") as fd:
+        dump(checkpoint, fd, indent=4)
+        fd.flush()
+        fsync(fd.fileno())
+
+    replace(tmpname, filename)
+
+
+def load_checkpoint(filename: str) -> "dict[str, Any]":
+    """Read the checkpoint file
+
+    Args:
+        filename (str): name of the checkpoint file.
+
+    Returns:
+        the recorded progress or an empty dict if there is no checkpoint file.
+
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as fd:
+            return load(fd)
+    except FileNotFoundError:
+        return {}
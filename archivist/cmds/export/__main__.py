@@ -0,0 +1,8 @@
+# pylint:  disable=missing-docstring
+
+
+from .main import main
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    main()
@@ -0,0 +1,59 @@
+# pylint:  disable=missing-docstring
+
+from logging import getLogger
+from sys import exit as sys_exit
+from sys import stdout as sys_stdout
+
+from ...parser import common_parser, endpoint
+from .run import COLLECTIONS, PAGE_SIZE, run
+
+LOGGER = getLogger(__name__)
+
+
+def main():
+    parser = common_parser("Exports assets and events as NDJSON files")
+
+    parser.add_argument(
+        "directory",
+        help="the directory in which the NDJSON files and checkpoint are written",
+    )
+    parser.add_argument(
+        "-c",
+        "--collection",
+        dest="collections",
+        action="append",
+        choices=COLLECTIONS,
+        default=None,
+        help="collection to export (may be repeated). Default is all collections",
+    )
+    parser.add_argument(
+        "-z",
+        "--gzip",
+        dest="gzip",
+        action="store_true",
+        default=False,
+        help="compress the NDJSON files",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        dest="page_size",
+        action="store",
+        default=PAGE_SIZE,
+        help="number of entities requested per page",
+    )
+    parser.add_argument(
+        "--restart",
+        dest="restart",
+        action="store_true",
+        default=False,
+        help="ignore any checkpoint and export from the start",
+    )
+    args = parser.parse_args()
+
+    arch = endpoint(args)
+
+    run(arch, args)
+
+    parser.print_help(sys_stdout)
+    sys_exit(1)
@@ -0,0 +1,114 @@
+# pylint:  disable=missing-docstring
+
+from gzip import compress
+from json import dumps
+from logging import getLogger
+from os import fsync, makedirs, path
+from sys import exit as sys_exit
+from typing import Any
+
+from ... import about
+
+# pylint:disable=cyclic-import      # but pylint doesn't understand this feature
+from ... import archivist as type_helper  # pylint:disable=unused-import
+from ...checkpoint import load_checkpoint, save_checkpoint
+from ...constants import ASSETS_LABEL, ASSETS_SUBPATH, ASSETS_WILDCARD, EVENTS_LABEL
+from ...cursor import ListCursor
+from ...dictmerge import _merge
+
+LOGGER = getLogger(__name__)
+
+CHECKPOINT = "checkpoint.json"
+COLLECTIONS = (ASSETS_LABEL, EVENTS_LABEL)
+PAGE_SIZE = 500
+
+
+def export(
+    arch: "type_helper.Archivist",
+    collection: str,
+    args,
+    checkpoint: "dict[str, Any]",
+    checkpoint_filename: str,
+):
+    """Export one collection as NDJSON
+
+    Each page is appended to the file (as a separate gzip member if compressed)
+    and the checkpoint then records the file size and the list cursor.
+    After a crash the file is truncated to the recorded size and the export
+    resumes from the recorded cursor.
+    """
+    filename = path.join(
+        args.directory, f"{collection}.ndjson{'.gz' if args.gzip else ''}"
+    )
+    state = checkpoint.get(collection, {})
+    cursor = ListCursor(state.get("cursor"))
+    if cursor.done:
+        LOGGER.info("%s already exported to %s", collection, state["filename"])
+        return
+
+    if state and state["filename"] != filename:
+        LOGGER.error(
+            "%s was being exported to %s - use --restart", collection, state["filename"]
+        )
+        sys_exit(1)
+
+    offset = state.get("offset", 0)
+    if cursor.count:
+        LOGGER.info("Resume %s after %d records", collection, cursor.count)
+
+    if collection == ASSETS_LABEL:
+        url = f"{arch.root}/{ASSETS_SUBPATH}/{ASSETS_LABEL}"
+    else:
+        url = f"{arch.root}/{ASSETS_SUBPATH}/{ASSETS_WILDCARD}/{EVENTS_LABEL}"
+
+    def save(fd, lines):
+        if lines:
+            data = "".join(lines).encode("utf-8")
+            fd.write(compress(data, mtime=0) if args.gzip else data)
+            fd.flush()
+            fsync(fd.fileno())
+
+        checkpoint[collection] = {
+            "filename": filename,
+            "offset": fd.tell(),
+            "cursor": cursor,
+        }
+        save_checkpoint(checkpoint_filename, checkpoint)
+        LOGGER.info("Exported %d %s", cursor.count, collection)
+
+    with open(filename, "r+b" if offset else "wb") as fd:
+        # discard anything written after the last checkpoint
+        fd.truncate(offset)
+        fd.seek(offset)
+        lines = []
+        saved = False
+        for record in arch.list(
+            url,
+            collection,
+            page_size=args.page_size,
+            params=_merge(arch.fixtures.get(collection)),
+            cursor=cursor,
+        ):
+            lines.append(f"{dumps(record, separators=(',', ':'))}\n")
+            # the cursor offset is zero after the last record of each page
+            if cursor.offset == 0:
+                save(fd, lines)
+                lines = []
+                saved = cursor.done
+
+        # no records or an empty final page
+        if not saved:
+            save(fd, lines)
+
+
+def run(arch: "type_helper.Archivist", args):
+    LOGGER.info("Using version %s of datatrails-archivist", about.__version__)
+
+    makedirs(args.directory, exist_ok=True)
+    checkpoint_filename = path.join(args.directory, CHECKPOINT)
+    checkpoint = {} if args.restart else load_checkpoint(checkpoint_filename)
+
+    for collection in args.collections or COLLECTIONS:
+        export(arch, collection, args, checkpoint, checkpoint_filename)
+
+    sys_exit(0)
@@ -5,6 +5,7 @@ from sys import exit as sys_exit
 from sys import stdout as sys_stdout
 
 from ...parser import common_parser, endpoint
+from ...runner import CHECKPOINT_INTERVAL
 from .run import run
 
 LOGGER = getLogger(__name__)
@@ -16,7 +17,71 @@ def main():
     parser.add_argument(
         "yamlfile", help="the yaml file describing the operations to conduct"
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        dest="workers",
+        action="store",
+        default=1,
+        help=(
+            "maximum number of steps run concurrently. Steps that use or set "
+            "the same label are run in order"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        dest="profile",
+        action="store",
+        default=None,
+        help=(
+            "FILE to which the cost of each step is written as JSON. A summary "
+            "is also logged"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        dest="checkpoint",
+        action="store",
+        default=None,
+        help="FILE in which the completed steps and labels are recorded",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        dest="checkpoint_interval",
+        action="store",
+        default=CHECKPOINT_INTERVAL,
+        help=(
+            "minimum SECONDS between writes of the checkpoint FILE after steps "
+            "that change nothing e.g. counts. 0 writes it after every step"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        dest="resume",
+        action="store_true",
+        default=False,
+        help="skip the steps completed in the checkpoint FILE",
+    )
+    parser.add_argument(
+        "--stream",
+        dest="stream",
+        action="store_true",
+        default=False,
+        help=(
+            "read each step as it is run instead of reading the whole yaml file "
+            "first. Cannot be used with --workers greater than 1"
+        ),
+    )
     args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume requires --checkpoint")
+
+    if args.stream and args.workers > 1:
+        parser.error("--stream cannot be used with --workers greater than 1")
 
     arch = endpoint(args)
 
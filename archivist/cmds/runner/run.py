@@ -10,6 +10,8 @@ from pyaml_env import parse_config
 
 # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
 from ... import about
+from ...profiler import Profiler
+from ...story import iter_steps
 
 if TYPE_CHECKING:
     from ...archivist import Archivist
@@ -26,7 +28,23 @@ def run(arch: "Archivist", args):
     if args.namespace:
         environ["DATATRAILS_UNIQUE_ID"] = args.namespace
 
+    profiler = arch.profiler = Profiler() if args.profile else None
+
     with open(args.yamlfile, "r", encoding="utf-8") as yml:
-        arch.runner(parse_config(data=yml))
+        arch.runner(
+            {"steps": iter_steps(yml)} if args.stream else parse_config(data=yml),
+            max_workers=args.workers,
+            checkpoint=args.checkpoint,
+            checkpoint_interval=args.checkpoint_interval,
+            resume=args.resume,
+        )
+
+    if profiler is not None:
+        profiler.write(args.profile)
+        LOGGER.info(
+            "Profile written to %s - most costly steps first:\n%s",
+            args.profile,
+            profiler.summary(),
+        )
 
     sys_exit(0)
@@ -20,6 +20,17 @@ def main():
     parser.add_argument(
         "template", help="the template file describing the operations to conduct"
     )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        dest="profile",
+        action="store",
+        default=None,
+        help=(
+            "FILE to which the cost of each step is written as JSON. A summary "
+            "is also logged"
+        ),
+    )
     args = parser.parse_args()
 
     arch = endpoint(args)
@@ -12,6 +12,7 @@ from ... import about
 
 # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
 from ... import archivist as type_helper  # pylint:disable=unused-import
+from ...profiler import Profiler
 
 LOGGER = getLogger(__name__)
 
@@ -33,6 +34,8 @@ def run(arch: "type_helper.Archivist", args):
     if args.namespace:
         environ["DATATRAILS_UNIQUE_ID"] = args.namespace
 
+    profiler = arch.profiler = Profiler() if args.profile else None
+
     # environment is injected into the template
     with open(args.values, "r", encoding="utf-8") as fd:
         arch.runner(
@@ -48,4 +51,12 @@ def run(arch: "type_helper.Archivist", args):
             ),
         )
 
+    if profiler is not None:
+        profiler.write(args.profile)
+        LOGGER.info(
+            "Profile written to %s - most costly steps first:\n%s",
+            args.profile,
+            profiler.summary(),
+        )
+
     sys_exit(0)
@@ -0,0 +1,174 @@
+"""Archivist columns
+
+   Converts the records returned by a list with a fields projection into
+   typed columns suitable for vectorised processing.
+
+   For example:
+
+   .. code-block:: python
+
+      columns = to_columns(
+          arch.events.list(
+              fields=(
+                  "identity",
+                  "timestamp_committed",
+                  "event_attributes.arc_display_type",
+              ),
+          ),
+      )
+      committed = columns["timestamp_committed"]
+
+   Each column is typed by its values:
+
+      * timestamps (fields named timestamp_*) - epoch microseconds (0 if missing)
+      * booleans, integers and floats - numeric arrays
+      * strings with repeated values - :class:`DictionaryColumn`
+      * anything else - list
+
+   Numeric arrays are stdlib arrays or, if NumPy is installed, NumPy arrays
+   sharing the same memory.
+
+"""
+
+from array import array
+from itertools import islice
+from typing import Any, Generator, Iterable, Sequence
+
+from .constants import COLUMNS_BATCH_SIZE, COLUMNS_TIMESTAMP_PREFIX
+from .timestamp import parse_timestamps
+
+try:
+    import numpy  # pyright: ignore
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _array(typecode: str, values: "Iterable[Any]") -> Any:
+    """Return values as typed array"""
+    column = array(typecode, values)
+    if numpy is None:
+        return column
+
+    return numpy.frombuffer(column, dtype=typecode)  # pragma: no cover
+
+
+class DictionaryColumn:
+    """Dictionary encoded column of strings
+
+    Each distinct string is held once in values and each row holds the
+    index of its value in codes (-1 if missing).
+
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: Any, values: "Sequence[str]"):
+        self.codes = codes
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> "str|None":
+        code: int = self.codes[index]
+        return self.values[code] if code >= 0 else None
+
+    def __iter__(self):
+        values = self.values
+        return (values[c] if c >= 0 else None for c in self.codes)
+
+    def __repr__(self) -> str:
+        return f"DictionaryColumn({len(self.codes)} rows, {len(self.values)} values)"
+
+
+def _strings(values: "list[Any]") -> Any:
+    """Dictionary encode strings if there are repeated values"""
+    distinct = {}
+    codes = [-1 if v is None else distinct.setdefault(v, len(distinct)) for v in values]
+    if len(distinct) > len(values) // 2:
+        return values
+
+    return DictionaryColumn(_array("i", codes), list(distinct))
+
+
+def _column(name: str, values: "list[Any]") -> Any:
+    """Convert list of values into the column for its type"""
+    if name.rsplit("__", 1)[-1].startswith(COLUMNS_TIMESTAMP_PREFIX):
+        return _array("q", parse_timestamps(values))
+
+    types = {type(v) for v in values}
+    if types == {bool}:
+        return _array("b", values)
+
+    if types == {int}:
+        return _array("q", values)
+
+    if types and types <= {int, float}:
+        return _array("d", values)
+
+    if str in types and types <= {str, type(None)}:
+        return _strings(values)
+
+    return values
+
+
+class Columns(dict):
+    """Columns
+
+    Columns object maps field names to columns of equal length.
+
+    """
+
+    @property
+    def rows(self) -> int:
+        """int: number of rows"""
+        return len(next(iter(self.values()))) if self else 0
+
+
+def to_columns(records: "Iterable[tuple]") -> Columns:
+    """Convert records into columns
+
+    Args:
+        records (iterable): named tuples as returned by assets.list or
+            events.list with fields specified.
+
+    Returns:
+        :class:`Columns` instance with a column for each field.
+
+    """
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return Columns()
+
+    names = first._fields  # pyright: ignore
+    values = [[v] for v in first]
+    appends = [v.append for v in values]
+    for record in records:
+        for append, v in zip(appends, record):
+            append(v)
+
+    return Columns((n, _column(n, v)) for n, v in zip(names, values))
+
+
+def to_column_batches(
+    records: "Iterable[tuple]", *, batch_size: int = COLUMNS_BATCH_SIZE
+) -> "Generator[Columns, None, None]":
+    """Convert records into batches of columns
+
+    Args:
+        records (iterable): named tuples as returned by assets.list or
+            events.list with fields specified.
+        batch_size (int): maximum number of rows in each batch.
+
+    Returns:
+        iterable of :class:`Columns` instances.
+
+    """
+    records = iter(records)
+    while True:
+        columns = to_columns(islice(records, batch_size))
+        if not columns:
+            break
+
+        yield columns
@@ -21,8 +21,23 @@
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from logging import getLogger
-from typing import TYPE_CHECKING
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from .confirmation_status import ConfirmationStatus
+from .constants import (
+    ASSETS_LABEL,
+    CONFIRMATION_STATUS,
+    ESTATE_SAMPLE_SIZE,
+    ESTATE_STUCK_AFTER,
+    EVENTS_LABEL,
+    MAX_WORKERS,
+    SEP,
+)
+from .timestamp import parse_timestamps
 
 if TYPE_CHECKING:
     # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
@@ -41,7 +56,6 @@ class _CompositeClient:
     Args:
         archivist (Archivist): :class:`Archivist` instance
 
-    These mthods are not unittested and provided as a convenience.
     """
 
     def __init__(self, archivist_instance: "Archivist"):
@@ -50,17 +64,152 @@ class _CompositeClient:
     def __str__(self) -> str:
         return f"CompositeClient({self._archivist.url})"
 
-    def estate_info(self):
+    def __sample(self, sample_size: int) -> "dict[str, list[tuple]]":
+        """Returns the first page of assets, events and pending events"""
+        samples = {
+            ASSETS_LABEL: lambda: self._archivist.assets.list(
+                page_size=sample_size,
+                fields=("attributes.arc_display_type", "attributes.arc_namespace"),
+            ),
+            EVENTS_LABEL: lambda: self._archivist.events.list(
+                page_size=sample_size,
+                fields=("event_attributes.arc_display_type",),
+            ),
+            "pending": lambda: self._archivist.events.list(
+                page_size=sample_size,
+                props={CONFIRMATION_STATUS: ConfirmationStatus.PENDING.name},
+                fields=("asset_identity", "timestamp_accepted"),
+            ),
+        }
+        with ThreadPoolExecutor(max_workers=len(samples)) as executor:
+            return dict(
+                zip(
+                    samples,
+                    executor.map(
+                        lambda f: list(islice(f(), sample_size)), samples.values()
+                    ),
+                )
+            )
+
+    def estate_info(
+        self,
+        *,
+        display_types: "list[str]|None" = None,
+        namespaces: "list[str]|None" = None,
+        sample_size: int = ESTATE_SAMPLE_SIZE,
+        stuck_after: float = ESTATE_STUCK_AFTER,
+        max_workers: int = MAX_WORKERS,
+    ) -> "dict[str, Any]":
         """
         Evaluate health of the various assets and events in the system
 
+        Counts assets and events in total, by confirmation status and by
+        arc_display_type, and assets by arc_namespace. The counts are made
+        concurrently.
+
+        The display types default to those found in the first sample_size
+        assets (for the asset counts) and events (for the event counts) and the
+        namespaces to those found in the first sample_size assets. The assets
+        of the first sample_size pending events that were accepted more than
+        stuck_after seconds ago are reported as stuck.
+
         The report is emitted using LOGGER.info statements
+
+        Args:
+            display_types (list): optional display types to count.
+            namespaces (list): optional namespaces to count.
+            sample_size (int): number of entities sampled.
+            stuck_after (float): age in seconds of a stuck pending event.
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            dict of assets and events counts and stuck assets e.g.
+            {"assets": {"total": 3, "confirmation_status": {"PENDING": 1, ...},
+            "display_type": {"door": 2, ...}, "namespace": {...}},
+            "events": {...}, "stuck": ["assets/xxxxxxxxxxxxxxxxxxxxxxxxxx", ...]}
         """
-        num_events = self._archivist.events.count()
-        num_assets = self._archivist.assets.count()
+        samples = self.__sample(sample_size)
+        namespaces = _sampled(samples[ASSETS_LABEL], 1, namespaces)
+        assets_filters = _filters(
+            _sampled(samples[ASSETS_LABEL], 0, display_types), namespaces
+        )
+        events_filters = _filters(_sampled(samples[EVENTS_LABEL], 0, display_types), [])
+        workers = max(1, max_workers // 2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assets = executor.submit(
+                self._archivist.assets.count_many, assets_filters, max_workers=workers
+            )
+            events = executor.submit(
+                self._archivist.events.count_many, events_filters, max_workers=workers
+            )
+            info: "dict[str, Any]" = {
+                ASSETS_LABEL: _group(assets.result()),
+                EVENTS_LABEL: _group(events.result()),
+            }
+
+        pending = samples["pending"]
+        info["stuck"] = _stuck(pending, stuck_after)
+
+        for label in (ASSETS_LABEL, EVENTS_LABEL):
+            LOGGER.info("There are %s %s", info[label]["total"], label)
+            for group, counts in info[label].items():
+                if isinstance(counts, dict):
+                    for value, count in counts.items():
+                        LOGGER.info("  %s %s: %s", group, value, count)
 
         LOGGER.info(
-            "There are %s events registered against %s assets in the system",
-            num_events,
-            num_assets,
+            "%d of %d sampled pending events are older than %ss on assets %s",
+            len(info["stuck"]),
+            len(pending),
+            stuck_after,
+            info["stuck"],
         )
+        return info
+
+
+def _sampled(
+    sample: "list[tuple]", index: int, values: "list[str]|None"
+) -> "list[str]":
+    """Values if specified otherwise distinct values of a field of the sample"""
+    if values is not None:
+        return values
+
+    return sorted({r[index] for r in sample if r[index]})
+
+
+def _filters(
+    display_types: "list[str]", namespaces: "list[str]"
+) -> "dict[str, dict[str, Any]]":
+    """Count filters named group/value"""
+    return {
+        "total": {},
+        **{
+            f"{CONFIRMATION_STATUS}{SEP}{s}": {"props": {CONFIRMATION_STATUS: s}}
+            for s in ("PENDING", "STORED", "CONFIRMED", "FAILED")
+        },
+        **{
+            f"display_type{SEP}{d}": {"attrs": {"arc_display_type": d}}
+            for d in display_types
+        },
+        **{f"namespace{SEP}{n}": {"attrs": {"arc_namespace": n}} for n in namespaces},
+    }
+
+
+def _stuck(pending: "list[tuple]", stuck_after: float) -> "list[str]":
+    """Assets of pending events accepted more than stuck_after seconds ago"""
+    cutoff = (time() - stuck_after) * 1e6
+    accepted = parse_timestamps(r[1] for r in pending)
+    return sorted({r[0] for r, t in zip(pending, accepted) if r[0] and 0 < t < cutoff})
+
+
+def _group(counts: "dict[str, int]") -> "dict[str, Any]":
+    """Nest counts named group/value under the group"""
+    grouped = {}
+    for name, count in counts.items():
+        group, _, value = name.partition(SEP)
+        if value:
+            grouped.setdefault(group, {})[value] = count
+        else:
+            grouped[group] = count
+
+    return grouped
@@ -0,0 +1,239 @@
+"""Archivist confirmation policy
+
+   How long to wait for confirmation and when to poll.
+
+   Each endpoint client (assets, events and subjects) has a policy that
+   records how long its entities took to confirm. Once enough times have been
+   observed the first poll is made at a percentile (default the median) of the
+   observed times and subsequent polls are spaced according to the spread of
+   the observed times. Polls later than the 90th percentile back off
+   exponentially. Until then the first poll is made at once and polls back off
+   exponentially from 1 second.
+
+   For example:
+
+   .. code-block:: python
+
+      asset = arch.assets.wait_for_confirmation(identity)
+
+      # latency percentiles in seconds
+      print(arch.assets.confirmation_policy.percentiles(50, 90, 99))
+
+      # wait for longer than usual
+      asset = arch.assets.wait_for_confirmation(
+          identity,
+          policy=arch.assets.confirmation_policy.copy(max_time=900),
+      )
+
+"""
+
+from collections import deque
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Callable, Generator
+
+import backoff
+
+from .constants import (
+    CONFIRMATION_MAX_INTERVAL,
+    CONFIRMATION_MAX_TIME,
+    CONFIRMATION_MIN_INTERVAL,
+    CONFIRMATION_MIN_SAMPLES,
+    CONFIRMATION_WINDOW,
+)
+from .utils import backoff_handler
+
+# percentile after which polls back off exponentially
+BACKOFF_PERCENTILE = 90.0
+
+
+class ConfirmationPolicy:
+    """ConfirmationPolicy
+
+    Args:
+        max_time (float): maximum time in seconds to wait for confirmation.
+        min_interval (float): minimum time in seconds between polls.
+        max_interval (float): maximum time in seconds between polls.
+        percentile (float): percentile of the observed times at which the first
+            poll is made.
+        min_samples (int): number of observed times needed before polls follow
+            them.
+        window (int): number of most recent observed times retained.
+
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        *,
+        max_time: float = CONFIRMATION_MAX_TIME,
+        min_interval: float = CONFIRMATION_MIN_INTERVAL,
+        max_interval: float = CONFIRMATION_MAX_INTERVAL,
+        percentile: float = 50.0,
+        min_samples: int = CONFIRMATION_MIN_SAMPLES,
+        window: int = CONFIRMATION_WINDOW,
+    ):
+        self.max_time = max_time
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._latencies: "deque[float]" = deque(maxlen=window)
+        self._lock = Lock()
+
+    def __str__(self) -> str:
+        return f"ConfirmationPolicy(max_time={self.max_time})"
+
+    @property
+    def samples(self) -> int:
+        """int: number of observed times to confirm retained"""
+        return len(self._latencies)
+
+    def copy(self, **kwargs) -> "ConfirmationPolicy":
+        """Returns a policy with the same observed times and changed settings
+
+        The copy records its own observed times.
+
+        Args:
+            kwargs: any arguments of :class:`ConfirmationPolicy`
+
+        """
+        settings = {
+            "max_time": self.max_time,
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "percentile": self.percentile,
+            "min_samples": self.min_samples,
+            "window": self._latencies.maxlen,
+            **kwargs,
+        }
+        with self._lock:
+            latencies = list(self._latencies)
+
+        policy = ConfirmationPolicy(**settings)
+        for seconds in latencies:
+            policy.record(seconds)
+
+        return policy
+
+    def record(self, seconds: float):
+        """Record the time taken to confirm an entity
+
+        Args:
+            seconds (float): time in seconds from the start of waiting to
+                confirmation.
+
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def percentiles(self, *percentiles: float) -> "dict[float, float|None]":
+        """Percentiles of the observed times to confirm
+
+        Interpolated linearly between the nearest observed times.
+
+        Args:
+            percentiles (float): percentiles between 0 and 100 e.g. 50, 90, 99
+
+        Returns:
+            dict of time in seconds keyed by percentile. The times are None if
+            nothing has been observed.
+
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        if not latencies:
+            return dict.fromkeys(percentiles)
+
+        return {p: _percentile(latencies, p) for p in percentiles}
+
+    def waits(self) -> "Generator[float, None, None]":
+        """Times in seconds between polls
+
+        The first time is the wait before the first poll - the learned
+        percentile once enough times have been observed otherwise 0. Later
+        times are the waits after each poll.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        interval = self.min_interval
+        elapsed = backoff_after = 0.0
+        if len(latencies) >= max(self.min_samples, 1):
+            first = _percentile(latencies, self.percentile)
+            backoff_after = _percentile(latencies, BACKOFF_PERCENTILE)
+            interval = min(
+                max((backoff_after - first) / 4, self.min_interval), self.max_interval
+            )
+            elapsed = max(first, self.min_interval)
+
+        yield elapsed
+        while True:
+            elapsed += interval
+            yield interval
+            if elapsed >= backoff_after:
+                interval = min(interval * 2, self.max_interval)
+
+    def wait(
+        self,
+        poll: "Callable[..., Any]",
+        *args: Any,
+        on_giveup: "Callable[..., Any]",
+        record: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Call poll until it returns a true value or max_time expires
+
+        The first poll is made after the first of :meth:`waits`. The time to
+        confirm is recorded as the midpoint between the last poll that returned
+        a false value (or the start if the first poll was delayed) and the
+        first that returned a true value. Nothing is recorded if an immediate
+        first poll returned a true value as the time taken is unknown.
+
+        Args:
+            poll (callable): called with args and kwargs.
+            on_giveup (callable): called with the backoff details when
+                max_time expires.
+            record (bool): record the time to confirm.
+
+        Returns:
+            the true value returned by poll.
+
+        """
+        waits = self.waits()
+        first = min(next(waits), self.max_time)
+        start = monotonic()
+        polled = [start] if first > 0 else []
+
+        def timed(*args, **kwargs):
+            polled.append(monotonic())
+            return poll(*args, **kwargs)
+
+        def remaining():
+            yield 0.0  # discarded by the initial send() of backoff
+            yield from waits
+
+        if first > 0:
+            sleep(first)
+
+        result = backoff.on_predicate(
+            remaining,
+            jitter=None,
+            logger=None,  # pyright: ignore
+            max_time=self.max_time - first,
+            on_backoff=backoff_handler,
+            on_giveup=on_giveup,
+        )(timed)(*args, **kwargs)
+        if record and len(polled) > 1:
+            self.record((polled[-2] + polled[-1]) / 2 - start)
+
+        return result
+
+
+def _percentile(latencies: "list[float]", percentile: float) -> float:
+    """Percentile of sorted latencies"""
+    rank = (len(latencies) - 1) * percentile / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(latencies) - 1)
+    return latencies[lower] + (rank - lower) * (latencies[upper] - latencies[lower])
@@ -0,0 +1,262 @@
+"""Archivist background confirmations
+
+   Confirms created entities in the background so that creation is not held
+   up by confirmation.
+
+   The user is not expected to use this class directly. It is an attribute of the
+   :class:`Archivist` class and is used when an asset or event is created with
+   future=True.
+
+   For example:
+
+   .. code-block:: python
+
+      futures = [
+          arch.events.create(asset_id, props, attrs, future=True)
+          for attrs in batch
+      ]
+      # the events are all created - now wait for them to be confirmed
+      events = [f.result() for f in futures]
+
+   Only confirmation is done in the background - each create still posts the
+   entity before returning its future. Closing the :class:`Archivist` fails
+   pending confirmations unless close(wait=True) is used.
+
+   A scheduler thread holds the pending confirmations ordered by the time of
+   their next poll. Each confirmation is polled on a pool of threads when it is
+   due and then rescheduled as its :class:`ConfirmationPolicy` directs, so a
+   few threads can wait for many confirmations.
+
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from heapq import heappop, heappush
+from itertools import count
+from logging import getLogger
+from threading import Condition, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable
+
+from .constants import MAX_WORKERS
+from .errors import ArchivistUnconfirmedError
+
+if TYPE_CHECKING:
+    # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
+    from .archivist import Archivist
+    from .confirmation_policy import ConfirmationPolicy
+
+LOGGER = getLogger(__name__)
+
+
+class _Pending:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """A confirmation that has not completed"""
+
+    def __init__(
+        self,
+        poll: "Callable[[], Any]",
+        identity: str,
+        policy: "ConfirmationPolicy",
+    ):
+        self.poll = poll
+        self.identity = identity
+        self.policy = policy
+        self.future: "Future[Any]" = Future()
+        self.future.set_running_or_notify_cancel()
+        self.waits = policy.waits()
+        self.first = min(next(self.waits), policy.max_time)
+        self.start = self.polled = monotonic()
+        self.polls = 0
+
+
+class _ConfirmationsClient:  # pylint: disable=too-many-instance-attributes
+    """ConfirmationsClient
+
+    Confirms entities in the background. This class is usually accessed as an
+    attribute of the Archivist class.
+
+    Args:
+        archivist (Archivist): :class:`Archivist` instance
+        max_workers (int): maximum number of concurrent polls.
+
+    """
+
+    def __init__(
+        self, archivist_instance: "Archivist", *, max_workers: int = MAX_WORKERS
+    ):
+        self._archivist = archivist_instance
+        self._max_workers = max_workers
+        self._condition = Condition()
+        self._scheduled: "list[tuple[float, int, _Pending]]" = []
+        self._sequence = count()
+        self._pending = 0
+        self._stopped = self._abandoned = False
+        self._executor: "ThreadPoolExecutor|None" = None
+        self._scheduler: "Thread|None" = None
+
+    def __str__(self) -> str:
+        return f"ConfirmationsClient({self._archivist.url})"
+
+    @property
+    def pending(self) -> int:
+        """int: number of confirmations that have not completed"""
+        return self._pending
+
+    def submit(
+        self,
+        poll: "Callable[[], Any]",
+        identity: str,
+        policy: "ConfirmationPolicy",
+    ) -> "Future[Any]":
+        """Confirm in the background
+
+        Args:
+            poll (callable): returns the confirmed entity or None if not yet
+                confirmed. May raise an exception if confirmation failed.
+            identity (str): identity of the entity.
+            policy (ConfirmationPolicy): when to poll. The time to confirm is
+                recorded by the policy.
+
+        Returns:
+            Future that is resolved with the confirmed entity or the exception
+            at which confirmation failed or timed out. The future cannot be
+            cancelled.
+
+        """
+        pending = _Pending(poll, identity, policy)
+        with self._condition:
+            if self._stopped:
+                raise ArchivistUnconfirmedError(
+                    f"cannot confirm {identity} as confirmations are shut down"
+                )
+
+            if self._scheduler is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+                self._scheduler = Thread(target=self.__schedule, daemon=True)
+                self._scheduler.start()
+
+            self._pending += 1
+            self.__push(pending.start + pending.first, pending)
+
+        return pending.future
+
+    def shutdown(self, *, wait: bool = True, timeout: "float|None" = None):
+        """Stop confirming
+
+        Waiting may take up to the max_time of the policies of the pending
+        confirmations.
+
+        Args:
+            wait (bool): if True wait for the pending confirmations to complete
+                otherwise they fail with :class:`ArchivistUnconfirmedError`.
+            timeout (float): maximum time in seconds to wait after which the
+                pending confirmations fail as if wait were False. Polls that
+                are in progress are completed.
+
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            if not wait:
+                self.__abandon()
+
+            while self._pending:
+                if deadline is None or self._abandoned:
+                    self._condition.wait()
+                elif deadline > monotonic():
+                    self._condition.wait(deadline - monotonic())
+                else:
+                    self.__abandon()
+
+            self._stopped = True
+            self._condition.notify_all()
+
+        if self._scheduler is not None:
+            self._scheduler.join()
+
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __abandon(self):
+        """Fail the scheduled confirmations - must hold the condition"""
+        self._abandoned = True
+        for _, _, pending in self._scheduled:
+            self.__fail(pending, "abandoned as confirmations are shut down")
+
+        self._scheduled.clear()
+
+    def __push(self, due: float, pending: _Pending):
+        """Schedule the next poll - must hold the condition"""
+        heappush(self._scheduled, (due, next(self._sequence), pending))
+        self._condition.notify_all()
+
+    def __complete(self, pending: _Pending, result: Any):
+        """Resolve a confirmation - must hold the condition"""
+        if isinstance(result, Exception):
+            pending.future.set_exception(result)
+        else:
+            pending.future.set_result(result)
+
+        self._pending -= 1
+        self._condition.notify_all()
+
+    def __fail(self, pending: _Pending, reason: str):
+        """Fail a confirmation - must hold the condition"""
+        self.__complete(
+            pending,
+            ArchivistUnconfirmedError(f"confirmation for {pending.identity} {reason}"),
+        )
+
+    def __schedule(self):
+        """Submit polls when they are due"""
+        while True:
+            with self._condition:
+                while not self._stopped and (
+                    not self._scheduled or self._scheduled[0][0] > monotonic()
+                ):
+                    timeout = (
+                        self._scheduled[0][0] - monotonic() if self._scheduled else None
+                    )
+                    self._condition.wait(timeout)
+
+                if self._stopped:
+                    return
+
+                _, _, pending = heappop(self._scheduled)
+
+            self._executor.submit(self.__poll, pending)  # pyright: ignore
+
+    def __poll(self, pending: _Pending):
+        """Poll and complete or reschedule the confirmation"""
+        polled = monotonic()
+        try:
+            entity = pending.poll()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            with self._condition:
+                self.__complete(pending, ex)
+
+            return
+
+        now = monotonic()
+        elapsed = now - pending.start
+        with self._condition:
+            if entity:
+                # confirmed between the previous poll (or the start if the
+                # first poll was delayed) and this one
+                if pending.polls > 0 or pending.first > 0:
+                    pending.policy.record((pending.polled + polled) / 2 - pending.start)
+
+                self.__complete(pending, entity)
+                return
+
+            if elapsed >= pending.policy.max_time:
+                self.__fail(pending, f"timed out after {elapsed} seconds")
+                return
+
+            if self._abandoned:
+                self.__fail(pending, "abandoned as confirmations are shut down")
+                return
+
+            pending.polls += 1
+            pending.polled = polled
+            wait = min(next(pending.waits), pending.policy.max_time - elapsed)
+            LOGGER.debug("Poll %s again in %0.1f seconds", pending.identity, wait)
+            self.__push(now + wait, pending)
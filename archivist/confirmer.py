@@ -1,24 +1,31 @@
 """assets confirmer interface
 """
 
-from copy import deepcopy
+from functools import partial
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Union, overload
 
-import backoff
-
 if TYPE_CHECKING:
     # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
+    from collections.abc import Container
+    from concurrent.futures import Future
+
     from .assets import Asset, _AssetsPublic, _AssetsRestricted
+    from .confirmation_policy import ConfirmationPolicy
     from .events import Event, _EventsPublic, _EventsRestricted
 
 
 from .confirmation_status import ConfirmationStatus
 from .constants import CONFIRMATION_STATUS
 from .errors import ArchivistUnconfirmedError
-from .utils import backoff_handler
+from .parallel import _count_many
+from .profiler import _confirming
 
-MAX_TIME = 300
+TOTAL = "total"
+UNCONFIRMED = (
+    ConfirmationStatus.PENDING.name,
+    ConfirmationStatus.STORED.name,
+)
 LOGGER = getLogger(__name__)
 
 # pylint: disable=protected-access
@@ -28,10 +35,6 @@ Managers = Union[PublicManagers, PrivateManagers]
 ReturnTypes = Union["Asset", "Event"]
 
 
-def __lookup_max_time():
-    return MAX_TIME
-
-
 def __on_giveup_confirmation(details):
     identity: str = details["args"][1]
     elapsed: float = details["elapsed"]
@@ -50,6 +53,7 @@ def __on_giveup_confirmation(details):
 def _wait_for_confirmation(
     self: "_AssetsRestricted",
     identity: str,
+    policy: "ConfirmationPolicy",
 ) -> "Asset": ...  # pragma: no cover
 
 
@@ -57,6 +61,7 @@ def _wait_for_confirmation(
 def _wait_for_confirmation(
     self: "_AssetsPublic",
     identity: str,
+    policy: "ConfirmationPolicy",
 ) -> "Asset": ...  # pragma: no cover
 
 
@@ -64,6 +69,7 @@ def _wait_for_confirmation(
 def _wait_for_confirmation(
     self: "_EventsRestricted",
     identity: str,
+    policy: "ConfirmationPolicy",
 ) -> "Event": ...  # pragma: no cover
 
 
@@ -71,20 +77,45 @@ def _wait_for_confirmation(
 def _wait_for_confirmation(
     self: "_EventsPublic",
     identity: str,
+    policy: "ConfirmationPolicy",
 ) -> "Event": ...  # pragma: no cover
 
 
-@backoff.on_predicate(
-    backoff.expo,
-    max_value=30.0,
-    logger=None,  # pyright: ignore
-    max_time=__lookup_max_time,
-    on_backoff=backoff_handler,
-    on_giveup=__on_giveup_confirmation,
-)
-def _wait_for_confirmation(self: Managers, identity: str) -> ReturnTypes:
+def _wait_for_confirmation(
+    self: Managers, identity: str, policy: "ConfirmationPolicy"
+) -> ReturnTypes:
+    """Wait for entity to be confirmed polling as the policy directs"""
+    with _confirming(self._archivist):
+        return policy.wait(
+            __confirmation, self, identity, on_giveup=__on_giveup_confirmation
+        )
+
+
+def _confirm_in_background(
+    self: PrivateManagers,
+    identity: str,
+    policy: "ConfirmationPolicy",
+    *,
+    unconfirmed: "Container[str]|None" = None,
+) -> "Future[Any]":
+    """Returns a future resolved with the entity when it is confirmed
+
+    If unconfirmed is specified the entity is not read while its identity is
+    in unconfirmed.
+    """
+    return self._archivist.confirmations.submit(
+        partial(__confirmation, self, identity, unconfirmed), identity, policy
+    )
+
+
+def __confirmation(
+    self: Managers, identity: str, unconfirmed: "Container[str]|None" = None
+) -> ReturnTypes:
     """Return None until entity is confirmed"""
 
+    if unconfirmed is not None and identity in unconfirmed:
+        return None  # pyright: ignore
+
     entity = self.read(identity)
 
     LOGGER.debug("entity %s", entity)
@@ -109,6 +140,40 @@ def _wait_for_confirmation(self: Managers, identity: str) -> ReturnTypes:
     return None  # pyright: ignore
 
 
+def __status_props(
+    props: "dict[str, Any]|None", status: "str|None" = None
+) -> "dict[str, Any]":
+    """Return props with the confirmation status replaced by status"""
+    newprops = {**props} if props else {}
+    newprops.pop(CONFIRMATION_STATUS, None)
+    if status is not None:
+        newprops[CONFIRMATION_STATUS] = status
+
+    return newprops
+
+
+def _status_counts(
+    self: PrivateManagers,
+    props: "dict[str, Any]|None",
+    *,
+    exists: bool = False,
+    **kwargs: Any,
+) -> "dict[str, int]":
+    """Count entities of each unconfirmed status concurrently
+
+    If exists is True all entities are also counted (keyed TOTAL) in the same
+    round of requests.
+    """
+    # counts are polled for a change so are never cached
+    kwargs["cached"] = False
+    filters = {TOTAL: {"props": __status_props(props), **kwargs}} if exists else {}
+    for status in UNCONFIRMED:
+        filters[status] = {"props": __status_props(props, status), **kwargs}
+
+    LOGGER.debug("Count entities %s", filters)
+    return _count_many(self.count, filters)
+
+
 def __on_giveup_confirmed(details):
     self: PrivateManagers = details["args"][0]
     count = self.pending_count
@@ -118,45 +183,54 @@ def __on_giveup_confirmed(details):
     )
 
 
-@backoff.on_predicate(
-    backoff.expo,
-    max_value=30.0,
-    logger=None,  # pyright: ignore
-    max_time=__lookup_max_time,
-    on_backoff=backoff_handler,
-    on_giveup=__on_giveup_confirmed,
-)
 def _wait_for_confirmed(
     self: PrivateManagers,
+    policy: "ConfirmationPolicy",
     *,
     props: "dict[str, Any]|None" = None,
+    recent: "dict[str, int]|None" = None,
     **kwargs: Any,
 ) -> bool:
-    """Return False until all entities are confirmed"""
-
-    # look for pending entities
-    newprops = deepcopy(props) if props else {}
-    newprops[CONFIRMATION_STATUS] = ConfirmationStatus.PENDING.name
-    LOGGER.debug("Count pending entities %s", newprops)
-    pending_count = self.count(props=newprops, **kwargs)
-
-    # look for stored entities
-    newprops = deepcopy(props) if props else {}
-    newprops[CONFIRMATION_STATUS] = ConfirmationStatus.STORED.name
-    LOGGER.debug("Count stored entities %s", newprops)
-    stored_count = self.count(props=newprops, **kwargs)
-
-    count = pending_count + stored_count
-
-    if count == 0:
-        # did any fail
-        newprops = deepcopy(props) if props else {}
-        newprops[CONFIRMATION_STATUS] = ConfirmationStatus.FAILED.name
-        count = self.count(props=newprops, **kwargs)
-        if count > 0:
-            raise ArchivistUnconfirmedError(f"There are {count} FAILED entities")
-
-        return True
-
-    self.pending_count = count
-    return False
+    """Wait for all entities to be confirmed polling as the policy directs
+
+    Counts in recent (e.g. made with the check that entities exist) are used
+    for the first round. The time taken is not recorded as it is not the time
+    to confirm an entity.
+    """
+
+    def confirmed(manager: PrivateManagers) -> bool:
+        """Return False until all entities are confirmed"""
+        nonlocal recent
+        counts, recent = recent or _status_counts(manager, props, **kwargs), None
+        return __confirmed(manager, counts, props, **kwargs)
+
+    with _confirming(self._archivist):
+        return policy.wait(
+            confirmed, self, on_giveup=__on_giveup_confirmed, record=False
+        )
+
+
+def __confirmed(
+    self: PrivateManagers,
+    counts: "dict[str, int]",
+    props: "dict[str, Any]|None",
+    **kwargs: Any,
+) -> bool:
+    """Return False while counts has unconfirmed entities
+
+    FAILED entities are only counted once no entities are unconfirmed.
+    """
+    count = sum(counts[status] for status in UNCONFIRMED)
+    if count > 0:
+        self.pending_count = count
+        return False
+
+    failed = self.count(
+        props=__status_props(props, ConfirmationStatus.FAILED.name),
+        cached=False,
+        **kwargs,
+    )
+    if failed > 0:
+        raise ArchivistUnconfirmedError(f"There are {failed} FAILED entities")
+
+    return True
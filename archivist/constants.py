@@ -28,10 +28,41 @@ HEADERS_REQUEST_TOTAL_COUNT = "X-Request-Total-Count"
 HEADERS_TOTAL_COUNT = "X-Total-Count"
 HEADERS_RETRY_AFTER = "Archivist-Rate-Limit-Reset"
 
+# maximum number of distinct count() results held when count_ttl is set
+COUNT_CACHE_SIZE = 1024
+
+# maximum number of encoded query strings held
+QUERY_CACHE_SIZE = 128
+
 PROOF_MECHANISM = "proof_mechanism"
 
 CONFIRMATION_STATUS = "confirmation_status"
 
+# maximum time in seconds to wait for confirmation and the bounds of the
+# interval between polls
+CONFIRMATION_MAX_TIME = 300.0
+CONFIRMATION_MIN_INTERVAL = 1.0
+CONFIRMATION_MAX_INTERVAL = 30.0
+# observed times to confirm that are retained and the number needed before
+# polling follows them
+CONFIRMATION_WINDOW = 100
+CONFIRMATION_MIN_SAMPLES = 5
+
+# maximum number of concurrent requests issued by methods that fan out
+MAX_WORKERS = 8
+# retries of a failed shard of a parallel listing and delay before the first retry
+PARALLEL_RETRIES = 3
+PARALLEL_RETRY_DELAY = 1.0
+
+# number of assets and events sampled by estate_info and the age in seconds
+# of a pending event that is considered stuck
+ESTATE_SAMPLE_SIZE = 500
+ESTATE_STUCK_AFTER = 300
+
+# columns whose name starts with this are converted to epoch microseconds
+COLUMNS_TIMESTAMP_PREFIX = "timestamp_"
+COLUMNS_BATCH_SIZE = 10000
+
 APPIDP_SUBPATH = "iam/v1"
 APPIDP_LABEL = "appidp"
 APPIDP_TOKEN = "token"
@@ -69,3 +100,16 @@ TENANCIES_LABEL = "tenancies"
 # values of tenant identity in response from other endpoints is 'tenant'
 # and not 'tenancies'.
 TENANCIES_PREFIX = "tenant"
+TENANCIES_IDENTITY = "tenant_identity"
+TENANCIES_CACHE_SIZE = 256
+TENANCIES_BATCH_SIZE = 100
+
+# local mirror of assets and events
+MIRROR_PAGE_SIZE = 500
+# events list filter selecting events committed at or after a timestamp
+MIRROR_COMMITTED_SINCE = "timestamp_committed_since"
+
+# created entities queued between the create and confirm stages of a pipeline
+# and the number being confirmed at once
+PIPELINE_QUEUE_SIZE = 100
+PIPELINE_CONFIRM_LIMIT = 1000
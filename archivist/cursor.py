@@ -0,0 +1,65 @@
+"""Archivist list cursor
+
+   Position of a list iteration so that an interrupted listing can be resumed.
+
+   For example:
+
+   .. code-block:: python
+
+      cursor = ListCursor()
+      for event in arch.events.list(cursor=cursor):
+          process(event)
+          save(json.dumps(cursor))
+
+      # after a crash
+      cursor = ListCursor(json.loads(load()))
+      for event in arch.events.list(cursor=cursor):
+          ...
+
+   The cursor is updated as each entity is listed. As the cursor is a dictionary
+   it can be serialised as JSON. A listing resumed from a cursor continues with
+   the entity after the last one listed. Resumed listings ignore the filters
+   as the page token encodes the filters of the original listing.
+
+"""
+
+
+class ListCursor(dict):
+    """ListCursor
+
+    Dictionary with keys:
+
+        * page_token - token of the current page (None for the first page)
+        * offset - number of entities of the current page already listed
+        * count - total number of entities listed
+        * done - True when the listing has completed
+
+    Args:
+        state (dict): optional state of a previous cursor e.g. from json.loads()
+
+    """
+
+    def __init__(self, state: "dict|None" = None):
+        super().__init__(page_token=None, offset=0, count=0, done=False)
+        if state:
+            self.update(state)
+
+    @property
+    def page_token(self) -> "str|None":
+        """str: token of the current page"""
+        return self["page_token"]
+
+    @property
+    def offset(self) -> int:
+        """int: number of entities of the current page already listed"""
+        return self["offset"]
+
+    @property
+    def count(self) -> int:
+        """int: total number of entities listed"""
+        return self["count"]
+
+    @property
+    def done(self) -> bool:
+        """bool: True when the listing has completed"""
+        return self["done"]
@@ -2,10 +2,18 @@
 """
 
 from copy import deepcopy
-from typing import Any
+from typing import Any, Generator
+from urllib.parse import quote_plus
 
 from flatten_dict import flatten, unflatten
 
+from .cache import _LRUCache
+from .constants import QUERY_CACHE_SIZE
+from .errors import ArchivistBadFieldError
+
+# filters are usually identical between pages and repeated polls
+_QUERY_CACHE = _LRUCache(QUERY_CACHE_SIZE)
+
 
 def _deepmerge(
     dct1: "dict[str, Any]|None", dct2: "dict[str, Any]|None"
@@ -25,8 +33,84 @@ def _deepmerge(
     return unflatten({**flatten(dct1), **flatten(dct2)})
 
 
-def _dotdict(dct: "dict[str, Any]|None") -> "dict[str, str] | None":
-    """Emit nested dictionary as dot delimited dict with one level"""
-    if dct is None:
+def _merge(*dcts: "dict[str, Any]|None") -> "dict[str, Any]":
+    """Deep merge dictionaries without flattening
+
+    Later dictionaries overwrite or add to earlier ones. Nested dictionaries
+    are always copied so the result can be modified without affecting the
+    arguments. Empty nested dictionaries are dropped as in _deepmerge.
+
+    Used on the request hot path where the fixtures are merged with the
+    params of every call.
+    """
+    result = {}
+    for dct in dcts:
+        if not dct:
+            continue
+
+        for k, v in dct.items():
+            if isinstance(v, dict):
+                old = result.get(k)
+                v = _merge(old, v) if isinstance(old, dict) else _merge(v)
+                if not v:
+                    continue
+
+            result[k] = v
+
+    return result
+
+
+def __query_items(
+    dct: "dict[str, Any]", prefix: str
+) -> "Generator[tuple[str, Any], None, None]":
+    """Emit dot delimited key and value pairs
+
+    Lists emit one pair per element. Dictionaries in lists (as in and_list)
+    cannot be expressed as a query string without changing their meaning and
+    are rejected.
+    """
+    for k, v in dct.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            yield from __query_items(v, f"{key}.")
+            continue
+
+        if isinstance(v, (list, tuple)):
+            for e in v:
+                if isinstance(e, dict):
+                    raise ArchivistBadFieldError(
+                        f"{key}: dictionaries in lists are not supported in queries"
+                    )
+
+                yield key, e
+
+            continue
+
+        yield key, v
+
+
+def _querystring(dct: "dict[str, Any]|None") -> "str | None":
+    """Emit nested dictionary as url encoded query string
+
+    The encoding is the same as that done by requests for the dot delimited
+    flattened dictionary. None values are omitted. Results are cached by the
+    repr of dct, which is cheap to compute and distinguishes values that
+    compare equal but encode differently (True, 1 and 1.0).
+
+    Raises:
+        ArchivistBadFieldError: if a list contains dictionaries.
+    """
+    if not dct:
         return None
-    return flatten(dct, reducer="dot")
+
+    key = repr(dct)
+    query = _QUERY_CACHE.get(key)
+    if query is None:
+        query = "&".join(
+            f"{quote_plus(k)}={quote_plus(str(v))}"
+            for k, v in __query_items(dct, "")
+            if v is not None
+        )
+        _QUERY_CACHE.set(key, query)
+
+    return query or None
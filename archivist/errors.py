@@ -6,6 +6,7 @@
 
 import json
 from logging import getLogger
+from typing import Any
 
 from requests import Response
 
@@ -83,6 +84,18 @@ class Archivist5xxError(ArchivistError):
     """Any other 5xx error"""
 
 
+class ArchivistShardError(ArchivistError):
+    """One or more shards of a parallel operation failed
+
+    The failed attribute is a list of tuples of shard and exception so that
+    only the failed shards need be repeated.
+    """
+
+    def __init__(self, failed: "list[tuple[Any, Exception]]", *args):
+        self.failed = failed
+        super().__init__(*args)
+
+
 def __identity(response: Response) -> str:
     identity = "unknown"
     if response.request:
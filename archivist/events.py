@@ -22,25 +22,36 @@
 
 """
 
-from copy import deepcopy
+from asyncio import to_thread
 from logging import getLogger
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
 from . import confirmer
+from .confirmation_policy import ConfirmationPolicy
 from .constants import (
     ASSETS_SUBPATH,
     ASSETS_WILDCARD,
-    CONFIRMATION_STATUS,
     EVENTS_LABEL,
+    MAX_WORKERS,
+    PARALLEL_RETRIES,
     SBOM_RELEASE,
 )
-from .dictmerge import _deepmerge
-from .errors import ArchivistBadFieldError, ArchivistNotFoundError
+from .dictmerge import _merge
+from .errors import (
+    ArchivistBadFieldError,
+    ArchivistInvalidOperationError,
+    ArchivistNotFoundError,
+)
+from .parallel import _count_many, _parallel_pages
+from .projection import _Projection
 from .sboms import sboms_parse
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from .archivist import Archivist
+    from .cursor import ListCursor  # pylint:disable=unused-import
 
 LOGGER = getLogger(__name__)
 
@@ -141,7 +152,7 @@ class _EventsPublic:
             :class:`Event` instance
 
         """
-        return Event(**self._archivist.get(f"{self._identity(identity)}"))
+        return Event(self._archivist.get(f"{self._identity(identity)}"))
 
     def _params(
         self,
@@ -149,13 +160,13 @@ class _EventsPublic:
         attrs: "dict[str, Any]|None",
         asset_attrs: "dict[str, Any]|None",
     ) -> "dict[str, Any]":
-        params = deepcopy(props) if props else {}
+        params = {**props} if props else {}
         if attrs:
             params["event_attributes"] = attrs
         if asset_attrs:
             params["asset_attributes"] = asset_attrs
 
-        return _deepmerge(self._archivist.fixtures.get(EVENTS_LABEL), params)
+        return _merge(self._archivist.fixtures.get(EVENTS_LABEL), params)
 
     def count(
         self,
@@ -164,6 +175,7 @@ class _EventsPublic:
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
         asset_attrs: "dict[str, Any]|None" = None,
+        cached: bool = True,
     ) -> int:
         """Count events.
 
@@ -174,6 +186,7 @@ class _EventsPublic:
             props (dict): optional properties e.g. {"confirmation_status": "CONFIRMED" }
             attrs (dict): optional attributes e.g. {"arc_display_type": "open" }
             asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
+            cached (bool): if False the count is not read from the count cache.
 
         Returns:
             integer count of assets.
@@ -195,9 +208,33 @@ class _EventsPublic:
         return self._archivist.count(
             f"{self._identity(asset_id)}/{EVENTS_LABEL}",  # pyright: ignore
             params=self._params(props, attrs, asset_attrs),
+            cached=cached,
         )
 
-    def list(
+    def count_many(
+        self,
+        filters: "dict[str, dict[str, Any]]",
+        *,
+        max_workers: int = MAX_WORKERS,
+    ) -> "dict[str, int]":
+        """Count events for many filters.
+
+        Counts number of events that match each of the named filters. The
+        counts are made concurrently.
+
+        Args:
+            filters (dict): arguments of :meth:`count` keyed by name e.g.
+                {"pending": {"props": {"confirmation_status": "PENDING"}},
+                "door": {"asset_id": "assets/xxxxxxxxxxxxxxxxxxxxxxxxxx"}}
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            dict of integer count of events keyed by name.
+
+        """
+        return _count_many(self.count, filters, max_workers=max_workers)
+
+    def list(  # pylint: disable=too-many-arguments
         self,
         *,
         asset_id: "str|None" = None,
@@ -205,6 +242,8 @@ class _EventsPublic:
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
         asset_attrs: "dict[str, Any]|None" = None,
+        fields: "tuple[str, ...]|None" = None,
+        cursor: "ListCursor|None" = None,
     ):
         """List events.
 
@@ -216,9 +255,14 @@ class _EventsPublic:
             attrs (dict): e.g. {"arc_display_type": "open" }
             asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
             page_size (int): optional page size. (Rarely used).
+            fields (tuple): optional dot delimited fields to return
+                e.g. ("identity", "event_attributes.arc_display_type")
+            cursor (ListCursor): optional cursor that records the progress of the
+                listing and from which an interrupted listing may be resumed.
 
         Returns:
-            iterable that returns :class:`Event` instances
+            iterable that returns :class:`Event` instances or, if fields is
+            specified, named tuples of the fields.
 
         """
         # wildcarding not allowed when public - asset_id is required (not optional)
@@ -226,15 +270,17 @@ class _EventsPublic:
         if not self._public:
             asset_id = asset_id or ASSETS_WILDCARD
 
-        return (
-            Event(**a)
-            for a in self._archivist.list(
-                f"{self._identity(asset_id)}/{EVENTS_LABEL}",  # pyright: ignore
-                EVENTS_LABEL,
-                page_size=page_size,
-                params=self._params(props, attrs, asset_attrs),
-            )
+        events = self._archivist.list(
+            f"{self._identity(asset_id)}/{EVENTS_LABEL}",  # pyright: ignore
+            EVENTS_LABEL,
+            page_size=page_size,
+            params=self._params(props, attrs, asset_attrs),
+            cursor=cursor,
         )
+        if fields is not None:
+            return map(_Projection(fields), events)
+
+        return (Event(a) for a in events)
 
     def read_by_signature(
         self,
@@ -264,7 +310,7 @@ class _EventsPublic:
             asset_id = asset_id or ASSETS_WILDCARD
 
         return Event(
-            **self._archivist.get_by_signature(
+            self._archivist.get_by_signature(
                 f"{self._identity(asset_id)}/{EVENTS_LABEL}",  # pyright: ignore
                 EVENTS_LABEL,
                 params=self._params(props, attrs, asset_attrs),
@@ -286,10 +332,14 @@ class _EventsRestricted(_EventsPublic):
     def __init__(self, archivist_instance: "Archivist"):
         super().__init__(archivist_instance)
         self.pending_count: int = 0
+        self.confirmation_policy = ConfirmationPolicy(
+            max_time=archivist_instance.max_time
+        )
 
     def __str__(self) -> str:
         return f"EventsRestricted({self._archivist.url})"
 
+    @overload
     def create(
         self,
         asset_id: str,
@@ -298,7 +348,31 @@ class _EventsRestricted(_EventsPublic):
         *,
         asset_attrs: "dict[str, Any]|None" = None,
         confirm: bool = False,
-    ) -> Event:
+        future: "Literal[False]" = False,
+    ) -> Event: ...  # pragma: no cover
+
+    @overload
+    def create(
+        self,
+        asset_id: str,
+        props: "dict[str, Any]",
+        attrs: "dict[str, Any]",
+        *,
+        asset_attrs: "dict[str, Any]|None" = None,
+        confirm: bool = False,
+        future: "Literal[True]",
+    ) -> "Future[Event]": ...  # pragma: no cover
+
+    def create(  # pylint: disable=too-many-arguments
+        self,
+        asset_id: str,
+        props: "dict[str, Any]",
+        attrs: "dict[str, Any]",
+        *,
+        asset_attrs: "dict[str, Any]|None" = None,
+        confirm: bool = False,
+        future: bool = False,
+    ) -> "Event|Future[Event]":
         """Create event
 
         Creates event for given asset.
@@ -309,9 +383,12 @@ class _EventsRestricted(_EventsPublic):
             attrs (dict): attributes of created event.
             asset_attrs (dict): attributes of referenced asset.
             confirm (bool): if True wait for event to be confirmed.
+            future (bool): if True return a Future that is resolved with the
+                event when it is confirmed. The event is still created before
+                returning - only the confirmation is done in the background.
 
         Returns:
-            :class:`Event` instance
+            :class:`Event` instance or Future
 
         """
 
@@ -320,11 +397,37 @@ class _EventsRestricted(_EventsPublic):
             asset_id,
             self._params(props, attrs, asset_attrs),
             confirm=confirm,
+            future=future,
         )
 
+    @overload
     def create_from_data(
-        self, asset_id: str, data: "dict[str, Any]", *, confirm: bool = False
-    ) -> Event:
+        self,
+        asset_id: str,
+        data: "dict[str, Any]",
+        *,
+        confirm: bool = False,
+        future: "Literal[False]" = False,
+    ) -> Event: ...  # pragma: no cover
+
+    @overload
+    def create_from_data(
+        self,
+        asset_id: str,
+        data: "dict[str, Any]",
+        *,
+        confirm: bool = False,
+        future: "Literal[True]",
+    ) -> "Future[Event]": ...  # pragma: no cover
+
+    def create_from_data(
+        self,
+        asset_id: str,
+        data: "dict[str, Any]",
+        *,
+        confirm: bool = False,
+        future: bool = False,
+    ) -> "Event|Future[Event]":
         """Create event
 
         Creates event for given asset from data.
@@ -334,16 +437,21 @@ class _EventsRestricted(_EventsPublic):
             asset_id (str): asset identity e.g. assets/xxxxxxxxxxxxxxxxxxxxxxxxxx
             data (dict): request body of event.
             confirm (bool): if True wait for event to be confirmed.
+            future (bool): if True return a Future that is resolved with the
+                event when it is confirmed. The event is still created before
+                returning - only the confirmation is done in the background.
 
         Returns:
-            :class:`Event` instance
+            :class:`Event` instance or Future
 
         """
-        data = deepcopy(data)
-
+        # data is never modified - only the top level and the event attributes
+        # are copied if there are attachments.
         event_attributes = data["event_attributes"]
-        attachments = data.pop("attachments", None)
+        attachments = data.get("attachments")
         if attachments is not None:
+            data = {k: v for k, v in data.items() if k != "attachments"}
+            event_attributes = data["event_attributes"] = {**event_attributes}
             for a in attachments:
                 result = self._archivist.attachments.create(a)
                 if a.get("type") == SBOM_RELEASE:
@@ -359,32 +467,146 @@ class _EventsRestricted(_EventsPublic):
                     attachment_key = self._archivist.attachments.get_default_key(a)
                 event_attributes[attachment_key] = result
 
-        data["event_attributes"] = event_attributes
-
         event = Event(
-            **self._archivist.post(f"{self._subpath}/{asset_id}/{EVENTS_LABEL}", data)
+            self._archivist.post(f"{self._subpath}/{asset_id}/{EVENTS_LABEL}", data)
         )
+        self._archivist.count_invalidate(f"/{EVENTS_LABEL}")
+        event_id: str = event["identity"]
+        if future:
+            # pylint: disable=protected-access
+            return confirmer._confirm_in_background(
+                self, event_id, self.confirmation_policy
+            )
+
         if not confirm:
             return event
 
-        event_id: str = event["identity"]
         return self.wait_for_confirmation(event_id)
 
-    def wait_for_confirmation(self, identity: str) -> Event:
+    def list_parallel(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        asset_ids: "list[str]|None" = None,
+        shards: "list[dict[str, Any]]|None" = None,
+        page_size: "int|None" = None,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        asset_attrs: "dict[str, Any]|None" = None,
+        fields: "tuple[str, ...]|None" = None,
+        ordered: bool = False,
+        max_workers: int = MAX_WORKERS,
+        retries: int = PARALLEL_RETRIES,
+    ):
+        """List events in parallel.
+
+        Lists events that match criteria by listing shards concurrently. A shard
+        is either the events of one asset or the events that match one
+        additional filter. If neither asset_ids nor shards is specified all assets
+        are listed and each asset is a shard.
+
+        Shards that fail with a transient error are retried from the failed page.
+        Shards that still fail are reported by an :class:`ArchivistShardError`
+        after all other shards have been listed. The events of a failed shard may
+        have been partially listed.
+
+        Args:
+            asset_ids (list): optional asset identities e.g. assets/xxxxxxxxxxxxxxxxxxxxxxxxxx
+            shards (list): optional additional filters each merged with props e.g.
+                [{"event_attributes": {"arc_display_type": "open"}}, ...]
+            props (dict): e.g. {"tracked": "TRACKED" }
+            attrs (dict): e.g. {"arc_display_type": "open" }
+            asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
+            page_size (int): optional page size. (Rarely used).
+            fields (tuple): optional dot delimited fields to return
+                e.g. ("identity", "event_attributes.arc_display_type")
+            ordered (bool): list the events of each shard in the order of the shards.
+                Otherwise events are listed as they arrive.
+            max_workers (int): maximum number of concurrent requests.
+            retries (int): number of times a shard is retried.
+
+        Returns:
+            iterable that returns :class:`Event` instances or, if fields is
+            specified, named tuples of the fields.
+
+        Raises:
+            ArchivistInvalidOperationError: both asset_ids and shards specified.
+            ArchivistShardError: one or more shards failed.
+
+        """
+        if asset_ids is not None and shards is not None:
+            raise ArchivistInvalidOperationError(
+                "Specify either asset_ids or shards but not both"
+            )
+
+        params = self._params(props, attrs, asset_attrs)
+        url = f"{self._identity(ASSETS_WILDCARD)}/{EVENTS_LABEL}"
+
+        if shards is not None:
+            targets: "list[Any]" = shards
+
+            def pages(shard, page_token):
+                return self._archivist.list_pages(
+                    url,
+                    EVENTS_LABEL,
+                    page_size=page_size,
+                    params=_merge(params, shard),
+                    page_token=page_token,
+                )
+
+        else:
+            if asset_ids is None:
+                asset_ids = [
+                    a.identity  # pyright: ignore
+                    for a in self._archivist.assets.list(
+                        page_size=page_size, fields=("identity",)
+                    )
+                ]
+
+            targets = asset_ids
+
+            def pages(shard, page_token):
+                return self._archivist.list_pages(
+                    f"{self._identity(shard)}/{EVENTS_LABEL}",
+                    EVENTS_LABEL,
+                    page_size=page_size,
+                    params=_merge(params),
+                    page_token=page_token,
+                )
+
+        projection = _Projection(fields) if fields is not None else Event
+        return (
+            projection(e)
+            for page in _parallel_pages(
+                pages,
+                targets,
+                ordered=ordered,
+                max_workers=max_workers,
+                retries=retries,
+            )
+            for e in page
+        )
+
+    def wait_for_confirmation(
+        self, identity: str, *, policy: "ConfirmationPolicy|None" = None
+    ) -> Event:
         """Wait for event to be confirmed.
 
-        Waits for event to be confirmed.
+        Waits for event to be confirmed. The time taken is recorded by the
+        policy.
 
         Args:
             identity (str): identity of event
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
 
         Returns:
             True if event is confirmed.
 
         """
-        confirmer.MAX_TIME = self._archivist.max_time
         # pylint: disable=protected-access
-        return confirmer._wait_for_confirmation(self, identity)
+        return confirmer._wait_for_confirmation(
+            self, identity, policy or self.confirmation_policy
+        )
 
     def wait_for_confirmed(
         self,
@@ -393,6 +615,7 @@ class _EventsRestricted(_EventsPublic):
         props: "dict[str, Any]|None" = None,
         attrs: "dict[str, Any]|None" = None,
         asset_attrs: "dict[str, Any]|None" = None,
+        policy: "ConfirmationPolicy|None" = None,
     ) -> bool:
         """Wait for events to be confirmed.
 
@@ -403,31 +626,71 @@ class _EventsRestricted(_EventsPublic):
             props (dict): e.g. {"tracked": "TRACKED" }
             attrs (dict): e.g. {"arc_display_type": "open" }
             asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
 
         Returns:
             True if all events are confirmed.
 
         """
         asset_id = asset_id or ASSETS_WILDCARD
-        # check that entities exist
-        newprops = deepcopy(props) if props else {}
-        newprops.pop(CONFIRMATION_STATUS, None)
-
-        LOGGER.debug("Count events %s", newprops)
-        count = self.count(
-            asset_id=asset_id, props=newprops, attrs=attrs, asset_attrs=asset_attrs
+        # check that entities exist with the first round of status counts
+        LOGGER.debug("Count events %s", props)
+        # pylint: disable=protected-access
+        counts = confirmer._status_counts(
+            self,
+            props,
+            exists=True,
+            asset_id=asset_id,
+            attrs=attrs,
+            asset_attrs=asset_attrs,
         )
-        if count == 0:
+        if counts.pop(confirmer.TOTAL) == 0:
             raise ArchivistNotFoundError("No events exist")
 
-        confirmer.MAX_TIME = self._archivist.max_time
-        # pylint: disable=protected-access
         return confirmer._wait_for_confirmed(
             self,
+            policy or self.confirmation_policy,
+            props=props,
+            recent=counts,
+            asset_id=asset_id,
+            attrs=attrs,
+            asset_attrs=asset_attrs,
+        )
+
+    async def wait_for_confirmed_async(
+        self,
+        *,
+        asset_id: "str|None" = None,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        asset_attrs: "dict[str, Any]|None" = None,
+        policy: "ConfirmationPolicy|None" = None,
+    ) -> bool:
+        """Wait for events to be confirmed without blocking the event loop.
+
+        Awaitable variant of :meth:`wait_for_confirmed` that waits in a
+        separate thread.
+
+        Args:
+            asset_id (str): optional asset identity e.g. assets/xxxxxxxxxxxxxxxxxxxxxxxxxx
+            props (dict): e.g. {"tracked": "TRACKED" }
+            attrs (dict): e.g. {"arc_display_type": "open" }
+            asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
+
+        Returns:
+            True if all events are confirmed.
+
+        """
+        return await to_thread(
+            self.wait_for_confirmed,
             asset_id=asset_id,
             props=props,
             attrs=attrs,
             asset_attrs=asset_attrs,
+            policy=policy,
         )
 
     def publicurl(self, identity: str) -> str:
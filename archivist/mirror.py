@@ -0,0 +1,414 @@
+"""Archivist mirror
+
+   Local SQLite copy of assets and events kept up to date by incremental
+   synchronisation.
+
+   For example:
+
+   .. code-block:: python
+
+      with Mirror(arch, "mirror.db") as mirror:
+          mirror.sync()
+          rows = mirror.connection.execute(
+              "SELECT data FROM events WHERE asset_identity = ?",
+              ("assets/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",),
+          )
+
+   The first sync copies all assets and events. Later syncs only list the
+   events committed since the watermark and re-read the assets of those
+   events, as assets only change when an event is recorded against them.
+   The watermark is the oldest mirrored event that is not yet confirmed, or
+   the newest event if all are confirmed, so that unconfirmed events are read
+   again until they are confirmed. Unconfirmed assets and events that had not
+   been committed (no timestamp_committed) are also read again on every sync.
+
+   Tables:
+
+      * assets - identity, display_type, data
+      * events - identity, asset_identity, display_type,
+        timestamp_committed (epoch microseconds), data
+      * sync - collection, watermark, synced_at (start of the last sync),
+        finished_at (end of the last sync), cursor (of an unfinished sync)
+
+   The data column holds the entity as JSON.
+
+   The assets and events attributes answer queries from the mirror using the
+   same methods and filters as the :class:`Archivist` class (see
+   :mod:`archivist.mirrorquery`).
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from logging import getLogger
+from sqlite3 import connect
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .confirmation_status import ConfirmationStatus
+from .constants import (
+    ASSETS_LABEL,
+    EVENTS_LABEL,
+    MAX_WORKERS,
+    MIRROR_COMMITTED_SINCE,
+    MIRROR_PAGE_SIZE,
+)
+from .cursor import ListCursor
+from .mirrorquery import _MirrorAssets, _MirrorEvents
+from .timestamp import parse_timestamps
+
+if TYPE_CHECKING:
+    from .archivist import Archivist
+
+LOGGER = getLogger(__name__)
+
+# entities in these states may change and are read again by the next sync
+UNCONFIRMED = (ConfirmationStatus.PENDING.name, ConfirmationStatus.STORED.name)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    identity TEXT PRIMARY KEY,
+    display_type TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_display_type ON assets (display_type);
+
+CREATE TABLE IF NOT EXISTS events (
+    identity TEXT PRIMARY KEY,
+    asset_identity TEXT,
+    display_type TEXT,
+    timestamp_committed INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_asset_identity ON events (asset_identity);
+CREATE INDEX IF NOT EXISTS events_display_type ON events (display_type);
+CREATE INDEX IF NOT EXISTS events_timestamp_committed ON events (timestamp_committed);
+
+CREATE TABLE IF NOT EXISTS sync (
+    collection TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL,
+    finished_at REAL,
+    cursor TEXT
+);
+"""
+
+UPSERT_ASSET = """
+INSERT INTO assets (identity, display_type, data) VALUES (?, ?, ?)
+ON CONFLICT (identity) DO UPDATE SET
+    display_type = excluded.display_type,
+    data = excluded.data
+WHERE assets.data != excluded.data
+"""
+
+UPSERT_EVENT = """
+INSERT INTO events (identity, asset_identity, display_type, timestamp_committed, data)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (identity) DO UPDATE SET
+    asset_identity = excluded.asset_identity,
+    display_type = excluded.display_type,
+    timestamp_committed = excluded.timestamp_committed,
+    data = excluded.data
+WHERE events.data != excluded.data
+"""
+
+ANALYZE = """
+PRAGMA analysis_limit = 1000;
+ANALYZE;
+"""
+
+UPSERT_SYNC = """
+INSERT OR REPLACE INTO sync (collection, watermark, synced_at, finished_at)
+VALUES (?, ?, ?, ?)
+"""
+
+SAVE_CURSOR = """
+INSERT INTO sync (collection, watermark, cursor) VALUES (?, ?, ?)
+ON CONFLICT (collection) DO UPDATE SET cursor = excluded.cursor
+"""
+
+
+class Mirror:
+    """Local mirror of assets and events
+
+    Args:
+        archivist (Archivist): :class:`Archivist` instance
+        filename (str): SQLite database file. ":memory:" is a private in memory
+            database.
+        page_size (int): number of entities requested per page.
+        max_workers (int): maximum number of concurrent asset reads.
+
+    """
+
+    def __init__(
+        self,
+        archivist: "Archivist",
+        filename: str,
+        *,
+        page_size: int = MIRROR_PAGE_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ):
+        self._archivist = archivist
+        self._page_size = page_size
+        self._max_workers = max_workers
+        self._connection = connect(filename)
+        self._connection.executescript(SCHEMA)
+        self.assets = _MirrorAssets(self)
+        self.events = _MirrorEvents(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database"""
+        self._connection.close()
+
+    @property
+    def connection(self):
+        """sqlite3.Connection: connection to the mirror database"""
+        return self._connection
+
+    @property
+    def fixtures(self) -> "dict[str, Any]":
+        """dict: fixtures of the archivist applied to queries"""
+        return self._archivist.fixtures
+
+    def watermark(self, collection: str) -> "str|None":
+        """Returns the timestamp_committed the next sync lists from (events only)"""
+        row = self._connection.execute(
+            "SELECT watermark FROM sync WHERE collection = ?", (collection,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def lag(self) -> "float|None":
+        """Returns seconds since the last sync finished
+
+        The mirror holds the events committed up to the start of that sync.
+        None if there has been no sync.
+        """
+        row = self._connection.execute(
+            "SELECT finished_at FROM sync WHERE collection = ?",
+            (EVENTS_LABEL,),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+
+        return max(0.0, time() - row[0])
+
+    def event_age(self) -> "float|None":
+        """Returns seconds between the last sync and the newest event mirrored
+
+        This is not the lag of the mirror (see :meth:`lag`) as it grows while
+        no events are recorded. None if there has been no sync.
+        """
+        row = self._connection.execute(
+            "SELECT synced_at FROM sync WHERE collection = ?",
+            (EVENTS_LABEL,),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+
+        (newest,) = self._connection.execute(
+            "SELECT MAX(timestamp_committed) FROM events"
+        ).fetchone()
+        if newest is None:
+            return 0.0
+
+        return max(0.0, row[0] - newest / 1e6)
+
+    def __upsert_assets(self, assets: "Iterable[dict[str, Any]]") -> int:
+        changes = self._connection.total_changes
+        self._connection.executemany(
+            UPSERT_ASSET,
+            (
+                (
+                    a["identity"],
+                    (a.get("attributes") or {}).get("arc_display_type"),
+                    dumps(a, sort_keys=True),
+                )
+                for a in assets
+            ),
+        )
+        return self._connection.total_changes - changes
+
+    def __upsert_events(self, events: "list[dict[str, Any]]") -> int:
+        changes = self._connection.total_changes
+        committed = parse_timestamps(e.get("timestamp_committed") for e in events)
+        self._connection.executemany(
+            UPSERT_EVENT,
+            (
+                (
+                    e["identity"],
+                    e.get("asset_identity"),
+                    (e.get("event_attributes") or {}).get("arc_display_type"),
+                    c or None,
+                    dumps(e, sort_keys=True),
+                )
+                for e, c in zip(events, committed)
+            ),
+        )
+        return self._connection.total_changes - changes
+
+    def __changed_assets(self, watermark: "str|None") -> "set[str]":
+        """Returns the assets of the events committed after the watermark"""
+        since = parse_timestamps((watermark,))[0] if watermark else 0
+        return {
+            identity
+            for (identity,) in self._connection.execute(
+                "SELECT DISTINCT asset_identity FROM events"
+                " WHERE timestamp_committed > ? AND asset_identity IS NOT NULL",
+                (since,),
+            )
+        }
+
+    def __uncommitted_events(self) -> "set[str]":
+        """Returns the events that had not been committed when last read"""
+        return {
+            identity
+            for (identity,) in self._connection.execute(
+                "SELECT identity FROM events WHERE timestamp_committed IS NULL"
+            )
+        }
+
+    def __unconfirmed_assets(self) -> "set[str]":
+        """Returns the assets that are not yet confirmed"""
+        return {
+            identity
+            for (identity,) in self._connection.execute(
+                "SELECT identity FROM assets"
+                " WHERE json_extract(data, '$.confirmation_status') IN (?, ?)",
+                UNCONFIRMED,
+            )
+        }
+
+    def __watermark(self, watermark: "str|None") -> "str|None":
+        """Returns the timestamp_committed of the oldest unconfirmed event
+
+        Events committed before the previous watermark are already confirmed.
+        If all are confirmed returns that of the newest event.
+        """
+        since = parse_timestamps((watermark,))[0] if watermark else 0
+        row = self._connection.execute(
+            "SELECT data FROM events WHERE timestamp_committed >= ?"
+            " AND json_extract(data, '$.confirmation_status') IN (?, ?)"
+            " ORDER BY timestamp_committed LIMIT 1",
+            (since, *UNCONFIRMED),
+        ).fetchone()
+        if row is None:
+            row = self._connection.execute(
+                "SELECT data FROM events ORDER BY timestamp_committed DESC LIMIT 1"
+            ).fetchone()
+
+        return loads(row[0]).get("timestamp_committed") if row is not None else None
+
+    def sync(self) -> "dict[str, int]":
+        """Synchronise the mirror
+
+        Lists the events committed since the watermark (all events on the
+        first sync) and re-reads the events that had not been committed. Then
+        re-reads the assets of the events committed after the watermark or
+        re-read and the assets that are not yet confirmed (all assets on the
+        first sync). Changed entities are inserted or updated.
+
+        Each page of events is committed with the list cursor so that an
+        interrupted sync resumes at the page at which it stopped. The watermark
+        is only advanced when the sync completes.
+
+        Returns:
+            dictionary of number of assets and events inserted or updated.
+
+        """
+        synced_at = time()
+        row = self._connection.execute(
+            "SELECT watermark, cursor FROM sync WHERE collection = ?", (EVENTS_LABEL,)
+        ).fetchone()
+        watermark, state = row if row is not None else (None, None)
+        cursor = ListCursor(loads(state) if state else None)
+        first = (
+            self._connection.execute(
+                "SELECT 1 FROM sync WHERE collection = ?", (ASSETS_LABEL,)
+            ).fetchone()
+            is None
+        )
+
+        uncommitted = self.__uncommitted_events()
+        props = {MIRROR_COMMITTED_SINCE: watermark} if watermark else None
+        LOGGER.debug("Sync events %s after %d", props, cursor.count)
+        events_changed = 0
+        page: "list[dict[str, Any]]" = []
+        for event in self._archivist.events.list(
+            page_size=self._page_size, props=props, cursor=cursor
+        ):
+            page.append(event)  # pyright: ignore
+            # the cursor offset is zero after the last event of each page
+            if cursor.offset == 0:
+                with self._connection:
+                    events_changed += self.__upsert_events(page)
+                    self._connection.execute(
+                        SAVE_CURSOR, (EVENTS_LABEL, watermark, dumps(cursor))
+                    )
+
+                page = []
+
+        # events listed before they were committed are not listed again if
+        # their timestamp_committed is before the watermark
+        reread = self.__read(
+            self._archivist.events.read, uncommitted & self.__uncommitted_events()
+        )
+        if reread:
+            with self._connection:
+                events_changed += self.__upsert_events(reread)
+
+        with self._connection:
+            if first:
+                LOGGER.debug("Sync all assets")
+                assets_changed = self.__upsert_assets(
+                    self._archivist.assets.list(  # pyright: ignore
+                        page_size=self._page_size
+                    )
+                )
+            else:
+                assets_changed = self.__upsert_assets(
+                    self.__read(
+                        self._archivist.assets.read,
+                        self.__changed_assets(watermark)
+                        | self.__unconfirmed_assets()
+                        | {
+                            e["asset_identity"]
+                            for e in reread
+                            if e.get("asset_identity")
+                        },
+                    )
+                )
+
+            finished_at = time()
+            self._connection.executemany(
+                UPSERT_SYNC,
+                (
+                    (ASSETS_LABEL, None, synced_at, finished_at),
+                    (EVENTS_LABEL, self.__watermark(watermark), synced_at, finished_at),
+                ),
+            )
+
+        if assets_changed or events_changed:
+            # refresh the statistics used by the query planner to choose indexes
+            self._connection.executescript(ANALYZE)
+
+        LOGGER.info("Sync %d assets %d events", assets_changed, events_changed)
+        return {ASSETS_LABEL: assets_changed, EVENTS_LABEL: events_changed}
+
+    def __read(
+        self, read: "Callable[[str], Any]", identities: "set[str]"
+    ) -> "list[dict[str, Any]]":
+        """Read entities concurrently"""
+        if not identities:
+            return []
+
+        LOGGER.debug("Read %d entities", len(identities))
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(identities))
+        ) as executor:
+            return list(executor.map(read, sorted(identities)))
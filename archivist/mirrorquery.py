@@ -0,0 +1,343 @@
+"""Archivist mirror query
+
+   Assets and events queries answered from a :class:`Mirror`.
+
+   The clients have the same read, count and list methods as the assets and
+   events attributes of the :class:`Archivist` class and accept the same
+   filters so that code can switch between the API and the mirror with one flag:
+
+   .. code-block:: python
+
+      clients = mirror if local else arch
+      for event in clients.events.list(
+          asset_id=asset_id,
+          attrs={"arc_display_type": or_dict(["open", "close"])},
+      ):
+          ...
+
+   Filters (including fixtures) are matched against each entity:
+
+      * a value matches a value with the same string form, as the API
+        compares the filter sent in the query string (1 matches "1" but not
+        1.0) or, if the value is "*", any value.
+      * a value of None is ignored as it is not sent to the API.
+      * an or_dict matches any value in its list.
+      * a list of values matches any value in the list.
+      * any other dictionary is matched key by key against the nested entity.
+
+   As with the API, a list of or_dicts (and_list) is not a valid filter and
+   raises :class:`ArchivistBadFieldError`.
+
+   The asset identity and arc_display_type filters select rows using the
+   indexes of the mirror before the remaining filters are applied.
+
+"""
+
+from json import loads
+from typing import TYPE_CHECKING, Any, Callable, Generator
+
+from .assets import Asset
+from .constants import ASSETS_LABEL, ASSETS_WILDCARD, EVENTS_LABEL
+from .dictmerge import _merge
+from .errors import ArchivistBadFieldError, ArchivistNotFoundError
+from .events import Event
+from .projection import _Projection
+
+if TYPE_CHECKING:
+    from .mirror import Mirror
+
+WILDCARD = "*"
+DISPLAY_TYPE = "arc_display_type"
+
+
+def __scalar(value: Any, wanted: Any) -> bool:
+    """Match one filter value by its string form in the query string"""
+    if value is None:
+        return False
+
+    if wanted == WILDCARD:
+        return True
+
+    if isinstance(value, (dict, list)):
+        return False
+
+    return str(value) == str(wanted)
+
+
+def _matches(value: Any, wanted: Any) -> bool:
+    """Returns True if an entity value matches the filter"""
+    if wanted is None:
+        return True
+
+    if isinstance(wanted, dict):
+        if wanted.keys() == {"or"}:
+            return any(__scalar(value, w) for w in wanted["or"])
+
+        if not isinstance(value, dict):
+            return False
+
+        return all(_matches(value.get(k), w) for k, w in wanted.items())
+
+    if isinstance(wanted, (list, tuple)):
+        if any(isinstance(w, dict) for w in wanted):
+            raise ArchivistBadFieldError(
+                "dictionaries in lists are not supported in queries"
+            )
+
+        return any(__scalar(value, w) for w in wanted)
+
+    return __scalar(value, wanted)
+
+
+def _values(wanted: Any) -> "list[Any]|None":
+    """Returns the values an indexed column may take or None if not restricted"""
+    if isinstance(wanted, dict):
+        wanted = wanted.get("or") if wanted.keys() == {"or"} else None
+
+    if wanted is None or isinstance(wanted, dict):
+        return None
+
+    if not isinstance(wanted, (list, tuple)):
+        wanted = [wanted]
+
+    if any(isinstance(w, dict) or w == WILDCARD for w in wanted):
+        return None
+
+    return [str(w) for w in wanted]
+
+
+class _MirrorClient:
+    """Query of one table of the mirror"""
+
+    def __init__(self, mirror: "Mirror", table: str, wrapper: Callable):
+        self._mirror = mirror
+        self._table = table
+        self._wrapper = wrapper
+
+    def __str__(self) -> str:
+        return f"Mirror{self._table.capitalize()}()"
+
+    def read(self, identity: str):
+        """Read entity
+
+        Args:
+            identity (str): identity of the entity
+
+        Returns:
+            :class:`Asset` or :class:`Event` instance
+
+        """
+        row = self._mirror.connection.execute(
+            f"SELECT data FROM {self._table} WHERE identity = ?",
+            (identity,),
+        ).fetchone()
+        if row is None:
+            raise ArchivistNotFoundError(f"{identity} not found in mirror")
+
+        return self._wrapper(loads(row[0]))
+
+    def _select(
+        self,
+        params: "dict[str, Any]",
+        columns: "dict[str, Any]",
+        order: str,
+    ) -> "Generator[dict[str, Any], None, None]":
+        where = []
+        args = []
+        for column, wanted in columns.items():
+            values = _values(wanted)
+            if values is not None:
+                where.append(f"{column} IN ({', '.join('?' * len(values))})")
+                args.extend(values)
+
+        sql = f"SELECT data FROM {self._table}"
+        if where:
+            sql = f"{sql} WHERE {' AND '.join(where)}"
+
+        for (data,) in self._mirror.connection.execute(f"{sql} ORDER BY {order}", args):
+            entity = loads(data)
+            if _matches(entity, params):
+                yield entity
+
+    def _list(
+        self,
+        params: "dict[str, Any]",
+        columns: "dict[str, Any]",
+        order: str,
+        fields: "tuple[str, ...]|None",
+    ):
+        entities = self._select(params, columns, order)
+        if fields is not None:
+            return map(_Projection(fields), entities)
+
+        return (self._wrapper(e) for e in entities)
+
+
+class _MirrorAssets(_MirrorClient):
+    """Assets held in the mirror
+
+    Args:
+        mirror (Mirror): :class:`Mirror` instance
+
+    """
+
+    def __init__(self, mirror: "Mirror"):
+        super().__init__(mirror, ASSETS_LABEL, Asset)
+
+    def __params(
+        self, props: "dict[str, Any]|None", attrs: "dict[str, Any]|None"
+    ) -> "dict[str, Any]":
+        params = {**props} if props else {}
+        if attrs:
+            params["attributes"] = attrs
+
+        return _merge(self._mirror.fixtures.get(ASSETS_LABEL), params)
+
+    def count(
+        self,
+        *,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+    ) -> int:
+        """Count assets.
+
+        Counts number of assets that match criteria.
+
+        Args:
+            props (dict): e.g. {"confirmation_status": "CONFIRMED" }
+            attrs (dict): e.g. {"arc_display_type": "door" }
+
+        Returns:
+            integer count of assets.
+
+        """
+        return sum(1 for _ in self.list(props=props, attrs=attrs))
+
+    def list(
+        self,
+        *,
+        page_size: "int|None" = None,  # pylint: disable=unused-argument
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        fields: "tuple[str, ...]|None" = None,
+    ):
+        """List assets.
+
+        Lists assets that match criteria ordered by identity.
+
+        Args:
+            props (dict): optional e.g. {"tracked": "TRACKED" }
+            attrs (dict): optional e.g. {"arc_display_type": "door" }
+            page_size (int): ignored.
+            fields (tuple): optional dot delimited fields to return
+                e.g. ("identity", "attributes.arc_display_name")
+
+        Returns:
+            iterable that returns :class:`Asset` instances or, if fields is
+            specified, named tuples of the fields.
+
+        """
+        params = self.__params(props, attrs)
+        return self._list(
+            params,
+            {"display_type": params.get("attributes", {}).get(DISPLAY_TYPE)},
+            "identity",
+            fields,
+        )
+
+
+class _MirrorEvents(_MirrorClient):
+    """Events held in the mirror
+
+    Args:
+        mirror (Mirror): :class:`Mirror` instance
+
+    """
+
+    def __init__(self, mirror: "Mirror"):
+        super().__init__(mirror, EVENTS_LABEL, Event)
+
+    def __params(
+        self,
+        props: "dict[str, Any]|None",
+        attrs: "dict[str, Any]|None",
+        asset_attrs: "dict[str, Any]|None",
+    ) -> "dict[str, Any]":
+        params = {**props} if props else {}
+        if attrs:
+            params["event_attributes"] = attrs
+        if asset_attrs:
+            params["asset_attributes"] = asset_attrs
+
+        return _merge(self._mirror.fixtures.get(EVENTS_LABEL), params)
+
+    def count(
+        self,
+        *,
+        asset_id: "str|None" = None,
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        asset_attrs: "dict[str, Any]|None" = None,
+    ) -> int:
+        """Count events.
+
+        Counts number of events that match criteria.
+
+        Args:
+            asset_id (str): optional asset identity e.g. assets/xxxxxxxxxxxxxxxxxxxxxxxxxx
+            props (dict): e.g. {"tracked": "TRACKED" }
+            attrs (dict): e.g. {"arc_display_type": "open" }
+            asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
+
+        Returns:
+            integer count of events.
+
+        """
+        return sum(
+            1
+            for _ in self.list(
+                asset_id=asset_id, props=props, attrs=attrs, asset_attrs=asset_attrs
+            )
+        )
+
+    def list(
+        self,
+        *,
+        asset_id: "str|None" = None,
+        page_size: "int|None" = None,  # pylint: disable=unused-argument
+        props: "dict[str, Any]|None" = None,
+        attrs: "dict[str, Any]|None" = None,
+        asset_attrs: "dict[str, Any]|None" = None,
+        fields: "tuple[str, ...]|None" = None,
+    ):
+        """List events.
+
+        Lists events that match criteria, most recently committed first.
+
+        Args:
+            asset_id (str): optional asset identity e.g. assets/xxxxxxxxxxxxxxxxxxxxxxxxxx
+            props (dict): e.g. {"tracked": "TRACKED" }
+            attrs (dict): e.g. {"arc_display_type": "open" }
+            asset_attrs (dict): optional asset_attributes e.g. {"arc_display_type": "door" }
+            page_size (int): ignored.
+            fields (tuple): optional dot delimited fields to return
+                e.g. ("identity", "event_attributes.arc_display_type")
+
+        Returns:
+            iterable that returns :class:`Event` instances or, if fields is
+            specified, named tuples of the fields.
+
+        """
+        params = self.__params(props, attrs, asset_attrs)
+        if asset_id == ASSETS_WILDCARD:
+            asset_id = None
+
+        return self._list(
+            params,
+            {
+                "asset_identity": asset_id,
+                "display_type": params.get("event_attributes", {}).get(DISPLAY_TYPE),
+            },
+            "timestamp_committed DESC, identity",
+            fields,
+        )
@@ -0,0 +1,282 @@
+"""Archivist parallel requests
+
+   Issues several counts or lists several shards (for example the events of
+   each asset) concurrently over a bounded pool of threads.
+
+   Each shard is listed a page at a time. Pages are yielded as they arrive or,
+   if ordered, shard by shard in the order the shards were given. When ordered,
+   the shards after the one being yielded are held once they get a few pages
+   ahead so that a slow shard does not cause the others to be buffered. A shard that
+   fails with a transient error is retried from the page at which it failed.
+   A shard that still fails does not stop the other shards - when all shards
+   have finished an :class:`ArchivistShardError` lists the failed shards so that
+   only those need be listed again.
+
+"""
+
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from queue import Empty, Full, Queue
+from threading import Condition, Event
+from typing import Any, Callable, Generator, Iterable
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+from .constants import MAX_WORKERS, PARALLEL_RETRIES, PARALLEL_RETRY_DELAY
+from .errors import (
+    Archivist5xxError,
+    ArchivistError,
+    ArchivistShardError,
+    ArchivistUnavailableError,
+)
+
+LOGGER = getLogger(__name__)
+
+# errors after which a shard is retried
+RETRYABLE = (
+    Archivist5xxError,
+    ArchivistUnavailableError,
+    RequestsConnectionError,
+    Timeout,
+)
+
+# interval at which blocked threads check whether the listing was abandoned
+# or the workers have died
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+def _count_many(
+    count: "Callable[..., int]",
+    filters: "dict[str, dict[str, Any]]",
+    *,
+    max_workers: int = MAX_WORKERS,
+) -> "dict[str, int]":
+    """Count concurrently
+
+    Args:
+        count (callable): count method e.g. :meth:`_AssetsRestricted.count`
+        filters (dict): keyword arguments of each count keyed by name.
+        max_workers (int): maximum number of concurrent counts.
+
+    Returns:
+        dict of counts keyed by name.
+
+    """
+    if not filters:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(filters))) as executor:
+        return dict(
+            zip(
+                filters,
+                executor.map(lambda kwargs: count(**kwargs), filters.values()),
+            )
+        )
+
+
+class _Shards:  # pylint: disable=too-many-instance-attributes
+    """Shards listed by a pool of threads
+
+    Each thread lists one shard and puts tuples of shard index and page on a
+    bounded queue. The final item of each shard is _DONE or the exception at
+    which the shard failed.
+
+    If ordered, items of shards after the current one (the shard being yielded)
+    are held by arrivals until the current shard is finished. Threads listing
+    those shards block once the number held or queued reaches the size of the
+    queue.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pages: "Callable[[Any, str|None], Iterable[tuple[list[Any], str|None]]]",
+        *,
+        max_workers: int,
+        retries: int,
+        retry_delay: float,
+        ordered: bool = False,
+    ):
+        self._pages = pages
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._ordered = ordered
+        self._results = Queue(maxsize=2 * max_workers)
+        self._condition = Condition()
+        self._current = 0
+        self._held: "dict[int, int]" = defaultdict(int)
+        self.stop = Event()
+
+    def __ahead(self) -> int:
+        """Number of items of later shards held or queued - must hold the condition"""
+        return sum(self._held.values()) - self._held[self._current]
+
+    def put(self, item: "tuple[int, Any]"):
+        """Queue an item unless the listing was abandoned"""
+        if self._ordered:
+            index = item[0]
+            with self._condition:
+                while (
+                    index != self._current and self.__ahead() >= self._results.maxsize
+                ):
+                    if self.stop.is_set():
+                        return
+
+                    self._condition.wait(POLL_INTERVAL)
+
+                self._held[index] += 1
+
+        while not self.stop.is_set():
+            try:
+                self._results.put(item, timeout=POLL_INTERVAL)
+            except Full:
+                continue
+
+            return
+
+    def worker(self, index: int, shard: Any):
+        """List one shard resuming at the failed page after a transient error"""
+        page_token = None
+        attempt = 0
+        while not self.stop.is_set():
+            try:
+                for records, page_token in self._pages(shard, page_token):
+                    attempt = 0
+                    self.put((index, records))
+                    if self.stop.is_set():
+                        return
+
+            except RETRYABLE as ex:
+                attempt += 1
+                if attempt > self._retries:
+                    self.put((index, ex))
+                    return
+
+                LOGGER.info("Retry shard %s (%d): %s", shard, attempt, ex)
+                self.stop.wait(self._retry_delay * 2 ** (attempt - 1))
+                continue
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.put((index, ex))
+                return
+
+            self.put((index, _DONE))
+            return
+
+    def __get(self, futures: "list[Future[None]]") -> "tuple[int, Any]":
+        """Get the next item checking that the workers are still alive
+
+        Raises:
+            ArchivistError: the workers finished without finishing their shards.
+            Any other exception raised by a worker is re-raised.
+        """
+        while True:
+            try:
+                return self._results.get(timeout=POLL_INTERVAL)
+            except Empty:
+                if not self._results.empty() or not all(f.done() for f in futures):
+                    continue
+
+            for future in futures:
+                future.result()
+
+            raise ArchivistError("shard listing stopped before all shards finished")
+
+    def arrivals(
+        self, futures: "list[Future[None]]"
+    ) -> "Generator[tuple[int, Any], None, None]":
+        """Returns items as they arrive or in shard order"""
+        if not self._ordered:
+            while True:
+                yield self.__get(futures)
+
+        # items of later shards are held until the current shard is finished
+        buffered = defaultdict(deque)
+        while True:
+            index, item = self.__get(futures)
+            buffered[index].append(item)
+            while buffered[self._current]:
+                item = buffered[self._current].popleft()
+                yield self._current, item
+                with self._condition:
+                    self._held[self._current] -= 1
+                    if item is _DONE or isinstance(item, Exception):
+                        del buffered[self._current]
+                        del self._held[self._current]
+                        self._current += 1
+
+                    self._condition.notify_all()
+
+
+def _parallel_pages(
+    pages: "Callable[[Any, str|None], Iterable[tuple[list[Any], str|None]]]",
+    shards: "Iterable[Any]",
+    *,
+    ordered: bool = False,
+    max_workers: int = MAX_WORKERS,
+    retries: int = PARALLEL_RETRIES,
+    retry_delay: float = PARALLEL_RETRY_DELAY,
+) -> "Generator[list[Any], None, None]":
+    """List shards concurrently
+
+    Args:
+        pages (callable): called with a shard and page token (None for the first
+            page) and returns an iterable of tuples of records and next page token
+            e.g. :meth:`ArchivistPublic.list_pages`.
+        shards (iterable): shards to list.
+        ordered (bool): yield the pages of each shard in the order of the shards.
+        max_workers (int): maximum number of shards listed concurrently.
+        retries (int): number of times a shard is retried after a transient error.
+        retry_delay (float): seconds before the first retry. Doubled for each
+            subsequent retry.
+
+    Returns:
+        iterable of pages of records.
+
+    Raises:
+        ArchivistShardError: one or more shards failed.
+
+    """
+    shards = list(shards)
+    if not shards:
+        return
+
+    max_workers = min(max_workers, len(shards))
+    listing = _Shards(
+        pages,
+        max_workers=max_workers,
+        retries=retries,
+        retry_delay=retry_delay,
+        ordered=ordered,
+    )
+    failed = []
+    remaining = len(shards)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(listing.worker, index, shard)
+            for index, shard in enumerate(shards)
+        ]
+        arrivals = listing.arrivals(futures)
+        while remaining:
+            index, item = next(arrivals)  # pylint: disable=stop-iteration-return
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                LOGGER.info("Shard %s failed: %s", shards[index], item)
+                failed.append((shards[index], item))
+                remaining -= 1
+            else:
+                yield item
+
+    finally:
+        listing.stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if failed:
+        raise ArchivistShardError(
+            failed, f"{len(failed)} of {len(shards)} shards failed"
+        )
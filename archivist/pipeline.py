@@ -0,0 +1,375 @@
+"""Archivist create and confirm pipeline
+
+   Creates and confirms many assets and events in two concurrent stages.
+
+   For example:
+
+   .. code-block:: python
+
+      pipeline = Pipeline(arch)
+      requests = [(None, asset_data), (asset_id, event_data), ...]
+      for request, result in pipeline.run(requests):
+          if isinstance(result, Exception):
+              failed(request, result)
+          else:
+              confirmed(request, result)
+
+      print(pipeline.metrics.snapshot())
+
+   Each request is a tuple of asset identity and request body. An asset is
+   created if the asset identity is None, otherwise an event is created on the
+   asset.
+
+   The create stage creates entities on a pool of threads and puts them on a
+   bounded queue. The confirm stage takes created entities from the queue and
+   confirms them in the background (see :mod:`archivist.confirmations`). When
+   the confirm stage has confirm_limit entities being confirmed it stops
+   taking from the queue and, when the queue is full, the create stage waits.
+
+   Events are confirmed in batches. The unconfirmed events of each asset on
+   which the pipeline created events are listed once for all the polls due
+   within min_interval of the confirmation policy. An event is only read once
+   it is no longer listed. Assets cannot be listed by identity so each asset is
+   read as its confirmation policy directs.
+
+   Results are yielded as each entity is confirmed or fails - the confirmed
+   entity or the exception at which creation or confirmation failed.
+
+"""
+
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from queue import Full, Queue
+from threading import BoundedSemaphore, Event, Lock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Generator, Iterable
+
+from . import confirmer
+from .confirmation_status import ConfirmationStatus
+from .constants import (
+    CONFIRMATION_STATUS,
+    EVENTS_LABEL,
+    MAX_WORKERS,
+    PIPELINE_CONFIRM_LIMIT,
+    PIPELINE_QUEUE_SIZE,
+)
+from .errors import ArchivistUnconfirmedError
+from .parallel import POLL_INTERVAL
+
+if TYPE_CHECKING:
+    from .archivist import Archivist
+    from .events import _EventsRestricted
+
+LOGGER = getLogger(__name__)
+
+_DONE = object()
+
+# statuses listed to find the entities that are not yet confirmed
+UNCONFIRMED = (ConfirmationStatus.PENDING.name, ConfirmationStatus.STORED.name)
+
+
+class PipelineMetrics:
+    """PipelineMetrics
+
+    Counts of the requests passing through each stage of a :class:`Pipeline`.
+    The times to confirm are recorded by the confirmation_policy of the assets
+    and events clients.
+    """
+
+    NAMES = (
+        "requested",
+        "created",
+        "create_failed",
+        "create_seconds",
+        "queued",
+        "max_queued",
+        "confirming",
+        "confirmed",
+        "confirm_failed",
+    )
+
+    def __init__(self):
+        self._lock = Lock()
+        self._values: "dict[str, float]" = dict.fromkeys(self.NAMES, 0)
+
+    def add(self, name: str, value: float = 1):
+        """Add value to a metric"""
+        with self._lock:
+            self._values[name] += value
+            if name == "queued":
+                self._values["max_queued"] = max(
+                    self._values["max_queued"], self._values["queued"]
+                )
+
+    def snapshot(self) -> "dict[str, float]":
+        """Returns the current value of each metric
+
+        * requested - requests taken by the create stage
+        * created - entities created
+        * create_failed - requests that could not be created
+        * create_seconds - total time spent creating
+        * queued - created entities waiting for the confirm stage
+        * max_queued - largest number of entities queued
+        * confirming - entities being confirmed
+        * confirmed - entities confirmed
+        * confirm_failed - entities that failed or timed out
+
+        """
+        with self._lock:
+            return dict(self._values)
+
+
+class _Unconfirmed:
+    """Identities of the events submitted for confirmation not yet confirmed
+
+    The unconfirmed events of the assets of the submitted events are listed
+    again when tested more than max_age seconds after the last listing. Only
+    the submitted events not listed as unconfirmed are reported as confirmed,
+    so events submitted since the last listing are assumed to be unconfirmed.
+    """
+
+    def __init__(self, events: "_EventsRestricted", max_age: float):
+        self._events = events
+        self._max_age = max_age
+        self._lock = Lock()
+        self._submitted: "Counter[str]" = Counter()
+        self._listing = Lock()
+        self._confirmed: "set[str]" = set()
+        self._listed_at = float("-inf")
+
+    def add(self, identity: str):
+        """Add an event submitted for confirmation"""
+        with self._lock:
+            self._submitted[identity] += 1
+
+    def discard(self, identity: str):
+        """Discard an event that is confirmed or failed"""
+        with self._lock:
+            self._submitted[identity] -= 1
+            if self._submitted[identity] == 0:
+                del self._submitted[identity]
+
+    def __contains__(self, identity: object) -> bool:
+        with self._listing:
+            now = monotonic()
+            if now - self._listed_at >= self._max_age:
+                with self._lock:
+                    submitted = set(self._submitted)
+
+                self._confirmed = submitted - self.__list(submitted)
+                self._listed_at = now
+
+            return identity not in self._confirmed
+
+    def __list(self, submitted: "set[str]") -> "set[str]":
+        """List the submitted events that are not yet confirmed"""
+        asset_ids = sorted({i.split(f"/{EVENTS_LABEL}/")[0] for i in submitted})
+        identities = {
+            i
+            for status in UNCONFIRMED
+            for (i,) in self._events.list_parallel(
+                asset_ids=asset_ids,
+                props={CONFIRMATION_STATUS: status},
+                fields=("identity",),
+            )
+            if i in submitted
+        }
+        LOGGER.debug("%d unconfirmed", len(identities))
+        return identities
+
+
+class Pipeline:
+    """Pipeline
+
+    Args:
+        archivist (Archivist): :class:`Archivist` instance
+        create_workers (int): maximum number of concurrent creates.
+        queue_size (int): maximum number of created entities queued for the
+            confirm stage.
+        confirm_limit (int): maximum number of entities being confirmed.
+
+    """
+
+    def __init__(
+        self,
+        archivist: "Archivist",
+        *,
+        create_workers: int = MAX_WORKERS,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        confirm_limit: int = PIPELINE_CONFIRM_LIMIT,
+    ):
+        self._archivist = archivist
+        self._create_workers = create_workers
+        self._queue_size = queue_size
+        self._confirm_limit = confirm_limit
+        self.metrics = PipelineMetrics()
+
+    def __str__(self) -> str:
+        return f"Pipeline({self._archivist.url})"
+
+    def run(
+        self, requests: "Iterable[tuple[str|None, dict[str, Any]]]"
+    ) -> "Generator[tuple[tuple[str|None, dict[str, Any]], Any], None, None]":
+        """Create and confirm
+
+        Args:
+            requests (iterable): tuples of asset identity (None to create an
+                asset) and request body.
+
+        Returns:
+            iterable of tuples of request and the confirmed entity or the
+            exception at which the request failed.
+
+        Raises:
+            any exception raised by requests once the requests taken before
+            it have been confirmed.
+
+        """
+        run = _Run(self, requests)
+        try:
+            while (result := run.results.get()) is not _DONE:
+                yield result
+        finally:
+            run.stop.set()
+
+        if run.error is not None:
+            raise run.error
+
+
+class _Run:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """The stages of one run of a pipeline"""
+
+    def __init__(self, pipeline: Pipeline, requests: "Iterable[tuple[str|None, dict]]"):
+        # pylint: disable=protected-access
+        self._archivist = pipeline._archivist
+        self._create_workers = pipeline._create_workers
+        self._confirm_limit = pipeline._confirm_limit
+        self._metrics = pipeline.metrics
+        self._created = Queue(maxsize=pipeline._queue_size)
+        self._confirming = BoundedSemaphore(pipeline._confirm_limit)
+        events = self._archivist.events
+        self._unconfirmed = _Unconfirmed(
+            events, events.confirmation_policy.min_interval
+        )
+        self.results = Queue()
+        self.stop = Event()
+        self.error: "Exception|None" = None
+        Thread(target=self.__create_stage, args=(requests,), daemon=True).start()
+        Thread(target=self.__confirm_stage, daemon=True).start()
+
+    def __create(self, request: "tuple[str|None, dict]"):
+        """Create one entity and queue it for confirmation"""
+        asset_id, data = request
+        start = monotonic()
+        try:
+            if asset_id is None:
+                entity = self._archivist.assets.create_from_data(data)
+            else:
+                entity = self._archivist.events.create_from_data(asset_id, data)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            LOGGER.debug("Create %s failed: %s", request, ex)
+            self._metrics.add("create_failed")
+            self.results.put((request, ex))
+            return
+        finally:
+            self._metrics.add("create_seconds", monotonic() - start)
+
+        self._metrics.add("created")
+        self._metrics.add("queued")
+        while not self.stop.is_set():
+            try:
+                self._created.put((request, entity), timeout=POLL_INTERVAL)
+            except Full:
+                continue
+
+            return
+
+        self._metrics.add("queued", -1)
+
+    def __create_stage(self, requests: "Iterable[tuple[str|None, dict]]"):
+        """Create on a pool of threads with a bounded number waiting to start"""
+        waiting = BoundedSemaphore(2 * self._create_workers)
+
+        def create(request):
+            try:
+                self.__create(request)
+            finally:
+                waiting.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._create_workers) as executor:
+                for request in requests:
+                    waiting.acquire()  # pylint: disable=consider-using-with
+                    if self.stop.is_set():
+                        break
+
+                    self._metrics.add("requested")
+                    executor.submit(create, request)
+
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.error = ex
+
+        finally:
+            self._created.put(_DONE)
+
+    def __confirm_stage(self):
+        """Confirm created entities in the background"""
+        while (item := self._created.get()) is not _DONE:
+            self._metrics.add("queued", -1)
+            self._confirming.acquire()  # pylint: disable=consider-using-with
+            if self.stop.is_set():
+                self._confirming.release()
+                continue
+
+            self._metrics.add("confirming")
+            request, entity = item
+            identity = entity["identity"]
+            if request[0] is None:
+                manager, unconfirmed = self._archivist.assets, None
+            else:
+                manager, unconfirmed = self._archivist.events, self._unconfirmed
+                unconfirmed.add(identity)
+
+            try:
+                # pylint: disable=protected-access
+                future = confirmer._confirm_in_background(
+                    manager,
+                    identity,
+                    manager.confirmation_policy,
+                    unconfirmed=unconfirmed,
+                )
+            except ArchivistUnconfirmedError as ex:
+                future = Future()
+                future.set_exception(ex)
+
+            future.add_done_callback(
+                lambda f, request=request, identity=identity: self.__confirmed(
+                    request, identity, f
+                )
+            )
+
+        # wait for the confirmations to complete
+        for _ in range(self._confirm_limit):
+            self._confirming.acquire()  # pylint: disable=consider-using-with
+
+        self.results.put(_DONE)
+
+    def __confirmed(
+        self, request: "tuple[str|None, dict]", identity: str, future: "Future[Any]"
+    ):
+        """Emit the result of a confirmation"""
+        if request[0] is not None:
+            self._unconfirmed.discard(identity)
+
+        self._metrics.add("confirming", -1)
+        ex = future.exception()
+        if ex is None:
+            self._metrics.add("confirmed")
+            self.results.put((request, future.result()))
+        else:
+            LOGGER.debug("Confirm %s failed: %s", request, ex)
+            self._metrics.add("confirm_failed")
+            self.results.put((request, ex))
+
+        self._confirming.release()
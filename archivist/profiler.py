@@ -0,0 +1,207 @@
+"""Archivist profiler
+
+   Records the cost of each step of a story run by the runner - the wall time,
+   the number of HTTP requests, the bytes sent and received, the number of
+   requests retried after a 429 response and the time spent waiting for
+   confirmation.
+
+   For example:
+
+   .. code-block:: python
+
+      arch.profiler = Profiler()
+      arch.runner(config)
+      arch.profiler.write("profile.json")
+      print(arch.profiler.summary())
+
+   The profiler may be set before or after the archivist has made requests
+   and is removed by setting it to None.
+
+   Requests are attributed to the step running on the same thread. Requests
+   made on other threads (for example by a parallel listing) are attributed to
+   the step that is running if only one step is running, otherwise they are
+   recorded as unattributed.
+
+"""
+
+from contextlib import contextmanager, nullcontext
+from json import dump as json_dump
+from threading import Lock, local
+from time import monotonic
+from typing import TYPE_CHECKING, Any, ContextManager, Generator
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from .archivistpublic import ArchivistPublic
+
+# requests are retried after a response with this status
+TOO_MANY_REQUESTS = 429
+
+
+class StepProfile:  # pylint: disable=too-many-instance-attributes
+    """StepProfile
+
+    The cost of a step.
+
+    Args:
+        index (int): order in which the step started.
+        action (str): the action of the step.
+        description (str): the description of the step.
+        label (str): the asset or subject label of the step.
+
+    """
+
+    def __init__(
+        self,
+        index: int,
+        action: str,
+        *,
+        description: "str|None" = None,
+        label: "str|None" = None,
+    ):
+        self.index = index
+        self.action = action
+        self.description = description
+        self.label = label
+        self.seconds = 0.0
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.confirm_seconds = 0.0
+
+    def __str__(self) -> str:
+        label = f" {self.label}" if self.label else ""
+        return (
+            f"{self.index:4d} {self.action}{label}: {self.seconds:.3f}s "
+            f"requests={self.requests} sent={self.bytes_sent} "
+            f"received={self.bytes_received} retries={self.retries} "
+            f"confirm={self.confirm_seconds:.3f}s"
+        )
+
+    def dict(self) -> "dict[str, Any]":
+        """Returns the profile as a dict"""
+        return dict(vars(self))
+
+
+class Profiler:
+    """Profiler
+
+    Set as the profiler attribute of an :class:`Archivist` instance before
+    running a story.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._local = local()
+        self._active: "list[StepProfile]" = []
+        self.steps: "list[StepProfile]" = []
+        self.unattributed = StepProfile(-1, "unattributed")
+
+    def __str__(self) -> str:
+        return f"Profiler({len(self.steps)} steps)"
+
+    @contextmanager
+    def step(
+        self,
+        action: str,
+        *,
+        description: "str|None" = None,
+        label: "str|None" = None,
+    ) -> "Generator[StepProfile, None, None]":
+        """Profile the step run on this thread within the context
+
+        Args:
+            action (str): the action of the step.
+            description (str): the description of the step.
+            label (str): the asset or subject label of the step.
+
+        """
+        with self._lock:
+            profile = StepProfile(
+                len(self.steps), action, description=description, label=label
+            )
+            self.steps.append(profile)
+            self._active.append(profile)
+
+        self._local.step = profile
+        start = monotonic()
+        try:
+            yield profile
+        finally:
+            self._local.step = None
+            with self._lock:
+                profile.seconds = monotonic() - start
+                self._active.remove(profile)
+
+    @contextmanager
+    def confirming(self) -> "Generator[None, None, None]":
+        """Record the time within the context as waiting for confirmation"""
+        start = monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.__current().confirm_seconds += monotonic() - start
+
+    def response_hook(self, response: "Response", *_args, **kwargs) -> "Response":
+        """Record a request - a response hook of a requests session"""
+        sent = int(response.request.headers.get("Content-Length", 0))
+        if kwargs.get("stream"):
+            received = int(response.headers.get("Content-Length", 0))
+        else:
+            received = len(response.content or b"")
+
+        with self._lock:
+            profile = self.__current()
+            profile.requests += 1
+            profile.bytes_sent += sent
+            profile.bytes_received += received
+            if response.status_code == TOO_MANY_REQUESTS:
+                profile.retries += 1
+
+        return response
+
+    def report(self) -> "dict[str, Any]":
+        """Returns the profile of each step in the order they started"""
+        with self._lock:
+            return {
+                "steps": [s.dict() for s in self.steps],
+                "unattributed": self.unattributed.dict(),
+            }
+
+    def summary(self) -> str:
+        """Returns the profile of each step most costly first"""
+        with self._lock:
+            steps = sorted(self.steps, key=lambda s: s.seconds, reverse=True)
+            return "\n".join(str(s) for s in [*steps, self.unattributed])
+
+    def write(self, filename: str):
+        """Writes the report as JSON
+
+        Args:
+            filename (str): name of the file.
+
+        """
+        with open(filename, "w", encoding="utf-8") as fd:
+            json_dump(self.report(), fd, indent=4)
+
+    def __current(self) -> StepProfile:
+        """The profile of the step running on this thread - must hold the lock"""
+        profile = getattr(self._local, "step", None)
+        if profile is not None:
+            return profile
+
+        if len(self._active) == 1:
+            return self._active[0]
+
+        return self.unattributed
+
+
+def _confirming(archivist: "ArchivistPublic") -> "ContextManager[Any]":
+    """Record waiting for confirmation if the archivist is profiled"""
+    if archivist.profiler is None:
+        return nullcontext()
+
+    return archivist.profiler.confirming()
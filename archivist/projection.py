@@ -0,0 +1,76 @@
+"""Archivist list projection
+
+   Reduces each listed entity to a compact record holding only the
+   requested fields.
+
+   Fields are dot delimited paths into the entity. For example:
+
+   .. code-block:: python
+
+      for event in arch.events.list(
+          fields=(
+              "identity",
+              "confirmation_status",
+              "event_attributes.arc_display_type",
+          ),
+      ):
+          print(event.identity, event.event_attributes__arc_display_type)
+
+   The attribute name of each field is the path with dots replaced by double
+   underscores. The records are named tuples so that they may also be indexed
+   in the order of the fields.
+
+"""
+
+from collections import namedtuple
+from typing import Any, Iterable
+
+from .errors import ArchivistInvalidOperationError
+
+
+class _Projection:
+    """Projection of entities onto a list of fields
+
+    Missing fields have value None.
+
+    Args:
+        fields (iterable): dot delimited paths e.g. "event_attributes.arc_display_type"
+
+    """
+
+    def __init__(self, fields: "Iterable[str]"):
+        self._fields = tuple(fields)
+        if not self._fields:
+            raise ArchivistInvalidOperationError("No fields specified")
+
+        self._paths = tuple(tuple(f.split(".")) for f in self._fields)
+        self._record = namedtuple(  # pyright: ignore
+            "Record",
+            [f.replace(".", "__") for f in self._fields],
+            rename=True,
+        )
+
+    @property
+    def fields(self) -> "tuple[str, ...]":
+        """tuple: dot delimited paths of the fields"""
+        return self._fields
+
+    @property
+    def record(self) -> type:
+        """type: named tuple type of the records"""
+        return self._record
+
+    def __call__(self, entity: "dict[str, Any]") -> tuple:
+        values = []
+        for path in self._paths:
+            value = entity
+            for k in path:
+                try:
+                    value = value[k]
+                except (KeyError, TypeError):
+                    value = None
+                    break
+
+            values.append(value)
+
+        return self._record._make(values)
@@ -4,13 +4,18 @@ Base runner class for interpreting yaml story files.
 """
 
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from functools import partialmethod
+from hashlib import sha256
 from json import dumps as json_dumps
 from logging import getLogger
+from time import monotonic
 from time import sleep as time_sleep
 from types import GeneratorType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ContextManager, Generator, Iterable
 
+from .checkpoint import load_checkpoint, save_checkpoint
 from .errors import ArchivistError, ArchivistInvalidOperationError
 
 # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
@@ -24,12 +29,69 @@ LOGGER = getLogger(__name__)
 
 NOUNS = ("asset", "subject")
 
+# seconds between writes of the checkpoint file after idempotent steps
+CHECKPOINT_INTERVAL = 1.0
+
+# actions that change nothing so may be run again on resume - the checkpoint
+# file is written as soon as any other action completes
+IDEMPOTENT = (
+    "ASSETS_ATTACHMENT_INFO",
+    "ASSETS_COUNT",
+    "ASSETS_LIST",
+    "ASSETS_WAIT_FOR_CONFIRMED",
+    "COMPOSITE_ESTATE_INFO",
+    "EVENTS_COUNT",
+    "EVENTS_LIST",
+    "SUBJECTS_COUNT",
+    "SUBJECTS_LIST",
+    "SUBJECTS_READ",
+    "SUBJECTS_WAIT_FOR_CONFIRMATION",
+)
+
+
+def _idempotent(step: "dict[str, Any]") -> bool:
+    """True if the step may be run again on resume"""
+    return step.get("step", {}).get("action") in IDEMPOTENT
+
 
 def tree():
     """Recursive dict of dicts"""
     return defaultdict(tree)
 
 
+def _dependencies(steps: "list[dict[str, Any]]") -> "list[set[int]]":
+    """Indices of the earlier steps that each step depends on
+
+    A step depends on the last earlier step that uses or sets any of its
+    labels. A step without labels depends on all earlier steps and all later
+    steps depend on it.
+    """
+    dependencies = []
+    last = {}
+    barrier = set()
+    for i, step in enumerate(steps):
+        settings = step.get("step", {})
+        labels = {
+            label
+            for noun in NOUNS
+            if (label := settings.get(f"{noun}_label")) is not None
+        }
+        if labels:
+            dependencies.append({last[k] for k in labels if k in last} | barrier)
+            last.update(dict.fromkeys(labels, i))
+        else:
+            dependencies.append(set(last.values()) | barrier)
+            last = {}
+            barrier = {i}
+
+    return dependencies
+
+
+def _json_default(o):
+    """JSON for the non JSON values of a story"""
+    return sorted(o, key=str) if isinstance(o, (set, frozenset)) else str(o)
+
+
 class _ActionMap(dict):
     """
     Map of actions and keywords for an action
@@ -337,7 +399,7 @@ class _Step(dict):  # pylint:disable=too-many-instance-attributes
         return self._action_name
 
 
-class _Runner:
+class _Runner:  # pylint: disable=too-many-instance-attributes
     """
     ArchivistRunner takes a url, token_file.
     """
@@ -346,13 +408,19 @@ class _Runner:
         self._archivist = archivist_instance
         self.entities: defaultdict
         self.deletions = {}
+        self._checkpoint: "dict[str, Any]" = {}
+        self._checkpoint_filename: "str|None" = None
+        self._checkpoint_interval = CHECKPOINT_INTERVAL
+        self._saved = 0.0
+        self._unsaved = False
+        self._last = -1
 
     def __str__(self) -> str:
         return f"Runner({self._archivist.url})"
 
-    def __call__(self, config: "dict[str, Any]"):
+    def __call__(self, config: "dict[str, Any]", **kwargs):
         """
-        The dict config contains a list of `steps` to be performed serially, e.g.
+        The dict config contains a list of `steps` to be performed, e.g.
 
         ```
         "steps": [
@@ -379,20 +447,219 @@ class _Runner:
          - `attributes` are the asset's attributes
 
         To perform all the steps call the class instance.
+
+        The steps are performed serially unless max_workers is greater than 1.
+        Then steps are performed concurrently except that steps that use or
+        set the same `asset_label` or `subject_label` are performed in order
+        and a step without labels waits for all earlier steps and all later
+        steps wait for it.
+
+        If a checkpoint file is specified, the completed steps and the
+        identities of the labelled entities are recorded in it after each step
+        that changes the estate (e.g. creates an event), after other steps at
+        most once every checkpoint_interval seconds, and when the run stops.
+        With resume the completed steps are skipped and the labels are
+        restored from the checkpoint file.
+
+        Keyword arguments are those of :meth:`run_steps`.
         """
         try:
-            self.run_steps(config)
+            self.run_steps(config, **kwargs)
         except (ArchivistError, KeyError) as ex:
             LOGGER.info("Runner exception %s", ex)
 
-    def run_steps(self, config: "dict[str, Any]"):
-        """Runs all defined steps in self.config."""
+    def run_steps(
+        self,
+        config: "dict[str, Any]",
+        *,
+        max_workers: int = 1,
+        checkpoint: "str|None" = None,
+        checkpoint_interval: float = CHECKPOINT_INTERVAL,
+        resume: bool = False,
+    ):
+        """Runs all defined steps in self.config.
+
+        The steps may be any iterable, for example a generator that reads them
+        from a file as they are needed. If max_workers is greater than 1 all
+        the steps are read before any are run.
+
+        Args:
+            config (dict): the story.
+            max_workers (int): maximum number of steps run concurrently.
+            checkpoint (str): file in which progress is recorded.
+            checkpoint_interval (float): minimum seconds between writes of the
+                checkpoint file after steps that change nothing e.g. counts.
+                Such steps completed since the last write are run again on
+                resume if the process is killed. 0 writes the file after every
+                step.
+            resume (bool): skip the steps completed in the checkpoint file.
+        """
         self.entities = tree()
-        for step in config["steps"]:
-            self.run_step(step)
+        self._checkpoint_interval = checkpoint_interval
+        self.__start(checkpoint, resume)
+        steps = self.__steps(config["steps"])
+        try:
+            if max_workers > 1:
+                self.__run_concurrently(list(steps), max_workers)
+            else:
+                for i, story, step in steps:
+                    idempotent = _idempotent(step)
+                    self.run_step(step)
+                    self.__completed(i, story, idempotent)
+        finally:
+            if self._checkpoint_filename is not None and self._unsaved:
+                self.__save(self._checkpoint_filename)
 
         self._archivist.close()
 
+    def __start(self, filename: "str|None", resume: bool):
+        """Start a new checkpoint or resume from the checkpoint file"""
+        self._checkpoint_filename = filename
+        self._saved = monotonic()
+        self._unsaved = False
+        checkpoint = {}
+        if filename is not None and resume:
+            checkpoint = load_checkpoint(filename)
+
+        # steps before next and the steps in completed have been completed
+        self._checkpoint = {
+            "story": checkpoint.get("story"),
+            "next": checkpoint.get("next", 0),
+            "completed": set(checkpoint.get("completed", ())),
+            "entities": checkpoint.get("entities", {}),
+        }
+        self._last = max(
+            self._checkpoint["next"] - 1, *self._checkpoint["completed"], -1
+        )
+        for label, identity in self._checkpoint["entities"].items():
+            self.entities[label]["identity"] = identity
+
+        if self._last >= 0:
+            LOGGER.info("Resuming after step %d", self._last)
+
+    def __steps(
+        self, steps: "Iterable[dict[str, Any]]"
+    ) -> "Generator[tuple[int, str, dict[str, Any]], None, None]":
+        """Steps not completed with their index and the digest of the story
+
+        The digest is of the steps up to and including the step. No step is
+        returned until the digest of the steps up to the last completed step
+        matches the checkpoint.
+        """
+        resumed = self._last
+        matched = resumed < 0
+        held = []
+        digest = sha256()
+        for i, step in enumerate(steps):
+            digest.update(
+                json_dumps(step, sort_keys=True, default=_json_default).encode()
+            )
+            if i == resumed:
+                matched = digest.hexdigest() == self._checkpoint["story"]
+                if not matched:
+                    break
+
+                yield from held
+
+            if i >= self._checkpoint["next"] and i not in self._checkpoint["completed"]:
+                if matched:
+                    yield i, digest.hexdigest(), step
+                else:
+                    held.append((i, digest.hexdigest(), step))
+
+        if not matched:
+            raise ArchivistInvalidOperationError(
+                f"checkpoint {self._checkpoint_filename} is for a different story"
+            )
+
+    def __completed(self, index: int, story: str, idempotent: bool):
+        """Record a completed step and save the checkpoint
+
+        The checkpoint is only saved after an idempotent step if it was last
+        saved more than checkpoint_interval seconds ago.
+        """
+        checkpoint = self._checkpoint
+        checkpoint["completed"].add(index)
+        while checkpoint["next"] in checkpoint["completed"]:
+            checkpoint["completed"].remove(checkpoint["next"])
+            checkpoint["next"] += 1
+
+        if index > self._last:
+            self._last = index
+            checkpoint["story"] = story
+
+        if self._checkpoint_filename is None:
+            return
+
+        self._unsaved = True
+        if not idempotent or monotonic() - self._saved >= self._checkpoint_interval:
+            self.__save(self._checkpoint_filename)
+
+    def __save(self, filename: str):
+        """Write the checkpoint file
+
+        The labelled entities are only collected when the file is written so
+        that the cost of a step does not grow with the number of entities.
+        """
+        checkpoint = self._checkpoint
+        checkpoint["entities"].update(
+            (label, entity["identity"])
+            for label, entity in list(self.entities.items())
+            if isinstance(entity.get("identity"), str)
+        )
+
+        save_checkpoint(
+            filename,
+            {**checkpoint, "completed": sorted(checkpoint["completed"])},
+        )
+        self._saved = monotonic()
+        self._unsaved = False
+
+    def __run_concurrently(
+        self, steps: "list[tuple[int, str, dict[str, Any]]]", max_workers: int
+    ):
+        """Runs each step when the steps it depends on have completed"""
+        dependencies = _dependencies([step for _, _, step in steps])
+        idempotent = [_idempotent(step) for _, _, step in steps]
+        waiting = [len(d) for d in dependencies]
+        dependents = defaultdict(list)
+        for i, depends in enumerate(dependencies):
+            for j in depends:
+                dependents[j].append(i)
+
+        # create the endpoint clients before they are shared between threads
+        _ActionMap(self._archivist)
+
+        # an exception stops further steps and is raised once the running
+        # steps complete - steps that succeed are still recorded as completed
+        error: "BaseException|None" = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {
+                executor.submit(self.run_step, steps[i][2]): i
+                for i, n in enumerate(waiting)
+                if n == 0
+            }
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    exception = future.exception()
+                    if exception is not None:
+                        error = error or exception
+                        continue
+
+                    self.__completed(*steps[i][:2], idempotent[i])
+                    if error is not None:
+                        continue
+
+                    for j in dependents[i]:
+                        waiting[j] -= 1
+                        if waiting[j] == 0:
+                            running[executor.submit(self.run_step, steps[j][2])] = j
+
+        if error is not None:
+            raise error
+
     def run_step(self, step: "dict[str, Any]"):
         """Runs a step given parameters and the type of step.
 
@@ -403,23 +670,36 @@ class _Runner:
         # get step settings
         s = _Step(self._archivist, **step.pop("step"))
 
-        # output description
-        s.description()
+        with self.__profile(s):
+            # output description
+            s.description()
 
-        # this is a bit clunky...
-        s.init_args(self.identity, step)
+            # this is a bit clunky...
+            s.init_args(self.identity, step)
 
-        # wait for a number of seconds and then execute
-        s.wait_time()
-        response = s.execute()
+            # wait for a number of seconds and then execute
+            s.wait_time()
+            response = s.execute()
 
-        s.print_response(response)
+            s.print_response(response)
 
         for noun in NOUNS:
             label = s.get(f"{noun}_label")
             if s.label("set", noun) and label is not None:
                 self.entities[label] = response
 
+    def __profile(self, s: _Step) -> "ContextManager[Any]":
+        """Profile the step if the archivist is profiled"""
+        profiler = self._archivist.profiler
+        if profiler is None:
+            return nullcontext()
+
+        return profiler.step(
+            s.action_name,
+            description=s.get("description"),
+            label=s.get("asset_label", s.get("subject_label")),
+        )
+
     def identity(self, name: str) -> "str|None":
         """Gets entity id"""
 
@@ -0,0 +1,136 @@
+"""Streaming story reader
+
+   Reads the steps of a yaml story one at a time so that the runner can start
+   at once and the steps are not all held in memory.
+
+   For example:
+
+   .. code-block:: python
+
+      with open("story.yaml", "r", encoding="utf-8") as yml:
+          arch.runner({"steps": iter_steps(yml)})
+
+   Environment variables are substituted in values tagged with !ENV as
+   pyaml_env.parse_config does - ${VAR:default} is replaced by the value of VAR
+   or default (N/A if there is no default). Anchors may refer to earlier steps.
+   Keys of the story other than steps are read and discarded.
+
+"""
+
+from logging import getLogger
+from os import environ
+from re import compile as re_compile
+from typing import IO, Any, Generator
+
+from yaml import (
+    MappingEndEvent,
+    MappingStartEvent,
+    SafeLoader,
+    ScalarNode,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+
+from .errors import ArchivistInvalidOperationError
+
+LOGGER = getLogger(__name__)
+
+STEPS = "steps"
+
+# the tag, variables, default value and type tags of pyaml_env.parse_config
+ENV_TAG = "!ENV"
+ENV_VARIABLE = re_compile(r"\$\{([^}{:]+)(?::([^}]+))?\}")
+ENV_DEFAULT = "N/A"
+TYPE_TAG = re_compile(r"(tag:yaml\.org,2002:\w+)\s")
+
+
+class _Loader(SafeLoader):  # pylint: disable=too-many-ancestors
+    """Safe loader that substitutes environment variables tagged with !ENV"""
+
+
+def _construct_env(loader: _Loader, node: ScalarNode) -> Any:
+    """Substitute the environment variables in a scalar tagged with !ENV
+
+    A type tag before the variables e.g. tag:yaml.org,2002:int converts the
+    substituted value.
+    """
+    value = loader.construct_scalar(node)
+    type_tag = TYPE_TAG.match(value)
+    if type_tag is not None:
+        value = value[type_tag.end() :]
+
+    value = ENV_VARIABLE.sub(lambda m: environ.get(m[1], m[2] or ENV_DEFAULT), value)
+    if type_tag is None:
+        return value
+
+    tag = type_tag[1]
+    return loader.yaml_constructors[tag](loader, ScalarNode(tag, value))
+
+
+_Loader.add_implicit_resolver(ENV_TAG, ENV_VARIABLE, [ENV_TAG])
+_Loader.add_constructor(ENV_TAG, _construct_env)
+
+
+def iter_steps(stream: "IO[str]") -> "Generator[dict[str, Any], None, None]":
+    """Steps of a yaml story
+
+    Args:
+        stream (file): the yaml story.
+
+    Returns:
+        iterable of each step as it is read.
+
+    Raises:
+        ArchivistInvalidOperationError: if the story is not a mapping, has
+            more than one steps key or the steps are not a list.
+
+    """
+    loader = _Loader(stream)
+
+    def construct() -> Any:
+        """Construct the next node"""
+        node = loader.compose_node(None, None)  # pyright: ignore
+        return loader.construct_document(node)
+
+    try:
+        loader.get_event()  # start of stream
+        if loader.check_event(StreamEndEvent):
+            return
+
+        loader.get_event()  # start of document
+        if not loader.check_event(MappingStartEvent):
+            raise ArchivistInvalidOperationError("story is not a mapping")
+
+        loader.get_event()
+        read = False
+        while not loader.check_event(MappingEndEvent):
+            key = construct()
+            if key != STEPS:
+                LOGGER.debug("Discard %s", key)
+                construct()
+                continue
+
+            if read:
+                raise ArchivistInvalidOperationError(
+                    "story has more than one steps key"
+                )
+
+            read = True
+            if not loader.check_event(SequenceStartEvent):
+                # empty or an alias of a list
+                steps = construct()
+                if not isinstance(steps, (list, type(None))):
+                    raise ArchivistInvalidOperationError("steps is not a list")
+
+                yield from steps or ()
+                continue
+
+            loader.get_event()
+            while not loader.check_event(SequenceEndEvent):
+                yield construct()
+
+            loader.get_event()
+
+    finally:
+        loader.dispose()
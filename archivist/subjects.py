@@ -28,12 +28,13 @@ from typing import TYPE_CHECKING, Any
 
 # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
 from . import subjects_confirmer
+from .confirmation_policy import ConfirmationPolicy
 from .constants import (
     SUBJECTS_LABEL,
     SUBJECTS_SELF_ID,
     SUBJECTS_SUBPATH,
 )
-from .dictmerge import _deepmerge
+from .dictmerge import _merge
 
 if TYPE_CHECKING:
     from .archivist import Archivist
@@ -62,6 +63,9 @@ class _SubjectsClient:
         self._archivist = archivist_instance
         self._subpath = f"{archivist_instance.root}/{SUBJECTS_SUBPATH}"
         self._label = f"{self._subpath}/{SUBJECTS_LABEL}"
+        self.confirmation_policy = ConfirmationPolicy(
+            max_time=archivist_instance.max_time
+        )
 
     def __str__(self) -> str:
         return f"SubjectsClient({self._archivist.url})"
@@ -152,7 +156,7 @@ class _SubjectsClient:
 
         """
         LOGGER.debug("Create Subject from data %s", data)
-        return Subject(**self._archivist.post(self._label, data))
+        return Subject(self._archivist.post(self._label, data))
 
     def create_from_b64(self, data: "dict[str, Any]") -> Subject:
         """Create subject
@@ -183,23 +187,29 @@ class _SubjectsClient:
         outdata["display_name"] = data["display_name"]
         LOGGER.debug("data %s", outdata)
 
-        return Subject(**self._archivist.post(self._label, outdata))
+        return Subject(self._archivist.post(self._label, outdata))
 
-    def wait_for_confirmation(self, identity: str) -> Subject:
+    def wait_for_confirmation(
+        self, identity: str, *, policy: "ConfirmationPolicy|None" = None
+    ) -> Subject:
         """Wait for subject to be confirmed.
 
-        Waits for subject to be confirmed.
+        Waits for subject to be confirmed. The time taken is recorded by the
+        policy.
 
         Args:
             identity (str): identity of asset
+            policy (ConfirmationPolicy): optional policy used instead of
+                confirmation_policy.
 
         Returns:
             True if subject is confirmed.
 
         """
-        subjects_confirmer.MAX_TIME = self._archivist.max_time
         # pylint: disable=protected-access
-        return subjects_confirmer._wait_for_confirmation(self, identity)
+        return subjects_confirmer._wait_for_confirmation(
+            self, identity, policy or self.confirmation_policy
+        )
 
     def read(self, identity: str) -> Subject:
         """Read Subject
@@ -213,7 +223,7 @@ class _SubjectsClient:
             :class:`Subject` instance
 
         """
-        return Subject(**self._archivist.get(f"{self._subpath}/{identity}"))
+        return Subject(self._archivist.get(f"{self._subpath}/{identity}"))
 
     def update(
         self,
@@ -238,7 +248,7 @@ class _SubjectsClient:
 
         """
         return Subject(
-            **self._archivist.patch(
+            self._archivist.patch(
                 f"{self._subpath}/{identity}",
                 self.__params(
                     display_name=display_name,
@@ -280,7 +290,7 @@ class _SubjectsClient:
         if tessera_pub_key is not None:
             params["tessera_pub_key"] = tessera_pub_key
 
-        return _deepmerge(self._archivist.fixtures.get(SUBJECTS_LABEL), params)
+        return _merge(self._archivist.fixtures.get(SUBJECTS_LABEL), params)
 
     def count(self, *, display_name: "str|None" = None) -> int:
         """Count subjects.
@@ -320,7 +330,7 @@ class _SubjectsClient:
 
         LOGGER.debug("List '%s'", display_name)
         return (
-            Subject(**a)
+            Subject(a)
             for a in self._archivist.list(
                 self._label,
                 SUBJECTS_LABEL,
@@ -4,9 +4,8 @@
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-import backoff
-
 if TYPE_CHECKING:
+    from .confirmation_policy import ConfirmationPolicy
     from .subjects import Subject, _SubjectsClient
 
 from .confirmation_status import ConfirmationStatus
@@ -14,19 +13,11 @@ from .constants import (
     CONFIRMATION_STATUS,
 )
 from .errors import ArchivistUnconfirmedError
-
-# pylint:disable=cyclic-import      # but pylint doesn't understand this feature
-from .utils import backoff_handler
-
-MAX_TIME = 300
+from .profiler import _confirming
 
 LOGGER = getLogger(__name__)
 
 
-def __lookup_max_time():
-    return MAX_TIME
-
-
 def __on_giveup_confirmation(details):
     identity = details["args"][1]
     elapsed = details["elapsed"]
@@ -35,15 +26,17 @@ def __on_giveup_confirmation(details):
     )
 
 
-@backoff.on_predicate(
-    backoff.expo,
-    max_value=30.0,
-    logger=None,  # pyright: ignore
-    max_time=__lookup_max_time,
-    on_backoff=backoff_handler,
-    on_giveup=__on_giveup_confirmation,
-)
-def _wait_for_confirmation(self: "_SubjectsClient", identity: str) -> "Subject":
+def _wait_for_confirmation(
+    self: "_SubjectsClient", identity: str, policy: "ConfirmationPolicy"
+) -> "Subject":
+    """Wait for subject to be confirmed polling as the policy directs"""
+    with _confirming(self._archivist):  # pylint: disable=protected-access
+        return policy.wait(
+            __confirmation, self, identity, on_giveup=__on_giveup_confirmation
+        )
+
+
+def __confirmation(self: "_SubjectsClient", identity: str) -> "Subject":
     """Return None until subjects is confirmed"""
     subject = self.read(identity)
     if CONFIRMATION_STATUS not in subject:
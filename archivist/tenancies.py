@@ -21,14 +21,21 @@
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Generator, Iterable
 
 if TYPE_CHECKING:
     # pylint:disable=cyclic-import      # but pylint doesn't understand this feature
     from .archivist import Archivist
 
+from .cache import _LRUCache
 from .constants import (
+    MAX_WORKERS,
+    TENANCIES_BATCH_SIZE,
+    TENANCIES_CACHE_SIZE,
+    TENANCIES_IDENTITY,
     TENANCIES_LABEL,
     TENANCIES_PREFIX,
     TENANCIES_SUBPATH,
@@ -58,6 +65,7 @@ class _TenanciesClient:
         self._archivist = archivist_instance
         self._subpath = f"{archivist_instance.root}/{TENANCIES_SUBPATH}"
         self._label = f"{self._subpath}/{TENANCIES_LABEL}"
+        self._cache = _LRUCache(TENANCIES_CACHE_SIZE)
 
     def __str__(self) -> str:
         return f"TenanciesClient({self._archivist.url})"
@@ -88,7 +96,83 @@ class _TenanciesClient:
 
         """
         return Tenant(
-            **self._archivist.get(
+            self._archivist.get(
                 f"{self._subpath}/{self._identity(identity)}:publicinfo"
             )
         )
+
+    def publicinfo_many(
+        self, identities: "Iterable[str]", *, max_workers: int = MAX_WORKERS
+    ) -> "dict[str, Tenant]":
+        """Read Tenant public info for many tenants
+
+        Identities are normalised so that 'tenant/' and 'tenancies/' forms of the
+        same tenant are only fetched once. Tenants not already in the cache are
+        fetched concurrently and added to the cache.
+
+        Args:
+            identities (iterable): tenancies identities in either form.
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            dict of :class:`Tenant` instances keyed by the identities as given.
+
+        """
+        keys = {identity: self._identity(identity) for identity in identities}
+
+        tenants = {}
+        missing = []
+        for key in dict.fromkeys(keys.values()):
+            tenant = self._cache.get(key)
+            if tenant is None:
+                missing.append(key)
+            else:
+                tenants[key] = tenant
+
+        if missing:
+            LOGGER.debug("Fetch %d tenants", len(missing))
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(missing))
+            ) as executor:
+                for key, tenant in zip(missing, executor.map(self.publicinfo, missing)):
+                    self._cache.set(key, tenant)
+                    tenants[key] = tenant
+
+        return {identity: tenants[key] for identity, key in keys.items()}
+
+    def resolve(
+        self,
+        entities: "Iterable[dict[str, Any]]",
+        *,
+        batch_size: int = TENANCIES_BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> "Generator[tuple[dict[str, Any], Tenant|None], None, None]":
+        """Resolve the tenant of each entity
+
+        Pairs each entity (usually an :class:`Event` or :class:`Asset`) with the public
+        info of the tenant in its 'tenant_identity' field. The entities are consumed
+        in batches of batch_size and the distinct tenants of each batch are
+        prefetched with :meth:`publicinfo_many`.
+
+        Args:
+            entities (iterable): entities e.g. output from events.list()
+            batch_size (int): number of entities read ahead.
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            iterable of tuples of entity and :class:`Tenant` instance. The tenant is None
+            if the entity has no tenant identity.
+
+        """
+        entities = iter(entities)
+        while True:
+            batch = list(islice(entities, batch_size))
+            if not batch:
+                return
+
+            tenants = self.publicinfo_many(
+                (e[TENANCIES_IDENTITY] for e in batch if e.get(TENANCIES_IDENTITY)),
+                max_workers=max_workers,
+            )
+            for e in batch:
+                yield e, tenants.get(e.get(TENANCIES_IDENTITY))  # pyright: ignore
@@ -4,11 +4,14 @@
 
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
 
 from iso8601 import parse_date
 from rfc3339 import rfc3339
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 def parse_timestamp(date_string: str):
     """Parse an Archivist timestamp to a datetime object
@@ -25,6 +28,84 @@ def parse_timestamp(date_string: str):
     return parse_date(date_string)
 
 
+def __minute(prefix: str) -> int:
+    """Return YYYY-MM-DDTHH:MM as microseconds since the epoch"""
+    if prefix[4] != "-" or prefix[7] != "-" or prefix[10] != "T" or prefix[13] != ":":
+        raise ValueError(prefix)
+
+    # int() also accepts signs, spaces and underscores
+    fields = (prefix[:4], prefix[5:7], prefix[8:10], prefix[11:13], prefix[14:])
+    if not all(f.isdigit() for f in fields):
+        raise ValueError(prefix)
+
+    delta = datetime(*map(int, fields), tzinfo=timezone.utc) - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000
+
+
+def __epoch(date_string: str, minutes: "dict[str, int]") -> int:
+    """Return an Archivist timestamp as microseconds since the epoch
+
+    Fast path for the fixed formats emitted by the Archivist i.e.
+    YYYY-MM-DDTHH:MM:SSZ with optional fractional seconds. Any other format
+    is parsed by iso8601.
+
+    Timestamps in a batch are usually close together so the start of each
+    minute is cached in minutes.
+    """
+    try:
+        # str.isdigit() is also true of non-ASCII digits
+        if date_string[16] == ":" and date_string[-1] == "Z" and date_string.isascii():
+            seconds = date_string[17:19]
+            fraction = date_string[19:-1]
+            if not seconds.isdigit() or seconds > "59":
+                raise ValueError(seconds)
+
+            if not fraction:
+                microseconds = 0
+            elif fraction[0] == "." and fraction[1:].isdigit():
+                microseconds = int(fraction[1:7].ljust(6, "0"))
+            else:
+                raise ValueError(fraction)
+
+            prefix = date_string[:16]
+            try:
+                minute = minutes[prefix]
+            except KeyError:
+                minute = minutes[prefix] = __minute(prefix)
+
+            return minute + int(seconds) * 1000000 + microseconds
+
+    except (IndexError, ValueError):
+        pass
+
+    delta = parse_date(date_string) - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def parse_timestamps(date_strings: "Iterable[str|None]", *, epoch: bool = True) -> list:
+    """Parse a batch of Archivist timestamps
+
+    The fixed formats emitted by the Archivist are parsed directly. Any
+    other format is parsed by iso8601.
+
+    Args:
+        date_strings (iterable): strings representing date and time in ISO8601 format.
+        epoch (bool): if True return microseconds since the epoch (0 for a
+            missing timestamp) otherwise return UTC datetime objects (None for a
+            missing timestamp).
+
+    Returns:
+        list of integers or datetime objects
+
+    """
+    minutes = {}
+    values = [__epoch(d, minutes) if d else None for d in date_strings]
+    if epoch:
+        return [0 if v is None else v for v in values]
+
+    return [None if v is None else EPOCH + timedelta(microseconds=v) for v in values]
+
+
 def make_timestamp(date_object: datetime):
     """Format a datetime object into an Archivist format timestamp string
 
@@ -0,0 +1,9 @@
+"""Archivist microbenchmarks
+
+   Each module can be executed directly e.g.
+
+   .. code-block:: shell
+
+      python3 -m benchmarks.benchfixtures
+
+"""
@@ -0,0 +1,70 @@
+"""Create allocations benchmark
+
+   Measures the peak memory allocated per event create for an event with a large
+   attribute map. The network is replaced by a post that returns the request
+   body unchanged.
+
+   before: deepcopy of the request body (as done previously by create_from_data)
+   after:  copy-free create_from_data
+"""
+
+# pylint:  disable=missing-docstring
+
+from copy import deepcopy
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+from unittest import mock
+
+from archivist.archivist import Archivist
+
+NUMBER = 1000
+
+ASSET_ID = "assets/xxxxxxxxxxxxxxxxxxxx"
+DATA = {
+    "operation": "Record",
+    "behaviour": "RecordEvidence",
+    "event_attributes": {
+        f"attribute_{i}": {"value": f"value_{i}", "unit": "unit"} for i in range(200)
+    },
+}
+
+
+def post(_url, request, **_kwargs):
+    return {"identity": f"{ASSET_ID}/events/yyyyyyyyyyyyyyyyyyyy", **request}
+
+
+def before(arch):
+    return arch.events.create_from_data(ASSET_ID, deepcopy(DATA))
+
+
+def after(arch):
+    return arch.events.create_from_data(ASSET_ID, DATA)
+
+
+def report(name, func, arch):
+    start()
+    peak = 0
+    for _ in range(NUMBER):
+        current, _ = get_traced_memory()
+        reset_peak()
+        func(arch)
+        peak = max(peak, get_traced_memory()[1] - current)
+
+    stop()
+    print(f"{name:8} {peak:8d} bytes peak per create")
+    return peak
+
+
+def main():
+    arch = Archivist("url", "authauthauth")
+    with mock.patch.object(arch, "post", new=post):
+        assert before(arch) == after(arch)
+        b = report("before", before, arch)
+        a = report("after", after, arch)
+
+    arch.close()
+
+    print(f"ratio    {b / a:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
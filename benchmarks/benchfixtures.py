@@ -0,0 +1,57 @@
+"""Fixtures merging benchmark
+
+   Measures the per-call overhead of merging fixtures with the params
+   of a request, as done by every assets and events count, list and create.
+
+   before: deepcopy of the params followed by flatten/unflatten (_deepmerge)
+   after:  single recursive merge (_merge)
+"""
+
+# pylint:  disable=missing-docstring
+
+from copy import deepcopy
+from timeit import repeat
+
+from archivist.dictmerge import _deepmerge, _merge
+
+NUMBER = 10000
+
+FIXTURES = {
+    "attributes": {
+        "arc_namespace": "namespace",
+    },
+}
+PROPS = {
+    "behaviours": ["RecordEvidence"],
+    "public": False,
+}
+ATTRS = {f"attribute_{i}": f"value_{i}" for i in range(20)}
+
+
+def before():
+    params = deepcopy(PROPS)
+    params["attributes"] = ATTRS
+    return _deepmerge(FIXTURES, params)
+
+
+def after():
+    params = {**PROPS}
+    params["attributes"] = ATTRS
+    return _merge(FIXTURES, params)
+
+
+def report(name, func):
+    best = min(repeat(func, number=NUMBER, repeat=5))
+    print(f"{name:8} {best / NUMBER * 1e6:8.2f} us per call")
+    return best
+
+
+def main():
+    assert before() == after()
+    b = report("before", before)
+    a = report("after", after)
+    print(f"speedup  {b / a:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Events list benchmark
+
+   Measures the time taken to list a large synthetic page of events. The
+   network is replaced by a get that returns the encoded page.
+
+   before: every decoded record kept by the page and rebuilt using Event(**record)
+   after:  events.list - each record released by the page and copied once by Event(record)
+"""
+
+# pylint:  disable=missing-docstring
+
+from collections import deque
+from json import dumps
+from timeit import repeat
+from unittest import mock
+
+from requests import Response
+
+from archivist.archivist import Archivist
+from archivist.events import Event
+
+NUMBER = 10
+RECORDS = 10000
+
+ASSET_ID = "assets/xxxxxxxxxxxxxxxxxxxx"
+PAGE = dumps(
+    {
+        "events": [
+            {
+                "identity": f"{ASSET_ID}/events/{i:020d}",
+                "asset_identity": ASSET_ID,
+                "operation": "Record",
+                "behaviour": "RecordEvidence",
+                "timestamp_declared": "2019-11-27T14:44:19Z",
+                "timestamp_accepted": "2019-11-27T14:44:19Z",
+                "timestamp_committed": "2019-11-27T14:44:19Z",
+                "principal_declared": {"issuer": "idp", "subject": "bob"},
+                "principal_accepted": {"issuer": "idp", "subject": "bob"},
+                "confirmation_status": "CONFIRMED",
+                "event_attributes": {f"attribute_{j}": f"value_{j}" for j in range(20)},
+                "asset_attributes": {},
+            }
+            for i in range(RECORDS)
+        ],
+    }
+).encode()
+
+
+def get(*_args, **_kwargs):
+    response = Response()
+    response.status_code = 200
+    response._content = PAGE  # pylint: disable=protected-access
+    return response
+
+
+def before(arch):
+    records = arch.session.get().json()["events"]
+    for r in records:
+        yield Event(**r)
+
+
+def after(arch):
+    return arch.events.list(asset_id=ASSET_ID)
+
+
+def report(name, func, arch):
+    best = min(repeat(lambda: deque(func(arch), maxlen=0), number=1, repeat=NUMBER))
+    print(f"{name:8} {best * 1e3:8.2f} ms for {RECORDS} events")
+    return best
+
+
+def main():
+    arch = Archivist("url", "authauthauth")
+    with mock.patch.object(arch.session, "get", new=get):
+        assert list(before(arch)) == list(after(arch))
+        b = report("before", before, arch)
+        a = report("after", after, arch)
+
+    arch.close()
+    print(f"speedup  {b / a:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
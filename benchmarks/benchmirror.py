@@ -0,0 +1,118 @@
+"""Mirror query benchmark
+
+   Measures the time taken to list the events of one asset with a given
+   display type. A local HTTP server stands in for the API and serves the
+   matching events in pages of 500.
+
+   remote: events.list against the stand-in server
+   local:  events.list against a mirror synced from the stand-in server
+"""
+
+# pylint:  disable=missing-docstring
+
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Thread
+from timeit import repeat
+from urllib.parse import parse_qs, urlparse
+
+from archivist.archivist import Archivist
+from archivist.mirror import Mirror
+from archivist.mirrorquery import _matches
+
+NUMBER = 5
+ASSETS = 100
+EVENTS = 200
+PAGE_SIZE = 500
+ASSET_ID = "assets/00000000000000000042"
+ATTRS = {"arc_display_type": "open"}
+
+EVENTS_LIST = [
+    {
+        "identity": f"assets/{a:020d}/events/{e:020d}",
+        "asset_identity": f"assets/{a:020d}",
+        "operation": "Record",
+        "behaviour": "RecordEvidence",
+        "timestamp_committed": f"2019-11-27T14:{e // 60:02d}:{e % 60:02d}Z",
+        "confirmation_status": "CONFIRMED",
+        "event_attributes": {
+            "arc_display_type": ("open", "close")[e % 2],
+            **{f"attribute_{j}": f"value_{j}" for j in range(20)},
+        },
+    }
+    for a in range(ASSETS)
+    for e in range(EVENTS)
+]
+ASSETS_LIST = [
+    {"identity": f"assets/{a:020d}", "attributes": {"arc_display_type": "door"}}
+    for a in range(ASSETS)
+]
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        start = int(query.get("page_token", ["0"])[0])
+        if url.path.endswith("/assets"):
+            label, records = "assets", ASSETS_LIST
+        else:
+            label = "events"
+            asset_id = url.path.split("/v2/")[1].rsplit("/events", 1)[0]
+            display_type = query.get("event_attributes.arc_display_type")
+            records = [
+                e
+                for e in EVENTS_LIST
+                if asset_id in ("assets/-", e["asset_identity"])
+                and (display_type is None or _matches(e["event_attributes"], ATTRS))
+            ]
+
+        page = {label: records[start : start + PAGE_SIZE]}
+        if start + PAGE_SIZE < len(records):
+            page["next_page_token"] = str(start + PAGE_SIZE)
+
+        body = dumps(page).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def report(name, func):
+    best = min(repeat(lambda: deque(func(), maxlen=0), number=1, repeat=NUMBER))
+    print(f"{name:8} {best * 1e3:8.2f} ms")
+    return best
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    arch = Archivist(f"http://127.0.0.1:{server.server_port}", "authauthauth")
+    with Mirror(arch, ":memory:", page_size=PAGE_SIZE) as mirror:
+        mirror.sync()
+
+        def remote():
+            return arch.events.list(asset_id=ASSET_ID, attrs=ATTRS)
+
+        def local():
+            return mirror.events.list(asset_id=ASSET_ID, attrs=ATTRS)
+
+        assert sorted(e["identity"] for e in remote()) == sorted(
+            e["identity"] for e in local()
+        )
+        print(f"{EVENTS // 2} of {ASSETS * EVENTS} events")
+        r = report("remote", remote)
+        b = report("local", local)
+
+    arch.close()
+    server.shutdown()
+    print(f"speedup  {r / b:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Query parameter encoding benchmark
+
+   Measures the per-page overhead of encoding the params of a list or count
+   request into the url, as done for every page of assets and events lists
+   and every poll of wait_for_confirmed.
+
+   before: params flattened to dot delimited keys and encoded by requests
+   after:  params encoded (and memoised) by _querystring
+"""
+
+# pylint:  disable=missing-docstring
+
+from timeit import repeat
+
+from flatten_dict import flatten
+from requests import Request
+
+from archivist.dictmerge import _querystring
+
+NUMBER = 10000
+URL = "https://app.datatrails.ai/archivist/v2/assets"
+
+PARAMS = {
+    "attributes": {
+        "arc_display_type": "Traffic light",
+        "arc_namespace": "namespace",
+        "arc_firmware_version": "1.0",
+    },
+    "confirmation_status": "CONFIRMED",
+    "page_size": 500,
+}
+
+
+def prepare(params):
+    return Request("GET", URL, params=params).prepare().url
+
+
+def before():
+    return prepare(flatten(PARAMS, reducer="dot"))
+
+
+def after():
+    return prepare(_querystring(PARAMS))
+
+
+def report(name, func):
+    best = min(repeat(func, number=NUMBER, repeat=5))
+    print(f"{name:8} {best / NUMBER * 1e6:8.2f} us per call")
+    return best
+
+
+def main():
+    assert before() == after()
+    b = report("before", before)
+    a = report("after", after)
+    print(f"speedup  {b / a:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Timestamp parsing benchmark
+
+   Measures the time taken to convert a batch of Archivist timestamps into
+   microseconds since the epoch, as done when converting events to columns.
+
+   before: parse_timestamp (iso8601) for each timestamp
+   after:  parse_timestamps for the batch
+"""
+
+# pylint:  disable=missing-docstring
+
+from datetime import datetime, timedelta, timezone
+from timeit import repeat
+
+from archivist.timestamp import parse_timestamp, parse_timestamps
+
+NUMBER = 100000
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# timestamps about a second apart, half with fractional seconds
+TIMESTAMPS = [
+    (EPOCH + timedelta(days=19723, microseconds=i * 1000003)).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ" if i % 2 else "%Y-%m-%dT%H:%M:%SZ"
+    )
+    for i in range(NUMBER)
+]
+
+
+def before():
+    result = []
+    for t in TIMESTAMPS:
+        delta = parse_timestamp(t) - EPOCH
+        result.append(
+            (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        )
+
+    return result
+
+
+def after():
+    return parse_timestamps(TIMESTAMPS)
+
+
+def report(name, func):
+    best = min(repeat(func, number=1, repeat=5))
+    print(f"{name:8} {best * 1e3:8.2f} ms for {NUMBER} timestamps")
+    return best
+
+
+def main():
+    assert before() == after()
+    b = report("before", before)
+    a = report("after", after)
+    print(f"speedup  {b / a:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
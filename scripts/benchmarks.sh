@@ -0,0 +1,22 @@
+#!/bin/bash
+#
+# run microbenchmarks
+#
+python3 --version
+
+# run single benchmark from cmdline for example:
+#
+#       BENCHMARK=benchfixtures task benchmarks
+#
+if [ -n "${BENCHMARK}" ]
+then
+    python3 -m benchmarks.${BENCHMARK}
+    exit 0
+fi
+
+for benchmark in benchmarks/bench*.py
+do
+    module=$(basename ${benchmark} .py)
+    echo "${module}"
+    python3 -m benchmarks.${module}
+done
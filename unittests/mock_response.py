@@ -4,7 +4,10 @@ Mock response object
 
 import json
 
+from archivist.constants import HEADERS_TOTAL_COUNT
+
 # pylint: disable=missing-docstring
+# pylint: disable=too-few-public-methods
 
 
 class MockResponse(dict):
@@ -49,3 +52,29 @@ class MockResponse(dict):
 
     def iter_content(self, chunk_size=4096):
         return self._iter_content(chunk_size=chunk_size)
+
+
+class MockCounts:
+    """Mock GET returning successive counts for each confirmation status
+
+    Counts of all entities (no confirmation_status) are keyed "total". The
+    counts of a round are made concurrently so responses are selected by the
+    params and not by the order of the calls.
+    """
+
+    def __init__(self, **counts):
+        self._counts = {k: iter(v) for k, v in counts.items()}
+        self.params = []
+
+    def __call__(self, url, **kwargs):
+        params = kwargs["params"]
+        self.params.append(params)
+        status = "total"
+        for param in params.split("&"):
+            key, _, value = param.partition("=")
+            if key == "confirmation_status":
+                status = value
+
+        return MockResponse(
+            200, headers={HEADERS_TOTAL_COUNT: next(self._counts[status])}
+        )
@@ -311,7 +311,7 @@ class TestAccessPolicies(TestCase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 1},
+                        "params": "page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -348,10 +348,7 @@ class TestAccessPolicies(TestCase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "page_size": 1,
-                            "display_name": "Policy display name",
-                        },
+                        "params": "display_name=Policy+display+name&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -437,7 +434,7 @@ class TestAccessPolicies(TestCase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {"display_name": "Policy display name"},
+                            "params": "display_name=Policy+display+name",
                         },
                     ),
                     msg="GET method called incorrectly",
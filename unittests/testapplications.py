@@ -223,7 +223,7 @@ class TestApplications(TestCase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {},
+                            "params": None,
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -268,9 +268,7 @@ class TestApplications(TestCase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {
-                                "display_name": "Application display name",
-                            },
+                            "params": "display_name=Application+display+name",
                         },
                     ),
                     msg="GET method called incorrectly",
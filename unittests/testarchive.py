@@ -0,0 +1,208 @@
+"""
+Test archive
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+# pylint: disable=too-few-public-methods
+
+from collections import namedtuple
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from archivist.archive import ArchiveReader, ArchiveWriter
+from archivist.columns import DictionaryColumn, to_column_batches, to_columns
+from archivist.errors import ArchivistInvalidOperationError
+
+Record = namedtuple(
+    "Record",
+    (
+        "identity",
+        "timestamp_committed",
+        "event_attributes__arc_display_type",
+        "count",
+        "other",
+    ),
+)
+
+RECORDS = (
+    Record("events/3", "1970-01-01T00:00:03Z", "open", 3, {"a": 1}),
+    Record("events/1", "1970-01-01T00:00:01Z", "open", 1, None),
+    Record("events/5", "1970-01-01T00:00:05Z", "close", 5, [1]),
+    Record("events/2", "1970-01-01T00:00:02Z", "open", 2, "x"),
+    Record("events/4", "1970-01-01T00:00:04Z", None, 4, 4),
+)
+
+
+class TestArchive(TestCase):
+    """
+    Test archive
+    """
+
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = path.join(self.tmpdir.name, "events.arc")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, batch_size=3):
+        with open(self.path, "wb") as fd:
+            writer = ArchiveWriter(fd)
+            for columns in to_column_batches(RECORDS, batch_size=batch_size):
+                writer.write(columns)
+
+    def reader(self):
+        with open(self.path, "rb") as fd:
+            return ArchiveReader(fd)
+
+    def test_archive_batches(self):
+        """
+        Test archive batches are the written columns
+        """
+        self.write(batch_size=5)
+        with self.reader() as reader:
+            self.assertEqual(
+                reader.rows,
+                5,
+                msg="Incorrect number of rows",
+            )
+            batches = list(reader.batches())
+            expected = to_columns(RECORDS)
+            self.assertEqual(
+                {k: list(v) for k, v in batches[0].items()},
+                {k: list(v) for k, v in expected.items()},
+                msg="Incorrect columns",
+            )
+            self.assertIsInstance(
+                batches[0]["event_attributes__arc_display_type"],
+                DictionaryColumn,
+                msg="Dictionary column not read",
+            )
+            del batches
+
+    def test_archive_dictionary_lazy(self):
+        """
+        Test dictionary strings are decoded when first used
+        """
+        self.write(batch_size=5)
+        with self.reader() as reader:
+            column = next(reader.batches())["event_attributes__arc_display_type"]
+            decoded = column.values._decoded
+            self.assertEqual(
+                decoded, [None] * len(column.values), msg="Decoded when opened"
+            )
+            value = column[0]
+            self.assertEqual(
+                [v for v in decoded if v is not None],
+                [value],
+                msg="Only the used string should be decoded",
+            )
+            self.assertIs(column[0], value, msg="Decoded string should be reused")
+            del column, decoded
+
+    def test_archive_find(self):
+        """
+        Test archive find by identity
+        """
+        self.write()
+        with self.reader() as reader:
+            self.assertEqual(
+                reader.find("events/4"),
+                {
+                    "identity": "events/4",
+                    "timestamp_committed": 4000000,
+                    "event_attributes__arc_display_type": None,
+                    "count": 4,
+                    "other": 4,
+                },
+                msg="Incorrect row found",
+            )
+            self.assertEqual(
+                reader.find("events/1")["other"],  # pyright: ignore
+                None,
+                msg="Incorrect row found",
+            )
+            self.assertIsNone(
+                reader.find("events/0"),
+                msg="Row should not be found",
+            )
+            self.assertIsNone(
+                reader.find("events/9"),
+                msg="Row should not be found",
+            )
+
+    def test_archive_between(self):
+        """
+        Test archive rows in time range
+        """
+        self.write()
+        with self.reader() as reader:
+            self.assertEqual(
+                [
+                    r["identity"]
+                    for r in reader.between(
+                        "1970-01-01T00:00:02Z", "1970-01-01T00:00:05Z"
+                    )
+                ],
+                ["events/2", "events/3", "events/4"],
+                msg="Incorrect rows between",
+            )
+            self.assertEqual(
+                [r["count"] for r in reader.between(0, 10000000)],
+                [1, 2, 3, 4, 5],
+                msg="Incorrect rows between",
+            )
+
+    def test_archive_no_index(self):
+        """
+        Test archive without identity and timestamp
+        """
+        columns = to_columns(RECORDS)
+        del columns["identity"]
+        del columns["timestamp_committed"]
+        with open(self.path, "wb") as fd:
+            ArchiveWriter(fd).write(columns)
+
+        with self.reader() as reader:
+            with self.assertRaises(ArchivistInvalidOperationError):
+                reader.find("events/1")
+
+            with self.assertRaises(ArchivistInvalidOperationError):
+                list(reader.between(0, 1))
+
+    def test_archive_referenced_columns(self):
+        """
+        Test archive closed while columns are referenced
+        """
+        self.write()
+        reader = self.reader()
+        counts = next(reader.batches())["count"]
+        reader.close()
+        self.assertEqual(
+            list(counts),
+            [3, 1, 5],
+            msg="Column not readable after close",
+        )
+
+    def test_archive_not_archive(self):
+        """
+        Test reading a file that is not an archive
+        """
+        with open(self.path, "wb") as fd:
+            fd.write(b"not an archive")
+
+        with self.assertRaises(ArchivistInvalidOperationError):
+            self.reader()
+
+    def test_archive_byteorder(self):
+        """
+        Test reading an archive with different byte order
+        """
+        self.write()
+        with (
+            mock.patch("archivist.archive.byteorder", "other"),
+            self.assertRaises(ArchivistInvalidOperationError),
+        ):
+            self.reader()
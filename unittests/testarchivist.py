@@ -421,6 +421,42 @@ class TestArchivistCount(TestArchivistMethods):
                 msg="incorrect count",
             )
 
+    def test_count_cached(self):
+        """
+        Test count results are cached when count_ttl is set
+        """
+        with (
+            Archivist(
+                "https://app.datatrails.ai", "authauthauth", count_ttl=10
+            ) as arch,
+            mock.patch.object(arch.session, "get") as mock_get,
+        ):
+            mock_get.return_value = MockResponse(
+                200,
+                headers={HEADERS_TOTAL_COUNT.lower(): 1},
+                things=[],
+            )
+            arch.count("path/things", params={"a": "b"})
+            arch.count("path/things", params={"a": "b"})
+            self.assertEqual(
+                mock_get.call_count,
+                1,
+                msg="count not cached",
+            )
+            arch.count("path/things", params={"a": "c"})
+            self.assertEqual(
+                mock_get.call_count,
+                2,
+                msg="count with different params cached",
+            )
+            arch.count_invalidate("/things")
+            arch.count("path/things", params={"a": "b"})
+            self.assertEqual(
+                mock_get.call_count,
+                3,
+                msg="count not invalidated",
+            )
+
     def test_count_with_error(self):
         """
         Test default count method with error
@@ -12,6 +12,7 @@ from archivist.constants import (
     USER_AGENT,
     USER_AGENT_PREFIX,
 )
+from archivist.cursor import ListCursor
 from archivist.errors import (
     ArchivistBadFieldError,
     ArchivistBadRequestError,
@@ -182,7 +183,7 @@ class TestArchivistList(TestArchivistMethods):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {"paramsfield1": "paramsvalue1"},
+                            "params": "paramsfield1=paramsvalue1",
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -227,7 +228,7 @@ class TestArchivistList(TestArchivistMethods):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {"page_size": 2},
+                            "params": "page_size=2",
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -245,7 +246,7 @@ class TestArchivistList(TestArchivistMethods):
         Test default list method
         """
         values = ("value10", "value11", "value12", "value13")
-        paging = ({"page_size": 2}, {"page_size": 2, "page_token": "token"})
+        paging = ("page_size=2", "page_token=token&page_size=2")
         with mock.patch.object(self.arch.session, "get") as mock_get:
             mock_get.side_effect = [
                 MockResponse(
@@ -314,8 +315,8 @@ class TestArchivistList(TestArchivistMethods):
         params = {"field2": "value2"}
         values = ("value10", "value11", "value12", "value13")
         paging = (
-            {**params, "page_size": 2},
-            {"page_size": 2, "page_token": "token"},
+            "field2=value2&page_size=2",
+            "page_token=token&page_size=2",
         )
         with mock.patch.object(self.arch.session, "get") as mock_get:
             mock_get.side_effect = [
@@ -379,6 +380,118 @@ class TestArchivistList(TestArchivistMethods):
                     msg="Incorrect response body value",
                 )
 
+    def test_list_pages_with_page_token(self):
+        """
+        Test list pages method resumed from a page token
+        """
+        paging = (
+            "page_token=token1&page_size=2",
+            "page_token=token2&page_size=2",
+        )
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(
+                    200,
+                    things=[{"field1": "value10"}, {"field1": "value11"}],
+                    next_page_token="token2",
+                ),
+                MockResponse(
+                    200,
+                    things=[{"field1": "value12"}],
+                    next_page_token="",
+                ),
+            ]
+            pages = list(
+                self.arch.list_pages(
+                    "path/path",
+                    "things",
+                    page_size=2,
+                    params={"field2": "value2"},
+                    page_token="token1",
+                )
+            )
+            self.assertEqual(
+                pages,
+                [
+                    ([{"field1": "value10"}, {"field1": "value11"}], "token2"),
+                    ([{"field1": "value12"}], None),
+                ],
+                msg="Incorrect pages",
+            )
+            self.assertEqual(
+                [a[1]["params"] for a in mock_get.call_args_list],
+                list(paging),
+                msg="GET method called incorrectly",
+            )
+
+    def test_list_with_cursor(self):
+        """
+        Test list method interrupted and resumed with a cursor
+        """
+        cursor = ListCursor()
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(
+                    200,
+                    things=[{"field1": "value10"}, {"field1": "value11"}],
+                    next_page_token="token1",
+                ),
+                MockResponse(
+                    200,
+                    things=[{"field1": "value12"}, {"field1": "value13"}],
+                    next_page_token="token2",
+                ),
+            ]
+            listing = self.arch.list("path/path", "things", page_size=2, cursor=cursor)
+            states = [dict(cursor) for _ in zip(range(3), listing)]
+            self.assertEqual(
+                states,
+                [
+                    {"page_token": None, "offset": 1, "count": 1, "done": False},
+                    {"page_token": "token1", "offset": 0, "count": 2, "done": False},
+                    {"page_token": "token1", "offset": 1, "count": 3, "done": False},
+                ],
+                msg="Incorrect cursor",
+            )
+
+        # resume from a copy of the cursor e.g. after JSON serialisation
+        cursor = ListCursor(dict(cursor))
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(
+                    200,
+                    things=[{"field1": "value12"}, {"field1": "value13"}],
+                    next_page_token="token2",
+                ),
+                MockResponse(200, things=[], next_page_token=""),
+            ]
+            things = list(
+                self.arch.list("path/path", "things", page_size=2, cursor=cursor)
+            )
+            self.assertEqual(
+                things, [{"field1": "value13"}], msg="Incorrect resumed listing"
+            )
+            self.assertEqual(
+                [a[1]["params"] for a in mock_get.call_args_list],
+                ["page_token=token1&page_size=2", "page_token=token2&page_size=2"],
+                msg="GET method called incorrectly",
+            )
+            self.assertEqual(
+                cursor,
+                {"page_token": None, "offset": 0, "count": 4, "done": True},
+                msg="Incorrect final cursor",
+            )
+            self.assertTrue(cursor.done, msg="Cursor should be done")
+            self.assertEqual(cursor.count, 4, msg="Incorrect count")
+
+            # a finished cursor lists nothing
+            self.assertEqual(
+                list(self.arch.list("path/path", "things", cursor=cursor)),
+                [],
+                msg="Finished listing should be empty",
+            )
+            self.assertEqual(mock_get.call_count, 2, msg="No further requests")
+
     def test_list_with_429(self):
         """
         Test list method with error
@@ -57,7 +57,7 @@ class TestArchivistSignature(TestArchivistMethods):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {"field1": "value1", "page_size": 2},
+                            "params": "field1=value1&page_size=2",
                         },
                     ),
                     msg="GET method called incorrectly",
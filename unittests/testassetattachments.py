@@ -155,7 +155,7 @@ class TestAssetAttachmentsDownload(TestAssetAttachmentsBase):
         Test attachment download
         """
 
-        self.common_assetattachments_download(None, {})
+        self.common_assetattachments_download(None, None)
 
     def test_assetattachments_download_with_allow_insecure(self):
         """
@@ -164,7 +164,7 @@ class TestAssetAttachmentsDownload(TestAssetAttachmentsBase):
 
         self.common_assetattachments_download(
             {"allow_insecure": "true"},
-            {"allow_insecure": "true"},
+            "allow_insecure=true",
         )
 
     def test_assetattachments_download_with_strict(self):
@@ -174,7 +174,7 @@ class TestAssetAttachmentsDownload(TestAssetAttachmentsBase):
 
         self.common_assetattachments_download(
             {"strict": "true"},
-            {"strict": "true"},
+            "strict=true",
         )
 
 
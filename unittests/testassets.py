@@ -8,9 +8,12 @@ from os import environ
 from unittest import mock
 
 from archivist.about import __version__ as VERSION
+from archivist.archivist import Archivist
+from archivist.confirmation_policy import ConfirmationPolicy
 from archivist.constants import (
     ASSETS_LABEL,
     ASSETS_SUBPATH,
+    HEADERS_TOTAL_COUNT,
     ROOT,
     USER_AGENT,
     USER_AGENT_PREFIX,
@@ -114,6 +117,32 @@ class TestAssetsCreate(TestAssetsBase):
                 msg="Incorrect name property",
             )
 
+    def test_assets_create_invalidates_count(self):
+        """
+        Test asset creation discards cached counts
+        """
+        with (
+            Archivist("url", "authauthauth", count_ttl=10) as arch,
+            mock.patch.object(arch.session, "post") as mock_post,
+            mock.patch.object(arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **RESPONSE)
+            mock_get.return_value = MockResponse(
+                200,
+                headers={HEADERS_TOTAL_COUNT: 1},
+                assets=[RESPONSE],
+            )
+
+            arch.assets.count(attrs={"arc_display_type": "door"})
+            arch.assets.count(attrs={"arc_display_type": "door"})
+            self.assertEqual(mock_get.call_count, 1, msg="count not cached")
+
+            arch.events.count()
+            arch.assets.create(attrs=ATTRS, confirm=False)
+            arch.assets.count(attrs={"arc_display_type": "door"})
+            arch.events.count()
+            self.assertEqual(mock_get.call_count, 4, msg="count not invalidated")
+
     def test_assets_create_merkle_log(self):
         """
         Test asset creation specifying merkle log mechanism
@@ -310,6 +339,61 @@ class TestAssetsCreateConfirm(TestAssetsBaseConfirm):
                 msg="CREATE method called incorrectly",
             )
 
+        self.assertEqual(
+            self.arch.assets.confirmation_policy.samples,
+            1,
+            msg="Time to confirm should be recorded",
+        )
+
+    def test_assets_create_with_future(self):
+        """
+        Test asset creation confirmed in the background
+        """
+        self.arch.assets.confirmation_policy.min_interval = 0.01
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **RESPONSE)
+            mock_get.side_effect = [
+                MockResponse(200, **RESPONSE_PENDING),
+                MockResponse(200, **RESPONSE),
+            ]
+            future = self.arch.assets.create(attrs=ATTRS, future=True)
+            self.assertEqual(
+                future.result(),
+                RESPONSE,
+                msg="Future should resolve with confirmed asset",
+            )
+
+        self.assertEqual(
+            self.arch.assets.confirmation_policy.samples,
+            1,
+            msg="Time to confirm should be recorded",
+        )
+
+    def test_assets_wait_for_confirmation_policy(self):
+        """
+        Test asset confirmation with an explicit policy
+        """
+        policy = ConfirmationPolicy(min_interval=0.01)
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, **RESPONSE_PENDING),
+                MockResponse(200, **RESPONSE),
+            ]
+            asset = self.arch.assets.wait_for_confirmation(
+                RESPONSE["identity"], policy=policy
+            )
+
+        self.assertEqual(asset, RESPONSE, msg="Incorrect asset")
+        self.assertEqual(policy.samples, 1, msg="Policy should record time to confirm")
+        self.assertEqual(
+            self.arch.assets.confirmation_policy.samples,
+            0,
+            msg="Default policy should not record time to confirm",
+        )
+
 
 class TestAssetsCreateIfNotExists(TestAssetsBase):
     """
@@ -356,11 +440,10 @@ class TestAssetsCreateIfNotExists(TestAssetsBase):
                             "authorization": "Bearer authauthauth",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "attributes.arc_namespace": "namespace",
-                            "attributes.arc_display_name": "tcl.ppj.003",
-                            "page_size": 2,
-                        },
+                        "params": (
+                            "attributes.arc_display_name=tcl.ppj.003"
+                            "&attributes.arc_namespace=namespace&page_size=2"
+                        ),
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -386,6 +469,7 @@ class TestAssetsCreateIfNotExists(TestAssetsBase):
             if attachments_resp is not None:
                 mock_attachments.return_value = MockResponse(200, **attachments_resp)
 
+            original = deepcopy(req)
             asset, existed = self.arch.assets.create_if_not_exists(
                 data=req,
                 confirm=False,
@@ -393,6 +477,12 @@ class TestAssetsCreateIfNotExists(TestAssetsBase):
             mock_get.assert_called_once()
             mock_post.assert_called_once()
 
+            self.assertEqual(
+                req,
+                original,
+                msg="Request data modified",
+            )
+
             self.assertEqual(
                 existed,
                 False,
@@ -71,12 +71,40 @@ class TestAssetsList(TestAssetsBase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {},
+                            "params": None,
                         },
                     ),
                     msg="GET method called incorrectly",
                 )
 
+    def test_assets_list_with_fields(self):
+        """
+        Test asset listing with fields
+        """
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(
+                200,
+                assets=[
+                    RESPONSE,
+                ],
+            )
+
+            assets = list(
+                self.arch.assets.list(
+                    fields=("identity", "attributes.arc_display_name"),
+                )
+            )
+            self.assertEqual(
+                assets,
+                [(RESPONSE["identity"], RESPONSE["attributes"]["arc_display_name"])],
+                msg="Incorrect asset listed",
+            )
+            self.assertEqual(
+                assets[0].attributes__arc_display_name,
+                RESPONSE["attributes"]["arc_display_name"],
+                msg="Incorrect asset field",
+            )
+
     def test_assets_list_with_params(self):
         """
         Test asset listing
@@ -119,10 +147,10 @@ class TestAssetsList(TestAssetsBase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {
-                                "confirmation_status": "CONFIRMED",
-                                "attributes.arc_firmware_version": "1.0",
-                            },
+                            "params": (
+                                "confirmation_status=CONFIRMED"
+                                "&attributes.arc_firmware_version=1.0"
+                            ),
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -156,7 +184,7 @@ class TestAssetsList(TestAssetsBase):
                             "authorization": "Bearer authauthauth",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 2},
+                        "params": "page_size=2",
                     },
                 ),
                 msg="GET method called incorrectly",
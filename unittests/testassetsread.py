@@ -130,7 +130,7 @@ class TestAssetsCount(TestAssetsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 1},
+                        "params": "page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -164,15 +164,47 @@ class TestAssetsCount(TestAssetsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "page_size": 1,
-                            "confirmation_status": "CONFIRMED",
-                        },
+                        "params": "confirmation_status=CONFIRMED&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
             )
 
+    def test_assets_count_many(self):
+        """
+        Test asset counting for many filters
+        """
+
+        def get(*_args, **kwargs):
+            count = 2 if "PENDING" in kwargs["params"] else 5
+            return MockResponse(200, headers={HEADERS_TOTAL_COUNT: count}, assets=[])
+
+        with mock.patch.object(self.arch.session, "get", side_effect=get) as mock_get:
+            counts = self.arch.assets.count_many(
+                {
+                    "pending": {"props": {"confirmation_status": "PENDING"}},
+                    "doors": {"attrs": {"arc_display_type": "door"}},
+                    "all": {},
+                },
+                max_workers=2,
+            )
+            self.assertEqual(
+                counts,
+                {"pending": 2, "doors": 5, "all": 5},
+                msg="Incorrect counts",
+            )
+            self.assertEqual(
+                sorted(a[1]["params"] for a in mock_get.call_args_list),
+                [
+                    "attributes.arc_display_type=door&page_size=1",
+                    "confirmation_status=PENDING&page_size=1",
+                    "page_size=1",
+                ],
+                msg="GET method called incorrectly",
+            )
+
+        self.assertEqual(self.arch.assets.count_many({}), {}, msg="No counts")
+
     def test_assets_count_with_attrs_params(self):
         """
         Test asset counting
@@ -199,10 +231,7 @@ class TestAssetsCount(TestAssetsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "page_size": 1,
-                            "attributes.arc_firmware_version": "1.0",
-                        },
+                        "params": "attributes.arc_firmware_version=1.0&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -2,14 +2,16 @@
 Test assets wait
 """
 
+from asyncio import run
+from itertools import repeat
 from logging import getLogger
 from os import environ
 from unittest import mock
 
 from archivist.about import __version__ as VERSION
+from archivist.archivist import Archivist
 from archivist.constants import (
     HEADERS_REQUEST_TOTAL_COUNT,
-    HEADERS_TOTAL_COUNT,
     ROOT,
     USER_AGENT,
     USER_AGENT_PREFIX,
@@ -17,14 +19,8 @@ from archivist.constants import (
 from archivist.errors import ArchivistNotFoundError, ArchivistUnconfirmedError
 from archivist.logger import set_logger
 
-from .mock_response import MockResponse
-from .testassetsconstants import (
-    RESPONSE_FAILED,
-    RESPONSE_PENDING,
-    RESPONSE_STORED,
-    SUBPATH,
-    TestAssetsBase,
-)
+from .mock_response import MockCounts
+from .testassetsconstants import SUBPATH, TestAssetsBase
 
 # pylint: disable=missing-docstring
 # pylint: disable=protected-access
@@ -45,47 +41,18 @@ class TestAssetsWait(TestAssetsBase):
         """
         Test asset counting
         """
-        ## last call to get looks for FAILED assets
-        status = (
-            {"page_size": 1},
-            {"page_size": 1, "confirmation_status": "PENDING"},
-            {"page_size": 1, "confirmation_status": "STORED"},
-            {"page_size": 1, "confirmation_status": "FAILED"},
-        )
-        with mock.patch.object(self.arch.session, "get") as mock_get:
-            # there are 2 gets for each retry - one for PENDING and one for STORED
-            mock_get.side_effect = [
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 2},
-                    assets=[
-                        RESPONSE_PENDING,
-                    ],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-            ]
-
-            self.arch.assets.wait_for_confirmed()
-            for i, a in enumerate(mock_get.call_args_list):
+        # the existence check is made with the first round of status counts
+        status = {
+            "page_size=1",
+            "confirmation_status=PENDING&page_size=1",
+            "confirmation_status=STORED&page_size=1",
+        }
+        counts = MockCounts(total=[2], PENDING=[1, 0], STORED=[1, 0], FAILED=[0])
+        with mock.patch.object(
+            self.arch.session, "get", side_effect=counts
+        ) as mock_get:
+            self.assertTrue(self.arch.assets.wait_for_confirmed())
+            for a in mock_get.call_args_list:
                 self.assertEqual(
                     tuple(a),
                     (
@@ -96,92 +63,92 @@ class TestAssetsWait(TestAssetsBase):
                                 HEADERS_REQUEST_TOTAL_COUNT: "true",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": status[i],
+                            "params": a[1]["params"],
                         },
                     ),
                     msg="GET method called incorrectly",
                 )
 
+        self.assertEqual(
+            sorted(counts.params[:3]),
+            sorted(status),
+            msg="First round should check existence",
+        )
+        self.assertEqual(
+            sorted(counts.params[3:5]),
+            sorted(status - {"page_size=1"}),
+            msg="Second round should only count statuses",
+        )
+        self.assertEqual(
+            counts.params[5:],
+            ["confirmation_status=FAILED&page_size=1"],
+            msg="Failed should be counted once none are pending",
+        )
+
+    def test_assets_wait_for_confirmed_first_round(self):
+        """
+        Test asset counting when already confirmed
+        """
+        counts = MockCounts(total=[2], PENDING=[0], STORED=[0], FAILED=[0])
+        with mock.patch.object(self.arch.session, "get", side_effect=counts):
+            self.assertTrue(self.arch.assets.wait_for_confirmed())
+
+        self.assertEqual(len(counts.params), 4, msg="Only one round of counts")
+
+    def test_assets_wait_for_confirmed_uncached(self):
+        """
+        Test asset counting when counts are cached
+        """
+        counts = MockCounts(total=[2], PENDING=[1, 0], STORED=[0, 0], FAILED=[0])
+        with (
+            Archivist("url", "authauthauth", count_ttl=10) as arch,
+            mock.patch.object(arch.session, "get", side_effect=counts),
+        ):
+            arch.assets.confirmation_policy.min_interval = 0.01
+            self.assertTrue(arch.assets.wait_for_confirmed())
+
+        self.assertEqual(len(counts.params), 6, msg="Counts should not be cached")
+
+    def test_assets_wait_for_confirmed_async(self):
+        """
+        Test asset counting from an event loop
+        """
+        counts = MockCounts(total=[2], PENDING=[0], STORED=[0], FAILED=[0])
+        with mock.patch.object(self.arch.session, "get", side_effect=counts):
+            self.assertTrue(run(self.arch.assets.wait_for_confirmed_async()))
+
     def test_assets_wait_for_confirmed_not_found(self):
         """
         Test asset counting
         """
-        with mock.patch.object(self.arch.session, "get") as mock_get:
-            mock_get.side_effect = [
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[
-                        RESPONSE_PENDING,
-                    ],
-                ),
-            ]
-
-            with self.assertRaises(ArchivistNotFoundError):
-                self.arch.assets.wait_for_confirmed()
+        counts = MockCounts(total=[0], PENDING=[0], STORED=[0], FAILED=[0])
+        with (
+            mock.patch.object(self.arch.session, "get", side_effect=counts),
+            self.assertRaises(ArchivistNotFoundError),
+        ):
+            self.arch.assets.wait_for_confirmed()
 
     def test_assets_wait_for_confirmed_timeout(self):
         """
         Test asset counting
         """
-        ## last call to get looks for FAILED assets
-        with mock.patch.object(self.arch.session, "get") as mock_get:
-            # there are 2 gets for each retry - one for PENDING and one for STORED
-            # enough entries to be supplied so that timeout occurs
-            mock_get.side_effect = [
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 2},
-                    assets=[
-                        RESPONSE_PENDING,
-                    ],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 2},
-                    assets=[
-                        RESPONSE_STORED,
-                    ],
-                ),
-            ] * 100
-
-            with self.assertRaises(ArchivistUnconfirmedError):
-                self.arch.assets.wait_for_confirmed()
+        # enough entries to be supplied so that timeout occurs
+        counts = MockCounts(total=[2], PENDING=repeat(1), STORED=repeat(1), FAILED=[])
+        with (
+            mock.patch.object(self.arch.session, "get", side_effect=counts),
+            self.assertRaises(ArchivistUnconfirmedError),
+        ):
+            self.arch.assets.wait_for_confirmed()
 
     def test_assets_wait_for_confirmed_failed(self):
         """
         Test asset counting
         """
-        ## last call to get looks for FAILED assets
-        with mock.patch.object(self.arch.session, "get") as mock_get:
-            mock_get.side_effect = [
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 2},
-                    assets=[
-                        RESPONSE_PENDING,
-                    ],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 1},
-                    assets=[
-                        RESPONSE_FAILED,
-                    ],
-                ),
-            ]
-
-            with self.assertRaises(
+        counts = MockCounts(total=[2], PENDING=[1, 0], STORED=[0, 0], FAILED=[1])
+        with (
+            mock.patch.object(self.arch.session, "get", side_effect=counts),
+            self.assertRaises(
                 ArchivistUnconfirmedError, msg="Failed to detect confirmation timeout"
-            ):
-                self.arch.assets.wait_for_confirmed()
+            ),
+        ):
+            self.arch.assets.wait_for_confirmed()
@@ -322,7 +322,7 @@ class TestAttachmentsDownload(TestAttachmentsBase):
         Test attachment download
         """
 
-        self.common_attachments_download(None, {})
+        self.common_attachments_download(None, None)
 
     def test_attachments_download_with_allow_insecure(self):
         """
@@ -331,7 +331,7 @@ class TestAttachmentsDownload(TestAttachmentsBase):
 
         self.common_attachments_download(
             {"allow_insecure": "true"},
-            {"allow_insecure": "true"},
+            "allow_insecure=true",
         )
 
     def test_attachments_download_with_strict(self):
@@ -341,7 +341,7 @@ class TestAttachmentsDownload(TestAttachmentsBase):
 
         self.common_attachments_download(
             {"strict": "true"},
-            {"strict": "true"},
+            "strict=true",
         )
 
 
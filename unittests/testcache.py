@@ -0,0 +1,149 @@
+"""
+Test caches
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+from threading import Event, Thread
+from unittest import TestCase, mock
+
+from archivist.cache import _LRUCache, _TTLCache
+
+
+class TestLRUCache(TestCase):
+    """
+    Test LRU cache
+    """
+
+    def test_lru_cache(self):
+        """
+        Test LRU cache get and set
+        """
+        cache = _LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(len(cache), 2, msg="Incorrect length")
+        self.assertEqual(cache.get("a"), 1, msg="Incorrect value")
+        self.assertIsNone(cache.get("c"), msg="Missing key should return None")
+        self.assertEqual(cache.get("c", 3), 3, msg="Incorrect default")
+
+    def test_lru_cache_eviction(self):
+        """
+        Test LRU cache evicts least recently used
+        """
+        cache = _LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache, msg="Recently used entry evicted")
+        self.assertNotIn("b", cache, msg="Least recently used entry not evicted")
+        self.assertIn("c", cache, msg="New entry missing")
+
+        cache.clear()
+        self.assertEqual(len(cache), 0, msg="Cache not cleared")
+
+
+class TestTTLCache(TestCase):
+    """
+    Test TTL cache
+    """
+
+    def test_ttl_cache_disabled(self):
+        """
+        Test zero ttl always calls
+        """
+        cache = _TTLCache(0, 10)
+        func = mock.Mock(return_value=1)
+        cache.get_or_call("a", func)
+        cache.get_or_call("a", func)
+        self.assertEqual(func.call_count, 2, msg="Disabled cache should not cache")
+        self.assertEqual(len(cache), 0, msg="Disabled cache should be empty")
+
+    def test_ttl_cache_expiry(self):
+        """
+        Test entries expire after ttl
+        """
+        cache = _TTLCache(10, 10)
+        func = mock.Mock(return_value=1)
+        with mock.patch("archivist.cache.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            self.assertEqual(cache.get_or_call("a", func), 1, msg="Incorrect value")
+            mock_monotonic.return_value = 105.0
+            self.assertEqual(cache.get_or_call("a", func), 1, msg="Incorrect value")
+            self.assertEqual(func.call_count, 1, msg="Value should be cached")
+            mock_monotonic.return_value = 111.0
+            cache.get_or_call("a", func)
+            self.assertEqual(func.call_count, 2, msg="Value should have expired")
+
+    def test_ttl_cache_maxsize(self):
+        """
+        Test oldest entries are evicted
+        """
+        cache = _TTLCache(10, 2)
+        for key in ("a", "b", "c"):
+            cache.get_or_call(key, lambda: 1)
+
+        self.assertEqual(len(cache), 2, msg="Incorrect length")
+
+    def test_ttl_cache_invalidate(self):
+        """
+        Test invalidation by predicate
+        """
+        cache = _TTLCache(10, 10)
+        cache.get_or_call(("x/assets", "a"), lambda: 1)
+        cache.get_or_call(("x/events", "a"), lambda: 2)
+        cache.invalidate(lambda key: key[0].endswith("/events"))
+        self.assertEqual(len(cache), 1, msg="Incorrect length after invalidate")
+
+    def test_ttl_cache_invalidate_during_call(self):
+        """
+        Test a value fetched across an invalidation is not stored
+        """
+        cache = _TTLCache(10, 10)
+
+        def func():
+            cache.invalidate(lambda key: True)
+            return 1
+
+        self.assertEqual(cache.get_or_call("a", func), 1, msg="Incorrect value")
+        self.assertEqual(len(cache), 0, msg="Stale value stored")
+
+    def test_ttl_cache_exception(self):
+        """
+        Test exceptions are propagated and not cached
+        """
+        cache = _TTLCache(10, 10)
+        func = mock.Mock(side_effect=ValueError)
+        with self.assertRaises(ValueError):
+            cache.get_or_call("a", func)
+
+        self.assertEqual(len(cache), 0, msg="Exception cached")
+
+    def test_ttl_cache_coalesce(self):
+        """
+        Test concurrent calls for the same key share one call
+        """
+        cache = _TTLCache(10, 10)
+        started = Event()
+        release = Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return 1
+
+        results = []
+        owner = Thread(target=lambda: results.append(cache.get_or_call("a", func)))
+        owner.start()
+        started.wait()
+        waiter = Thread(target=lambda: results.append(cache.get_or_call("a", func)))
+        waiter.start()
+        release.set()
+        owner.join()
+        waiter.join()
+        self.assertEqual(results, [1, 1], msg="Incorrect results")
+        self.assertEqual(len(calls), 1, msg="Concurrent calls not coalesced")
@@ -0,0 +1,43 @@
+"""
+Test checkpoint files
+"""
+
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from archivist.checkpoint import load_checkpoint, save_checkpoint
+
+# pylint: disable=missing-docstring
+
+
+class TestCheckpoint(TestCase):
+    """
+    Test checkpoint files
+    """
+
+    def test_checkpoint(self):
+        """
+        Test the checkpoint is replaced and read back
+        """
+        with TemporaryDirectory() as directory:
+            filename = join(directory, "checkpoint.json")
+            save_checkpoint(filename, {"completed": [0]})
+            save_checkpoint(filename, {"completed": [0, 1]})
+            self.assertEqual(
+                load_checkpoint(filename),
+                {"completed": [0, 1]},
+                msg="Incorrect checkpoint",
+            )
+            self.assertFalse(exists(f"{filename}.tmp"), msg="Temporary file remains")
+
+    def test_checkpoint_missing(self):
+        """
+        Test there is no progress without a checkpoint file
+        """
+        with TemporaryDirectory() as directory:
+            self.assertEqual(
+                load_checkpoint(join(directory, "checkpoint.json")),
+                {},
+                msg="Incorrect checkpoint",
+            )
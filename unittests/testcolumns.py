@@ -0,0 +1,167 @@
+"""
+Test columns
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+# pylint: disable=too-few-public-methods
+
+from collections import namedtuple
+from unittest import TestCase
+
+from archivist.columns import (
+    Columns,
+    DictionaryColumn,
+    to_column_batches,
+    to_columns,
+)
+
+Record = namedtuple(
+    "Record",
+    (
+        "identity",
+        "timestamp_committed",
+        "event_attributes__arc_display_type",
+        "confirmed",
+        "count",
+        "value",
+        "other",
+    ),
+)
+
+RECORDS = (
+    Record("events/1", "1970-01-01T00:00:01Z", "open", True, 1, 1.5, {"a": 1}),
+    Record("events/2", "1970-01-01T00:00:02.5Z", "open", False, 2, 2, None),
+    Record("events/3", None, "close", True, 3, 3.5, [1]),
+    Record("events/4", "", None, False, 4, 4.5, "x"),
+)
+
+
+class TestColumns(TestCase):
+    """
+    Test columns
+    """
+
+    def test_to_columns(self):
+        """
+        Test to_columns
+        """
+        columns = to_columns(RECORDS)
+        self.assertEqual(
+            columns.rows,
+            4,
+            msg="Incorrect number of rows",
+        )
+        self.assertEqual(
+            list(columns),
+            list(Record._fields),
+            msg="Incorrect column names",
+        )
+        self.assertEqual(
+            columns["identity"],
+            ["events/1", "events/2", "events/3", "events/4"],
+            msg="Unique strings should not be encoded",
+        )
+        self.assertEqual(
+            list(columns["timestamp_committed"]),
+            [1000000, 2500000, 0, 0],
+            msg="Incorrect timestamps",
+        )
+        self.assertEqual(
+            list(columns["confirmed"]),
+            [1, 0, 1, 0],
+            msg="Incorrect booleans",
+        )
+        self.assertEqual(
+            list(columns["count"]),
+            [1, 2, 3, 4],
+            msg="Incorrect integers",
+        )
+        self.assertEqual(
+            columns["count"].typecode,
+            "q",
+            msg="Incorrect integer type",
+        )
+        self.assertEqual(
+            list(columns["value"]),
+            [1.5, 2.0, 3.5, 4.5],
+            msg="Incorrect floats",
+        )
+        self.assertEqual(
+            columns["other"],
+            [{"a": 1}, None, [1], "x"],
+            msg="Incorrect mixed values",
+        )
+
+    def test_to_columns_dictionary(self):
+        """
+        Test dictionary encoded column
+        """
+        column = to_columns(RECORDS)["event_attributes__arc_display_type"]
+        self.assertIsInstance(
+            column,
+            DictionaryColumn,
+            msg="Repeated strings should be encoded",
+        )
+        self.assertEqual(
+            list(column.codes),
+            [0, 0, 1, -1],
+            msg="Incorrect codes",
+        )
+        self.assertEqual(
+            column.values,
+            ["open", "close"],
+            msg="Incorrect values",
+        )
+        self.assertEqual(
+            len(column),
+            4,
+            msg="Incorrect length",
+        )
+        self.assertEqual(
+            (column[2], column[3]),
+            ("close", None),
+            msg="Incorrect value",
+        )
+        self.assertEqual(
+            list(column),
+            ["open", "open", "close", None],
+            msg="Incorrect values",
+        )
+        self.assertEqual(
+            repr(column),
+            "DictionaryColumn(4 rows, 2 values)",
+            msg="Incorrect repr",
+        )
+
+    def test_to_columns_empty(self):
+        """
+        Test to_columns with no records
+        """
+        columns = to_columns(())
+        self.assertEqual(
+            columns,
+            Columns(),
+            msg="Incorrect columns",
+        )
+        self.assertEqual(
+            columns.rows,
+            0,
+            msg="Incorrect number of rows",
+        )
+
+    def test_to_column_batches(self):
+        """
+        Test to_column_batches
+        """
+        batches = list(to_column_batches(iter(RECORDS), batch_size=3))
+        self.assertEqual(
+            [b.rows for b in batches],
+            [3, 1],
+            msg="Incorrect batches",
+        )
+        self.assertEqual(
+            batches[1]["identity"],
+            ["events/4"],
+            msg="Incorrect batch",
+        )
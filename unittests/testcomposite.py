@@ -0,0 +1,155 @@
+"""
+Test composite
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+from unittest import TestCase, mock
+
+from archivist.archivist import Archivist
+from archivist.composite import _filters, _group, _stuck
+
+ASSET_ID = "assets/xxxxxxxxxxxxxxxxxxxx"
+OTHER_ID = "assets/zzzzzzzzzzzzzzzzzzzz"
+STATUSES = ("PENDING", "STORED", "CONFIRMED", "FAILED")
+
+
+def counts(filters, **_kwargs):
+    """Counts each filter as the number of its attributes"""
+    return {name: len(f.get("attrs", {})) for name, f in filters.items()}
+
+
+class TestComposite(TestCase):
+    """
+    Test composite helpers
+    """
+
+    maxDiff = None
+
+    def test_composite_filters(self):
+        """
+        Test count filters are named group/value
+        """
+        self.assertEqual(
+            _filters(["door"], ["north"]),
+            {
+                "total": {},
+                **{
+                    f"confirmation_status/{s}": {"props": {"confirmation_status": s}}
+                    for s in STATUSES
+                },
+                "display_type/door": {"attrs": {"arc_display_type": "door"}},
+                "namespace/north": {"attrs": {"arc_namespace": "north"}},
+            },
+            msg="Incorrect filters",
+        )
+
+    def test_composite_group(self):
+        """
+        Test counts are nested under their group
+        """
+        self.assertEqual(
+            _group(
+                {
+                    "total": 3,
+                    "confirmation_status/PENDING": 1,
+                    "display_type/door": 2,
+                    "display_type/window": 1,
+                }
+            ),
+            {
+                "total": 3,
+                "confirmation_status": {"PENDING": 1},
+                "display_type": {"door": 2, "window": 1},
+            },
+            msg="Incorrect grouping",
+        )
+
+    def test_composite_stuck(self):
+        """
+        Test assets of pending events accepted before the cutoff are stuck
+        """
+        pending = [
+            (ASSET_ID, "2019-11-27T14:44:19Z"),
+            (ASSET_ID, "2019-11-27T14:45:19Z"),
+            (OTHER_ID, "2019-11-27T14:46:19Z"),
+            (None, "2019-11-27T14:44:19Z"),
+            (OTHER_ID, None),
+        ]
+        with mock.patch("archivist.composite.time", return_value=1574866000.0):
+            self.assertEqual(
+                _stuck(pending, 60),
+                [ASSET_ID],
+                msg="Incorrect stuck assets",
+            )
+
+
+class TestCompositeEstateInfo(TestCase):
+    """
+    Test estate info
+    """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+
+    def tearDown(self):
+        self.arch.close()
+
+    def estate_info(self, **kwargs):
+        def events(props=None, **_kwargs):
+            if props:
+                return iter([(ASSET_ID, "2019-11-27T14:44:19Z")])
+
+            return iter([("open",), ("close",), (None,)])
+
+        with (
+            mock.patch.object(self.arch.assets, "list") as mock_assets,
+            mock.patch.object(self.arch.events, "list", side_effect=events),
+            mock.patch.object(self.arch.assets, "count_many", side_effect=counts),
+            mock.patch.object(self.arch.events, "count_many", side_effect=counts),
+        ):
+            mock_assets.return_value = iter([("door", "north"), ("window", None)])
+            return self.arch.composite.estate_info(**kwargs)
+
+    def test_composite_str(self):
+        self.assertEqual(
+            str(self.arch.composite), "CompositeClient(url)", msg="Incorrect str"
+        )
+
+    def test_composite_estate_info(self):
+        """
+        Test display types of assets and events are sampled separately
+        """
+        self.assertEqual(
+            self.estate_info(),
+            {
+                "assets": {
+                    "total": 0,
+                    "confirmation_status": dict.fromkeys(STATUSES, 0),
+                    "display_type": {"door": 1, "window": 1},
+                    "namespace": {"north": 1},
+                },
+                "events": {
+                    "total": 0,
+                    "confirmation_status": dict.fromkeys(STATUSES, 0),
+                    "display_type": {"close": 1, "open": 1},
+                },
+                "stuck": [ASSET_ID],
+            },
+            msg="Incorrect estate info",
+        )
+
+    def test_composite_estate_info_display_types(self):
+        """
+        Test display types and namespaces specified
+        """
+        info = self.estate_info(display_types=["door"], namespaces=[])
+        self.assertEqual(
+            (info["assets"]["display_type"], info["events"]["display_type"]),
+            ({"door": 1}, {"door": 1}),
+            msg="Display types should be counted for assets and events",
+        )
+        self.assertNotIn("namespace", info["assets"], msg="No namespaces")
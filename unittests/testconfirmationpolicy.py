@@ -0,0 +1,194 @@
+"""
+Test confirmation policy
+"""
+
+from itertools import islice
+from unittest import TestCase, mock
+
+from archivist.confirmation_policy import ConfirmationPolicy
+from archivist.errors import ArchivistUnconfirmedError
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+# pylint: disable=too-few-public-methods
+
+
+def giveup(details):
+    raise ArchivistUnconfirmedError(f"gave up after {details['tries']} tries")
+
+
+class Polls:
+    """Returns None until the nth poll"""
+
+    def __init__(self, n):
+        self.n = n
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return value if self.calls >= self.n else None
+
+
+class TestConfirmationPolicy(TestCase):
+    """
+    Test confirmation policy
+    """
+
+    def test_confirmation_policy_str(self):
+        self.assertEqual(
+            str(ConfirmationPolicy(max_time=10)),
+            "ConfirmationPolicy(max_time=10)",
+            msg="Incorrect str",
+        )
+
+    def test_confirmation_policy_percentiles(self):
+        """
+        Test percentiles are interpolated
+        """
+        policy = ConfirmationPolicy()
+        self.assertEqual(
+            policy.percentiles(50, 90),
+            {50: None, 90: None},
+            msg="Nothing observed",
+        )
+        for seconds in (4.0, 1.0, 3.0, 2.0, 5.0):
+            policy.record(seconds)
+
+        self.assertEqual(
+            policy.percentiles(0, 50, 90, 100),
+            {0: 1.0, 50: 3.0, 90: 4.6, 100: 5.0},
+            msg="Incorrect percentiles",
+        )
+
+    def test_confirmation_policy_window(self):
+        """
+        Test only the most recent times are retained
+        """
+        policy = ConfirmationPolicy(window=2)
+        for seconds in (100.0, 1.0, 2.0):
+            policy.record(seconds)
+
+        self.assertEqual(policy.samples, 2, msg="Incorrect number retained")
+        self.assertEqual(policy.percentiles(100), {100: 2.0}, msg="Oldest discarded")
+
+    def test_confirmation_policy_copy(self):
+        """
+        Test copy keeps observed times and settings
+        """
+        policy = ConfirmationPolicy(min_interval=2.0, window=3)
+        policy.record(1.0)
+        copied = policy.copy(max_time=900)
+        copied.record(3.0)
+        self.assertEqual(copied.max_time, 900, msg="Setting should change")
+        self.assertEqual(copied.min_interval, 2.0, msg="Setting should be kept")
+        self.assertEqual(copied._latencies.maxlen, 3, msg="Window should be kept")
+        self.assertEqual(copied.samples, 2, msg="Observed times should be copied")
+        self.assertEqual(policy.samples, 1, msg="Original should be unchanged")
+
+    def test_confirmation_policy_waits_unobserved(self):
+        """
+        Test polls back off exponentially until enough times are observed
+        """
+        policy = ConfirmationPolicy(max_interval=8.0)
+        for seconds in (9.0, 9.0, 9.0, 9.0):
+            policy.record(seconds)
+
+        self.assertEqual(
+            list(islice(policy.waits(), 7)),
+            [0.0, 1.0, 2.0, 4.0, 8.0, 8.0, 8.0],
+            msg="Incorrect waits",
+        )
+
+    def test_confirmation_policy_waits_observed(self):
+        """
+        Test first poll at the median and then spaced by the spread
+        """
+        policy = ConfirmationPolicy(max_interval=8.0)
+        for seconds in (4.0, 6.0, 8.0, 9.0, 14.0):
+            policy.record(seconds)
+
+        # median 8s, 90th percentile 12s
+        self.assertEqual(
+            list(islice(policy.waits(), 7)),
+            [8.0, 1.0, 1.0, 1.0, 1.0, 2.0, 4.0],
+            msg="Incorrect waits",
+        )
+
+    def test_confirmation_policy_waits_minimum(self):
+        """
+        Test waits are not shorter than min_interval
+        """
+        policy = ConfirmationPolicy(min_samples=1)
+        policy.record(0.1)
+        self.assertEqual(
+            list(islice(policy.waits(), 3)),
+            [1.0, 1.0, 2.0],
+            msg="Incorrect waits",
+        )
+
+    def test_confirmation_policy_wait(self):
+        """
+        Test time to confirm is recorded as the midpoint of the last two polls
+        """
+        policy = ConfirmationPolicy(min_interval=0.01)
+        with mock.patch(
+            "archivist.confirmation_policy.monotonic",
+            side_effect=[100.0, 100.0, 101.0, 105.0],
+        ):
+            self.assertEqual(
+                policy.wait(Polls(3), "confirmed", on_giveup=giveup),
+                "confirmed",
+                msg="Incorrect result",
+            )
+
+        self.assertEqual(policy.percentiles(50), {50: 3.0}, msg="Incorrect time")
+
+    def test_confirmation_policy_wait_first_poll(self):
+        """
+        Test nothing is recorded if confirmed at the first poll
+        """
+        policy = ConfirmationPolicy()
+        policy.wait(Polls(1), "confirmed", on_giveup=giveup)
+        self.assertEqual(policy.samples, 0, msg="Nothing should be recorded")
+
+    def test_confirmation_policy_wait_learned(self):
+        """
+        Test the first poll is delayed by the learned time to confirm
+        """
+        policy = ConfirmationPolicy(min_interval=0.01)
+        for _ in range(5):
+            policy.record(1.0)
+
+        polls = Polls(1)
+        with (
+            mock.patch(
+                "archivist.confirmation_policy.monotonic",
+                side_effect=[100.0, 101.0],
+            ),
+            mock.patch("archivist.confirmation_policy.sleep") as mock_sleep,
+        ):
+            policy.wait(polls, "confirmed", on_giveup=giveup)
+
+        mock_sleep.assert_called_once_with(1.0)
+        self.assertEqual(polls.calls, 1, msg="Should poll once after the wait")
+        self.assertEqual(
+            policy.percentiles(0), {0: 0.5}, msg="Should record from the start"
+        )
+
+    def test_confirmation_policy_wait_no_record(self):
+        """
+        Test nothing is recorded if not requested
+        """
+        policy = ConfirmationPolicy(min_interval=0.01)
+        policy.wait(Polls(2), "confirmed", on_giveup=giveup, record=False)
+        self.assertEqual(policy.samples, 0, msg="Nothing should be recorded")
+
+    def test_confirmation_policy_wait_timeout(self):
+        """
+        Test giving up after max_time
+        """
+        policy = ConfirmationPolicy(max_time=0.05, min_interval=0.01)
+        with self.assertRaises(ArchivistUnconfirmedError):
+            policy.wait(Polls(1000), "confirmed", on_giveup=giveup)
+
+        self.assertEqual(policy.samples, 0, msg="Nothing should be recorded")
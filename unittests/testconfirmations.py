@@ -0,0 +1,178 @@
+"""
+Test background confirmations
+"""
+
+from threading import Event
+from time import monotonic
+from unittest import TestCase
+
+from archivist.archivist import Archivist
+from archivist.confirmation_policy import ConfirmationPolicy
+from archivist.errors import ArchivistNotFoundError, ArchivistUnconfirmedError
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+
+def polls(*results):
+    """Returns each result in turn raising any exception"""
+    results = iter(results)
+
+    def poll():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    return poll
+
+
+class TestConfirmations(TestCase):
+    """
+    Test background confirmations
+    """
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+        self.confirmations = self.arch.confirmations
+        self.policy = ConfirmationPolicy(max_time=1, min_interval=0.01)
+
+    def tearDown(self):
+        self.arch.close()
+
+    def test_confirmations_str(self):
+        self.assertEqual(
+            str(self.confirmations),
+            "ConfirmationsClient(url)",
+            msg="Incorrect str",
+        )
+
+    def test_confirmations_confirmed(self):
+        """
+        Test confirmations are resolved as they are confirmed
+        """
+        futures = [
+            self.confirmations.submit(polls(None, None, "a"), "a", self.policy),
+            self.confirmations.submit(polls("b"), "b", self.policy),
+        ]
+        self.assertEqual(
+            [f.result() for f in futures],
+            ["a", "b"],
+            msg="Incorrect results",
+        )
+        self.assertEqual(self.confirmations.pending, 0, msg="Nothing pending")
+        self.assertEqual(
+            self.policy.samples,
+            1,
+            msg="Only the confirmation that was polled again is recorded",
+        )
+
+    def test_confirmations_learned(self):
+        """
+        Test the first poll is delayed by the learned time to confirm
+        """
+        for _ in range(5):
+            self.policy.record(0.05)
+
+        start = monotonic()
+        future = self.confirmations.submit(polls("a"), "a", self.policy)
+        self.assertEqual(future.result(), "a", msg="Incorrect result")
+        self.assertGreaterEqual(
+            monotonic() - start, 0.05, msg="First poll should be delayed"
+        )
+        self.assertEqual(
+            self.policy.samples, 6, msg="Time to confirm should be recorded"
+        )
+
+    def test_confirmations_exception(self):
+        """
+        Test a poll that raises fails the confirmation
+        """
+        future = self.confirmations.submit(
+            polls(None, ArchivistNotFoundError("gone")), "a", self.policy
+        )
+        with self.assertRaises(ArchivistNotFoundError):
+            future.result()
+
+    def test_confirmations_timeout(self):
+        """
+        Test a confirmation fails after max_time
+        """
+        policy = ConfirmationPolicy(max_time=0.05, min_interval=0.01)
+        future = self.confirmations.submit(lambda: None, "a", policy)
+        with self.assertRaisesRegex(ArchivistUnconfirmedError, "a timed out"):
+            future.result()
+
+    def test_confirmations_close(self):
+        """
+        Test closing abandons pending confirmations without waiting
+        """
+        policy = ConfirmationPolicy(max_time=10, min_interval=5)
+        future = self.confirmations.submit(polls(None, "a"), "a", policy)
+        start = monotonic()
+        self.arch.close()
+        self.assertLess(monotonic() - start, 1, msg="Close should not wait")
+        with self.assertRaisesRegex(ArchivistUnconfirmedError, "abandoned"):
+            future.result()
+
+        self.assertIsNot(
+            self.arch.confirmations,
+            self.confirmations,
+            msg="Confirmations should be recreated after close",
+        )
+
+    def test_confirmations_close_wait(self):
+        """
+        Test closing waits for pending confirmations if asked to
+        """
+        future = self.confirmations.submit(polls(None, "a"), "a", self.policy)
+        self.arch.close(wait=True)
+        self.assertTrue(future.done(), msg="Close should wait")
+        self.assertEqual(future.result(), "a", msg="Incorrect result")
+        self.assertIsNot(
+            self.arch.confirmations,
+            self.confirmations,
+            msg="Confirmations should be recreated after close",
+        )
+
+    def test_confirmations_close_timeout(self):
+        """
+        Test closing abandons pending confirmations after the timeout
+        """
+        policy = ConfirmationPolicy(max_time=10, min_interval=5)
+        future = self.confirmations.submit(lambda: None, "a", policy)
+        self.arch.close(wait=True, timeout=0.05)
+        with self.assertRaisesRegex(ArchivistUnconfirmedError, "abandoned"):
+            future.result()
+
+    def test_confirmations_shutdown(self):
+        """
+        Test shutting down without waiting abandons pending confirmations
+        """
+        policy = ConfirmationPolicy(max_time=10, min_interval=5)
+        polling = Event()
+        release = Event()
+
+        def blocked():
+            polling.set()
+            release.wait()
+
+        scheduled = self.confirmations.submit(lambda: None, "a", policy)
+        inflight = self.confirmations.submit(blocked, "b", policy)
+        polling.wait()
+        release.set()
+        self.confirmations.shutdown(wait=False)
+        for future in (scheduled, inflight):
+            with self.assertRaisesRegex(ArchivistUnconfirmedError, "abandoned"):
+                future.result()
+
+        with self.assertRaises(ArchivistUnconfirmedError):
+            self.confirmations.submit(lambda: "c", "c", policy)
+
+    def test_confirmations_shutdown_unused(self):
+        """
+        Test shutting down before anything was submitted
+        """
+        self.confirmations.shutdown()
+        self.assertIsNone(self.confirmations._scheduler, msg="No scheduler")
@@ -9,6 +9,7 @@ Test dictmerge
 from unittest import TestCase
 
 from archivist import dictmerge
+from archivist.errors import ArchivistBadFieldError
 
 
 class TestDictMerge(TestCase):
@@ -57,26 +58,160 @@ class TestDictMerge(TestCase):
             msg="Dictmerge returns incorrect result",
         )
 
-    def test_dotdict(self):
+    def test_merge(self):
         """
-        Test dotdict
+        Test merge
         """
+        self.assertEqual(
+            dictmerge._merge(None, None),
+            {},
+            msg="Merge returns incorrect result",
+        )
+        self.assertEqual(
+            dictmerge._merge(
+                {"key": "value", "sub": {"subkey": "subvalue"}},
+                {"key1": "value1", "sub": {"subkey1": "subvalue1"}},
+            ),
+            {
+                "key": "value",
+                "sub": {"subkey": "subvalue", "subkey1": "subvalue1"},
+                "key1": "value1",
+            },
+            msg="Merge returns incorrect result",
+        )
+        self.assertEqual(
+            dictmerge._merge({"key": "value"}, {"key": {}, "empty": {"sub": {}}}),
+            {"key": "value"},
+            msg="Merge should drop empty dictionaries",
+        )
+
+    def test_merge_copies(self):
+        """
+        Test merge copies nested dictionaries
+        """
+        fixtures = {"attributes": {"arc_namespace": "namespace"}}
+        params = {"attributes": {"arc_display_type": "door"}, "other": {"a": "b"}}
+        merged = dictmerge._merge(fixtures, params)
+        merged["attributes"]["new"] = "value"
+        merged["other"]["new"] = "value"
+        self.assertEqual(
+            fixtures,
+            {"attributes": {"arc_namespace": "namespace"}},
+            msg="Merge modified fixtures",
+        )
+        self.assertEqual(
+            params,
+            {"attributes": {"arc_display_type": "door"}, "other": {"a": "b"}},
+            msg="Merge modified params",
+        )
+
+    def test_merge_equals_deepmerge(self):
+        """
+        Test merge gives the same result as deepmerge
+        """
+        fixtures = {"attributes": {"arc_namespace": "namespace"}, "public": False}
+        params = {
+            "behaviours": ["RecordEvidence"],
+            "attributes": {"arc_display_type": {"or": ["door", "window"]}},
+        }
+        self.assertEqual(
+            dictmerge._merge(fixtures, params),
+            dictmerge._deepmerge(fixtures, params),
+            msg="Merge and deepmerge differ",
+        )
+
+    def test_querystring(self):
+        """
+        Test querystring
+        """
+        self.assertIsNone(
+            dictmerge._querystring(None),
+            msg="Querystring returns incorrect result",
+        )
         self.assertIsNone(
-            dictmerge._dotdict(None),
-            msg="Dotdict returns incorrect result",
+            dictmerge._querystring({}),
+            msg="Querystring returns incorrect result",
+        )
+        self.assertIsNone(
+            dictmerge._querystring({"key": None}),
+            msg="Querystring returns incorrect result",
         )
         self.assertEqual(
-            dictmerge._dotdict({}),
-            {},
-            msg="Dotdict returns incorrect result",
+            dictmerge._querystring(
+                {
+                    "key": "value one",
+                    "sub": {"subkey": "a/b", "empty": None},
+                    "page_size": 1,
+                }
+            ),
+            "key=value+one&sub.subkey=a%2Fb&page_size=1",
+            msg="Querystring returns incorrect result",
+        )
+        self.assertEqual(
+            dictmerge._querystring({"key": ["a", "b"], "tkey": ("c",)}),
+            "key=a&key=b&tkey=c",
+            msg="Querystring returns incorrect result",
+        )
+        with self.assertRaises(ArchivistBadFieldError):
+            dictmerge._querystring(
+                {
+                    "and": [
+                        {"or": ["a", "b"]},
+                        {"or": ["c"]},
+                    ]
+                }
+            )
+
+    def test_querystring_cached(self):
+        """
+        Test querystring is cached
+        """
+        dictmerge._QUERY_CACHE.clear()
+        params = {"key": "value", "sub": {"subkey": ["a", "b"]}}
+        first = dictmerge._querystring(params)
+        self.assertEqual(
+            len(dictmerge._QUERY_CACHE),
+            1,
+            msg="Querystring not cached",
+        )
+        self.assertIs(
+            dictmerge._querystring({"key": "value", "sub": {"subkey": ["a", "b"]}}),
+            first,
+            msg="Querystring not returned from cache",
+        )
+
+        # unhashable values are cached too
+        self.assertEqual(
+            dictmerge._querystring({"key": {"value"}}),
+            "key=%7B%27value%27%7D",
+            msg="Querystring returns incorrect result",
+        )
+        self.assertEqual(
+            len(dictmerge._QUERY_CACHE),
+            2,
+            msg="Unhashable querystring not cached",
+        )
+
+    def test_querystring_cached_types(self):
+        """
+        Test values that compare equal but encode differently are cached apart
+        """
+        dictmerge._QUERY_CACHE.clear()
+        self.assertEqual(
+            [
+                dictmerge._querystring({"key": value})
+                for value in (True, 1, 1.0, ["a"], ("a",))
+            ],
+            ["key=True", "key=1", "key=1.0", "key=a", "key=a"],
+            msg="Querystring returns incorrect result",
         )
         self.assertEqual(
-            dictmerge._dotdict({"key1": "value1"}),
-            {"key1": "value1"},
-            msg="Dotdict returns incorrect result",
+            len(dictmerge._QUERY_CACHE),
+            5,
+            msg="Querystrings should be cached apart",
         )
         self.assertEqual(
-            dictmerge._dotdict({"key": "value", "sub": {"subkey": "subvalue"}}),
-            {"key": "value", "sub.subkey": "subvalue"},
-            msg="Dotdict returns incorrect result",
+            dictmerge._querystring({"key": (("sub", "a"),)}),
+            "key=%28%27sub%27%2C+%27a%27%29",
+            msg="Tuple should not be taken for a dictionary",
         )
@@ -70,7 +70,7 @@ class TestEventsCount(TestEventsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 1},
+                        "params": "page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -111,7 +111,7 @@ class TestEventsCount(TestEventsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 1, "confirmation_status": "CONFIRMED"},
+                        "params": "confirmation_status=CONFIRMED&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -150,10 +150,7 @@ class TestEventsCount(TestEventsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "page_size": 1,
-                            "event_attributes.arc_firmware_version": "1.0",
-                        },
+                        "params": "event_attributes.arc_firmware_version=1.0&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -191,11 +188,30 @@ class TestEventsCount(TestEventsBase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "page_size": 1,
-                            "event_attributes.arc_firmware_version": "1.0",
-                        },
+                        "params": "event_attributes.arc_firmware_version=1.0&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
             )
+
+    def test_events_count_many(self):
+        """
+        Test event counting for many filters
+        """
+
+        def get(url, **_kwargs):
+            count = 2 if ASSETS_WILDCARD in url else 1
+            return MockResponse(200, headers={HEADERS_TOTAL_COUNT: count}, events=[])
+
+        with mock.patch.object(self.arch.session, "get", side_effect=get):
+            counts = self.arch.events.count_many(
+                {
+                    "asset": {"asset_id": ASSET_ID},
+                    "all": {},
+                }
+            )
+            self.assertEqual(
+                counts,
+                {"asset": 1, "all": 2},
+                msg="Incorrect counts",
+            )
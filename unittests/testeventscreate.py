@@ -2,6 +2,7 @@
 Test events create
 """
 
+from copy import deepcopy
 from unittest import mock
 
 from archivist.about import __version__ as VERSION
@@ -112,9 +113,15 @@ class TestEventsCreate(TestEventsBase):
             mock_post.return_value = MockResponse(200, **RESPONSE_WITH_ATTACHMENTS)
             mock_attachments_create.return_value = ATTACHMENTS
 
+            original = deepcopy(EVENT_ATTRS_ATTACHMENTS)
             event = self.arch.events.create_from_data(
                 ASSET_ID, EVENT_ATTRS_ATTACHMENTS, confirm=False
             )
+            self.assertEqual(
+                EVENT_ATTRS_ATTACHMENTS,
+                original,
+                msg="Request data modified",
+            )
             args, kwargs = mock_post.call_args
             self.assertEqual(
                 args,
@@ -253,6 +260,43 @@ class TestEventsCreate(TestEventsBase):
                 msg="CREATE method called incorrectly",
             )
 
+    def test_events_create_with_future(self):
+        """
+        Test event creation confirmed in the background
+        """
+        self.arch.events.confirmation_policy.min_interval = 0.01
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **RESPONSE)
+            mock_get.side_effect = [
+                MockResponse(200, **RESPONSE_PENDING),
+                MockResponse(200, **RESPONSE),
+            ]
+
+            future = self.arch.events.create(ASSET_ID, PROPS, EVENT_ATTRS, future=True)
+            self.assertEqual(
+                future.result(),
+                RESPONSE,
+                msg="Future should resolve with confirmed event",
+            )
+
+    def test_events_create_with_future_failed_status(self):
+        """
+        Test event creation that fails in the background
+        """
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **RESPONSE)
+            mock_get.return_value = MockResponse(200, **RESPONSE_FAILED)
+
+            future = self.arch.events.create(ASSET_ID, PROPS, EVENT_ATTRS, future=True)
+            with self.assertRaises(ArchivistUnconfirmedError):
+                future.result()
+
     def test_events_create_with_confirmation_no_confirmed_status(self):
         """
         Test asset confirmation
@@ -74,12 +74,53 @@ class TestEventsList(TestEventsBase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {},
+                            "params": None,
                         },
                     ),
                     msg="GET method called incorrectly",
                 )
 
+    def test_events_list_with_fields(self):
+        """
+        Test event listing with fields
+        """
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(
+                200,
+                events=[
+                    RESPONSE,
+                ],
+            )
+
+            events = list(
+                self.arch.events.list(
+                    asset_id=ASSET_ID,
+                    fields=(
+                        "identity",
+                        "confirmation_status",
+                        "event_attributes.arc_append_attachments",
+                        "event_attributes.missing",
+                    ),
+                )
+            )
+            self.assertEqual(
+                events,
+                [
+                    (
+                        RESPONSE["identity"],
+                        "CONFIRMED",
+                        RESPONSE["event_attributes"]["arc_append_attachments"],
+                        None,
+                    ),
+                ],
+                msg="Incorrect event listed",
+            )
+            self.assertEqual(
+                events[0].confirmation_status,
+                "CONFIRMED",
+                msg="Incorrect event field",
+            )
+
     def test_events_list_with_params(self):
         """
         Test event listing
@@ -129,10 +170,10 @@ class TestEventsList(TestEventsBase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {
-                                "confirmation_status": "CONFIRMED",
-                                "event_attributes.arc_firmware_version": "1.0",
-                            },
+                            "params": (
+                                "confirmation_status=CONFIRMED"
+                                "&event_attributes.arc_firmware_version=1.0"
+                            ),
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -186,10 +227,10 @@ class TestEventsList(TestEventsBase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {
-                                "confirmation_status": "CONFIRMED",
-                                "event_attributes.arc_firmware_version": "1.0",
-                            },
+                            "params": (
+                                "confirmation_status=CONFIRMED"
+                                "&event_attributes.arc_firmware_version=1.0"
+                            ),
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -229,7 +270,7 @@ class TestEventsList(TestEventsBase):
                             "authorization": "Bearer authauthauth",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 2},
+                        "params": "page_size=2",
                     },
                 ),
                 msg="GET method called incorrectly",
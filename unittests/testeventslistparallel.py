@@ -0,0 +1,183 @@
+"""
+Test events list parallel
+"""
+
+from unittest import mock
+
+from archivist.constants import (
+    ASSETS_LABEL,
+    ASSETS_SUBPATH,
+    ASSETS_WILDCARD,
+    EVENTS_LABEL,
+    ROOT,
+)
+from archivist.errors import ArchivistInvalidOperationError, ArchivistShardError
+from archivist.events import Event
+
+from .mock_response import MockResponse
+from .testeventsconstants import TestEventsBase
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+# pylint: disable=unused-variable
+
+ASSET_IDS = [f"{ASSETS_LABEL}/{i:020d}" for i in range(3)]
+PREFIX = f"url/{ROOT}/{ASSETS_SUBPATH}/"
+
+
+def event(asset_id, page_token, i):
+    return {
+        "identity": f"{asset_id}/{EVENTS_LABEL}/{page_token or 0}{i}",
+        "asset_identity": asset_id,
+    }
+
+
+def get(url, **kwargs):
+    """Two pages of two events for each asset"""
+    path = url.removeprefix(PREFIX)
+    params = kwargs["params"] or ""
+    if path == ASSETS_LABEL:
+        return MockResponse(200, assets=[{"identity": a} for a in ASSET_IDS])
+
+    asset_id = path.removesuffix(f"/{EVENTS_LABEL}")
+    if asset_id == ASSETS_WILDCARD:
+        return MockResponse(200, events=[event(asset_id, params, 0)])
+
+    page_token = "1" if "page_token=1" in params else None
+    return MockResponse(
+        200,
+        events=[event(asset_id, page_token, i) for i in range(2)],
+        **({} if page_token else {"next_page_token": "1"}),
+    )
+
+
+def expected(asset_id):
+    return [event(asset_id, t, i) for t in (None, "1") for i in range(2)]
+
+
+class TestEventsListParallel(TestEventsBase):
+    """
+    Test Archivist Events list_parallel method
+    """
+
+    maxDiff = None
+
+    def test_events_list_parallel_asset_ids(self):
+        """
+        Test listing events of assets in order
+        """
+        with mock.patch.object(self.arch.session, "get", side_effect=get):
+            events = list(
+                self.arch.events.list_parallel(asset_ids=ASSET_IDS, ordered=True)
+            )
+
+        self.assertEqual(
+            events,
+            [e for a in ASSET_IDS for e in expected(a)],
+            msg="Incorrect events",
+        )
+        self.assertIsInstance(events[0], Event, msg="Not an event")
+
+    def test_events_list_parallel_all_assets(self):
+        """
+        Test listing events of all assets
+        """
+        with mock.patch.object(self.arch.session, "get", side_effect=get) as mock_get:
+            events = list(
+                self.arch.events.list_parallel(fields=("identity",), max_workers=2)
+            )
+            self.assertEqual(
+                mock_get.call_args_list[0][0][0],
+                f"{PREFIX}{ASSETS_LABEL}",
+                msg="Assets should be listed first",
+            )
+
+        self.assertEqual(
+            sorted(events),
+            sorted((e["identity"],) for a in ASSET_IDS for e in expected(a)),
+            msg="Incorrect events",
+        )
+
+    def test_events_list_parallel_shards(self):
+        """
+        Test listing events with shard filters
+        """
+        shards = [
+            {"event_attributes": {"arc_display_type": "open"}},
+            {"event_attributes": {"arc_display_type": "close"}},
+        ]
+        with mock.patch.object(self.arch.session, "get", side_effect=get):
+            events = list(
+                self.arch.events.list_parallel(
+                    shards=shards,
+                    props={"confirmation_status": "CONFIRMED"},
+                    ordered=True,
+                )
+            )
+
+        self.assertEqual(
+            [e["identity"] for e in events],
+            [
+                (
+                    f"{ASSETS_WILDCARD}/{EVENTS_LABEL}/confirmation_status=CONFIRMED"
+                    f"&event_attributes.arc_display_type={t}0"
+                )
+                for t in ("open", "close")
+            ],
+            msg="Shard filters should be merged with props",
+        )
+
+    def test_events_list_parallel_params_copied(self):
+        """
+        Test each asset is listed with its own copy of the params
+        """
+        with mock.patch.object(
+            self.arch, "list_pages", return_value=iter([])
+        ) as mock_list_pages:
+            list(
+                self.arch.events.list_parallel(
+                    asset_ids=ASSET_IDS, props={"confirmation_status": "CONFIRMED"}
+                )
+            )
+
+        params = [c.kwargs["params"] for c in mock_list_pages.call_args_list]
+        self.assertEqual(
+            params,
+            [{"confirmation_status": "CONFIRMED"}] * len(ASSET_IDS),
+            msg="Incorrect params",
+        )
+        self.assertEqual(
+            len({id(p) for p in params}),
+            len(ASSET_IDS),
+            msg="Params should not be shared between threads",
+        )
+
+    def test_events_list_parallel_failed(self):
+        """
+        Test failed shard
+        """
+
+        def failing(url, **kwargs):
+            if url.startswith(f"{PREFIX}{ASSET_IDS[1]}/"):
+                return MockResponse(404, error="not found")
+
+            return get(url, **kwargs)
+
+        with (
+            mock.patch.object(self.arch.session, "get", side_effect=failing),
+            self.assertRaises(ArchivistShardError) as ctx,
+        ):
+            list(self.arch.events.list_parallel(asset_ids=ASSET_IDS))
+
+        self.assertEqual(
+            [shard for shard, _ in ctx.exception.failed],
+            [ASSET_IDS[1]],
+            msg="Incorrect failed shard",
+        )
+
+    def test_events_list_parallel_invalid(self):
+        """
+        Test asset_ids and shards are exclusive
+        """
+        with self.assertRaises(ArchivistInvalidOperationError):
+            self.arch.events.list_parallel(asset_ids=ASSET_IDS, shards=[{}])
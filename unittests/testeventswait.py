@@ -2,6 +2,7 @@
 Test events wait
 """
 
+from asyncio import run
 from unittest import mock
 
 from archivist.about import __version__ as VERSION
@@ -10,7 +11,6 @@ from archivist.constants import (
     ASSETS_WILDCARD,
     EVENTS_LABEL,
     HEADERS_REQUEST_TOTAL_COUNT,
-    HEADERS_TOTAL_COUNT,
     ROOT,
     USER_AGENT,
     USER_AGENT_PREFIX,
@@ -19,11 +19,8 @@ from archivist.errors import (
     ArchivistNotFoundError,
 )
 
-from .mock_response import MockResponse
-from .testeventsconstants import (
-    RESPONSE_PENDING,
-    TestEventsBase,
-)
+from .mock_response import MockCounts
+from .testeventsconstants import TestEventsBase
 
 # pylint: disable=missing-docstring
 # pylint: disable=protected-access
@@ -40,41 +37,18 @@ class TestEventsWait(TestEventsBase):
         """
         Test event confirmation
         """
-        ## last call to get looks for FAILED assets
-        status = (
-            {"page_size": 1},
-            {"page_size": 1, "confirmation_status": "PENDING"},
-            {"page_size": 1, "confirmation_status": "STORED"},
-            {"page_size": 1, "confirmation_status": "FAILED"},
-        )
-        with mock.patch.object(self.arch.session, "get") as mock_get:
-            mock_get.side_effect = [
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 2},
-                    assets=[
-                        RESPONSE_PENDING,
-                    ],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[],
-                ),
-            ]
-
-            self.arch.events.wait_for_confirmed()
-            for i, a in enumerate(mock_get.call_args_list):
+        # the existence check is made with the first round of status counts
+        status = {
+            "page_size=1",
+            "confirmation_status=PENDING&page_size=1",
+            "confirmation_status=STORED&page_size=1",
+        }
+        counts = MockCounts(total=[2], PENDING=[2, 0], STORED=[0, 0], FAILED=[0])
+        with mock.patch.object(
+            self.arch.session, "get", side_effect=counts
+        ) as mock_get:
+            self.assertTrue(self.arch.events.wait_for_confirmed())
+            for a in mock_get.call_args_list:
                 self.assertEqual(
                     tuple(a),
                     (
@@ -91,26 +65,43 @@ class TestEventsWait(TestEventsBase):
                                 HEADERS_REQUEST_TOTAL_COUNT: "true",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": status[i],
+                            "params": a[1]["params"],
                         },
                     ),
                     msg="GET method called incorrectly",
                 )
 
+        self.assertEqual(
+            sorted(counts.params[:3]),
+            sorted(status),
+            msg="First round should check existence",
+        )
+        self.assertEqual(
+            sorted(counts.params[3:5]),
+            sorted(status - {"page_size=1"}),
+            msg="Second round should only count statuses",
+        )
+        self.assertEqual(
+            counts.params[5:],
+            ["confirmation_status=FAILED&page_size=1"],
+            msg="Failed should be counted once none are pending",
+        )
+
+    def test_events_wait_for_confirmed_async(self):
+        """
+        Test event confirmation from an event loop
+        """
+        counts = MockCounts(total=[2], PENDING=[0], STORED=[0], FAILED=[0])
+        with mock.patch.object(self.arch.session, "get", side_effect=counts):
+            self.assertTrue(run(self.arch.events.wait_for_confirmed_async()))
+
     def test_events_wait_for_confirmed_not_found(self):
         """
         Test event counting
         """
-        with mock.patch.object(self.arch.session, "get") as mock_get:
-            mock_get.side_effect = [
-                MockResponse(
-                    200,
-                    headers={HEADERS_TOTAL_COUNT: 0},
-                    assets=[
-                        RESPONSE_PENDING,
-                    ],
-                ),
-            ]
-
-            with self.assertRaises(ArchivistNotFoundError):
-                self.arch.events.wait_for_confirmed()
+        counts = MockCounts(total=[0], PENDING=[0], STORED=[0], FAILED=[0])
+        with (
+            mock.patch.object(self.arch.session, "get", side_effect=counts),
+            self.assertRaises(ArchivistNotFoundError),
+        ):
+            self.arch.events.wait_for_confirmed()
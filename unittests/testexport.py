@@ -0,0 +1,97 @@
+"""
+Test export command
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+from argparse import Namespace
+from gzip import compress, decompress
+from json import dumps
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from archivist.archivist import Archivist
+from archivist.checkpoint import load_checkpoint
+from archivist.cmds.export.run import CHECKPOINT, export
+from archivist.constants import ASSETS_LABEL
+from archivist.errors import ArchivistError
+
+from .mock_response import MockResponse
+
+PAGE1 = [{"identity": f"{ASSETS_LABEL}/1"}, {"identity": f"{ASSETS_LABEL}/2"}]
+PAGE2 = [{"identity": f"{ASSETS_LABEL}/3"}]
+
+
+def ndjson(records):
+    return "".join(f"{dumps(r, separators=(',', ':'))}\n" for r in records).encode()
+
+
+class TestExport(TestCase):
+    """
+    Test export resumes after a crash
+    """
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+        self.directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.checkpoint = join(self.directory.name, CHECKPOINT)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        self.arch.close()
+
+    def export(self, gzip, partial):
+        """Export crashing after the first page with partial written after it
+
+        Returns the exported file and the params of the resumed listing.
+        """
+        args = Namespace(directory=self.directory.name, gzip=gzip, page_size=2)
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, assets=list(PAGE1), next_page_token="page2"),
+                MockResponse(500, error="broken"),
+            ]
+            with self.assertRaises(ArchivistError):
+                export(self.arch, ASSETS_LABEL, args, {}, self.checkpoint)
+
+        filename = load_checkpoint(self.checkpoint)[ASSETS_LABEL]["filename"]
+        with open(filename, "ab") as fd:
+            fd.write(partial)
+
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(200, assets=list(PAGE2))
+            export(
+                self.arch,
+                ASSETS_LABEL,
+                args,
+                load_checkpoint(self.checkpoint),
+                self.checkpoint,
+            )
+            params = mock_get.call_args.kwargs["params"]
+
+        with open(filename, "rb") as fd:
+            return fd.read(), params
+
+    def test_export_resume_partial_page(self):
+        """
+        Test a partially written page is discarded and the page listed again
+        """
+        data, params = self.export(False, b'{"identity":"assets/3"')
+        self.assertEqual(data, ndjson(PAGE1 + PAGE2), msg="Incorrect export")
+        self.assertIn("page_token=page2", params, msg="Should resume at the cursor")
+        self.assertTrue(
+            load_checkpoint(self.checkpoint)[ASSETS_LABEL]["cursor"]["done"],
+            msg="Export should be done",
+        )
+
+    def test_export_resume_partial_gzip_member(self):
+        """
+        Test a partially written gzip member is discarded and written again
+        """
+        data, params = self.export(True, compress(ndjson(PAGE2), mtime=0)[:12])
+        self.assertEqual(
+            decompress(data), ndjson(PAGE1 + PAGE2), msg="Incorrect export"
+        )
+        self.assertIn("page_token=page2", params, msg="Should resume at the cursor")
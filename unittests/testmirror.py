@@ -0,0 +1,341 @@
+"""
+Test mirror
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+from json import loads
+from unittest import TestCase, mock
+
+from archivist.archivist import Archivist
+from archivist.constants import (
+    ASSETS_LABEL,
+    EVENTS_LABEL,
+    MIRROR_COMMITTED_SINCE,
+)
+from archivist.errors import ArchivistError
+from archivist.mirror import Mirror
+
+from .mock_response import MockResponse
+
+ASSET_ID = f"{ASSETS_LABEL}/xxxxxxxxxxxxxxxxxxxx"
+ASSET = {
+    "identity": ASSET_ID,
+    "attributes": {"arc_display_type": "door"},
+}
+OTHER_ID = f"{ASSETS_LABEL}/zzzzzzzzzzzzzzzzzzzz"
+OTHER = {
+    "identity": OTHER_ID,
+    "attributes": {"arc_display_type": "window"},
+}
+EVENT1 = {
+    "identity": f"{ASSET_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy1",
+    "asset_identity": ASSET_ID,
+    "event_attributes": {"arc_display_type": "open"},
+    "timestamp_committed": "2019-11-27T14:44:19Z",
+}
+EVENT2 = {
+    "identity": f"{ASSET_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy2",
+    "asset_identity": ASSET_ID,
+    "event_attributes": {"arc_display_type": "close"},
+    "timestamp_committed": "2019-11-27T14:45:19Z",
+}
+EVENT3 = {
+    "identity": f"{OTHER_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy3",
+    "asset_identity": OTHER_ID,
+    "event_attributes": {"arc_display_type": "open"},
+    "timestamp_committed": "2019-11-27T14:46:19Z",
+}
+EVENT4 = {
+    "identity": f"{ASSET_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy4",
+    "asset_identity": ASSET_ID,
+    "event_attributes": {"arc_display_type": "open"},
+    "timestamp_committed": "2019-11-27T14:47:19Z",
+}
+
+
+class TestMirror(TestCase):
+    """
+    Test Mirror
+    """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+        self.mirror = Mirror(self.arch, ":memory:", page_size=1)
+
+    def tearDown(self):
+        self.mirror.close()
+        self.arch.close()
+
+    def rows(self, sql):
+        return self.mirror.connection.execute(sql).fetchall()
+
+    def test_mirror_context(self):
+        """
+        Test mirror context manager
+        """
+        with Mirror(self.arch, ":memory:") as mirror:
+            self.assertIsNone(mirror.event_age(), msg="No age before sync")
+            self.assertIsNone(mirror.lag(), msg="No lag before sync")
+            self.assertIsNone(mirror.watermark(EVENTS_LABEL), msg="No watermark")
+
+    def test_mirror_sync(self):
+        """
+        Test first and incremental sync
+        """
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[EVENT1], next_page_token="next"),
+                MockResponse(200, events=[EVENT2]),
+                MockResponse(200, assets=[ASSET]),
+            ]
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 1, EVENTS_LABEL: 2},
+                msg="Incorrect first sync",
+            )
+            self.assertEqual(
+                mock_get.call_args_list[0][1]["params"],
+                "page_size=1",
+                msg="First sync should list all events",
+            )
+
+        self.assertEqual(
+            self.mirror.watermark(EVENTS_LABEL),
+            EVENT2["timestamp_committed"],
+            msg="Incorrect watermark",
+        )
+        self.assertEqual(
+            self.rows(
+                "SELECT identity, asset_identity, display_type, timestamp_committed"
+                " FROM events ORDER BY timestamp_committed"
+            ),
+            [
+                (EVENT1["identity"], ASSET_ID, "open", 1574865859000000),
+                (EVENT2["identity"], ASSET_ID, "close", 1574865919000000),
+            ],
+            msg="Incorrect events",
+        )
+        self.assertEqual(
+            [(i, t, loads(d)) for i, t, d in self.rows("SELECT * FROM assets")],
+            [(ASSET_ID, "door", ASSET)],
+            msg="Incorrect assets",
+        )
+        self.assertGreater(self.mirror.event_age(), 0.0, msg="Age should be positive")
+
+        asset = {**ASSET, "attributes": {"arc_display_type": "door", "open": "no"}}
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[EVENT2], next_page_token="next"),
+                MockResponse(200, events=[EVENT3], next_page_token="last"),
+                MockResponse(200, events=[EVENT4]),
+                MockResponse(200, **asset),
+                MockResponse(200, **OTHER),
+            ]
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 2, EVENTS_LABEL: 2},
+                msg="Incorrect incremental sync",
+            )
+            self.assertEqual(
+                mock_get.call_args_list[0][1]["params"],
+                f"{MIRROR_COMMITTED_SINCE}=2019-11-27T14%3A45%3A19Z&page_size=1",
+                msg="Incremental sync should list events since watermark",
+            )
+            self.assertEqual(
+                sorted(a[0][0] for a in mock_get.call_args_list[3:]),
+                [f"url/archivist/v2/{ASSET_ID}", f"url/archivist/v2/{OTHER_ID}"],
+                msg="Incremental sync should read changed assets",
+            )
+
+        self.assertEqual(
+            self.rows("SELECT identity, display_type FROM assets ORDER BY identity"),
+            [(ASSET_ID, "door"), (OTHER_ID, "window")],
+            msg="Incorrect assets",
+        )
+        self.assertEqual(
+            self.mirror.watermark(EVENTS_LABEL),
+            EVENT4["timestamp_committed"],
+            msg="Incorrect watermark",
+        )
+
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(200, events=[EVENT4])
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 0, EVENTS_LABEL: 0},
+                msg="Incorrect empty sync",
+            )
+            self.assertEqual(mock_get.call_count, 1, msg="Only events listed")
+
+    def test_mirror_sync_unconfirmed(self):
+        """
+        Test unconfirmed events and assets are read again until confirmed
+        """
+        pending = {**EVENT1, "confirmation_status": "PENDING"}
+        confirmed = {**EVENT1, "confirmation_status": "CONFIRMED"}
+        asset = {**ASSET, "confirmation_status": "STORED"}
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[pending], next_page_token="next"),
+                MockResponse(200, events=[{**EVENT2, "confirmation_status": "FAILED"}]),
+                MockResponse(200, assets=[asset]),
+            ]
+            self.mirror.sync()
+
+        self.assertEqual(
+            self.mirror.watermark(EVENTS_LABEL),
+            EVENT1["timestamp_committed"],
+            msg="Watermark should be the oldest unconfirmed event",
+        )
+
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[confirmed]),
+                MockResponse(200, **ASSET),
+            ]
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 1, EVENTS_LABEL: 1},
+                msg="Incorrect sync",
+            )
+            self.assertEqual(
+                mock_get.call_args_list[0][1]["params"],
+                f"{MIRROR_COMMITTED_SINCE}=2019-11-27T14%3A44%3A19Z&page_size=1",
+                msg="Sync should list events since the unconfirmed event",
+            )
+            self.assertEqual(
+                mock_get.call_args_list[1][0][0],
+                f"url/archivist/v2/{ASSET_ID}",
+                msg="Sync should read the unconfirmed asset",
+            )
+
+        self.assertEqual(
+            self.mirror.watermark(EVENTS_LABEL),
+            EVENT2["timestamp_committed"],
+            msg="Watermark should be the newest event",
+        )
+
+    def test_mirror_sync_uncommitted(self):
+        """
+        Test events listed before they were committed are read again
+        """
+        uncommitted = {**EVENT1, "timestamp_committed": None}
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[uncommitted, EVENT2]),
+                MockResponse(200, assets=[ASSET, OTHER]),
+            ]
+            self.mirror.sync()
+
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = lambda url, **kwargs: (
+                MockResponse(200, events=[])
+                if url.endswith(f"/{EVENTS_LABEL}")
+                else MockResponse(200, **(EVENT1 if EVENTS_LABEL in url else ASSET))
+            )
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 0, EVENTS_LABEL: 1},
+                msg="Incorrect sync",
+            )
+            self.assertEqual(
+                [a[0][0] for a in mock_get.call_args_list[1:]],
+                [
+                    f"url/archivist/v2/{EVENT1['identity']}",
+                    f"url/archivist/v2/{ASSET_ID}",
+                ],
+                msg="Sync should read the uncommitted event and its asset",
+            )
+
+        self.assertEqual(
+            self.rows(
+                "SELECT timestamp_committed FROM events WHERE identity LIKE '%1'"
+            ),
+            [(1574865859000000,)],
+            msg="Event should be committed",
+        )
+
+    def test_mirror_lag(self):
+        """
+        Test lag is the time since the last sync finished
+        """
+        with (
+            mock.patch.object(self.arch.session, "get") as mock_get,
+            mock.patch("archivist.mirror.time", side_effect=[100.0, 160.0, 200.0]),
+        ):
+            mock_get.side_effect = [
+                MockResponse(200, events=[EVENT1]),
+                MockResponse(200, assets=[ASSET]),
+            ]
+            self.mirror.sync()
+            self.assertEqual(self.mirror.lag(), 40.0, msg="Incorrect lag")
+
+    def test_mirror_sync_empty(self):
+        """
+        Test sync of an empty tenancy
+        """
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[]),
+                MockResponse(200, assets=[]),
+            ]
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 0, EVENTS_LABEL: 0},
+                msg="Incorrect sync",
+            )
+
+        self.assertIsNone(self.mirror.watermark(EVENTS_LABEL), msg="No watermark")
+        self.assertEqual(self.mirror.event_age(), 0.0, msg="No age without events")
+
+    def test_mirror_sync_interrupted(self):
+        """
+        Test an interrupted sync resumes at the failed page
+        """
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[EVENT1], next_page_token="next"),
+                MockResponse(500, error="broken"),
+            ]
+            with self.assertRaises(ArchivistError):
+                self.mirror.sync()
+
+        self.assertEqual(
+            self.rows("SELECT identity FROM events"),
+            [(EVENT1["identity"],)],
+            msg="Completed pages should be kept",
+        )
+        self.assertIsNone(self.mirror.event_age(), msg="No sync recorded")
+        self.assertIsNone(self.mirror.lag(), msg="No sync recorded")
+        self.assertIsNone(self.mirror.watermark(EVENTS_LABEL), msg="No watermark")
+
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[EVENT2]),
+                MockResponse(200, assets=[ASSET]),
+            ]
+            self.assertEqual(
+                self.mirror.sync(),
+                {ASSETS_LABEL: 1, EVENTS_LABEL: 1},
+                msg="Incorrect resumed sync",
+            )
+            self.assertEqual(
+                mock_get.call_args_list[0][1]["params"],
+                "page_token=next&page_size=1",
+                msg="Sync should resume at the failed page",
+            )
+
+        self.assertEqual(
+            self.rows("SELECT cursor FROM sync WHERE cursor IS NOT NULL"),
+            [],
+            msg="Cursor should be cleared",
+        )
+        self.assertEqual(
+            self.mirror.watermark(EVENTS_LABEL),
+            EVENT2["timestamp_committed"],
+            msg="Incorrect watermark",
+        )
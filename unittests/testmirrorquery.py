@@ -0,0 +1,270 @@
+"""
+Test mirror query
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+from unittest import TestCase, mock
+
+from archivist.archivist import Archivist
+from archivist.assets import Asset
+from archivist.constants import (
+    ASSETS_LABEL,
+    ASSETS_WILDCARD,
+    EVENTS_LABEL,
+    HEADERS_TOTAL_COUNT,
+)
+from archivist.errors import ArchivistBadFieldError, ArchivistNotFoundError
+from archivist.events import Event
+from archivist.mirror import Mirror
+from archivist.mirrorquery import _matches, _values
+from archivist.or_dict import and_list, or_dict
+
+from .mock_response import MockResponse
+
+DOOR_ID = f"{ASSETS_LABEL}/xxxxxxxxxxxxxxxxxxxx"
+DOOR = {
+    "identity": DOOR_ID,
+    "confirmation_status": "CONFIRMED",
+    "attributes": {"arc_display_type": "door", "colour": "red", "weight": "1"},
+}
+WINDOW_ID = f"{ASSETS_LABEL}/zzzzzzzzzzzzzzzzzzzz"
+WINDOW = {
+    "identity": WINDOW_ID,
+    "confirmation_status": "PENDING",
+    "attributes": {"arc_display_type": "window"},
+}
+OPEN = {
+    "identity": f"{DOOR_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy1",
+    "asset_identity": DOOR_ID,
+    "event_attributes": {"arc_display_type": "open"},
+    "asset_attributes": {"arc_display_type": "door"},
+    "timestamp_committed": "2019-11-27T14:44:19Z",
+}
+CLOSE = {
+    "identity": f"{DOOR_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy2",
+    "asset_identity": DOOR_ID,
+    "event_attributes": {"arc_display_type": "close"},
+    "asset_attributes": {},
+    "timestamp_committed": "2019-11-27T14:45:19Z",
+}
+SHUT = {
+    "identity": f"{WINDOW_ID}/{EVENTS_LABEL}/yyyyyyyyyyyyyyyyyyy3",
+    "asset_identity": WINDOW_ID,
+    "event_attributes": {"arc_display_type": "close"},
+    "timestamp_committed": "2019-11-27T14:46:19Z",
+}
+
+
+class TestMirrorQueryMatches(TestCase):
+    """
+    Test filter matching
+    """
+
+    def test_matches(self):
+        """
+        Test matches
+        """
+        entity = {"a": "x", "b": {"c": "y", "d": 1}, "e": None}
+        for wanted, expected in (
+            ({}, True),
+            ({"a": "x"}, True),
+            ({"a": "y"}, False),
+            ({"a": "*"}, True),
+            ({"e": "*"}, False),
+            ({"missing": "*"}, False),
+            ({"a": None}, True),
+            ({"b": {"d": 1}}, True),
+            ({"b": {"d": 1.0}}, False),
+            ({"b": {"d": "1"}}, True),
+            ({"b": {"d": True}}, False),
+            ({"b": "*"}, True),
+            ({"b": "y"}, False),
+            ({"a": {"c": "y"}}, False),
+            ({"a": or_dict(["w", "x"])}, True),
+            ({"a": or_dict(["w", "z"])}, False),
+            ({"a": ["w", "x"]}, True),
+            ({"a": "x", "b": {"c": "y"}}, True),
+            ({"a": "x", "b": {"c": "z"}}, False),
+        ):
+            with self.subTest(wanted=wanted):
+                self.assertEqual(_matches(entity, wanted), expected, msg="Match")
+
+        with self.assertRaises(ArchivistBadFieldError):
+            _matches(entity, {"a": and_list([["w", "x"], ["x"]])})
+
+        self.assertTrue(_matches({"f": True}, {"f": True}), msg="Match boolean")
+        self.assertTrue(_matches({"f": True}, {"f": "True"}), msg="Match boolean")
+        self.assertFalse(_matches({"f": True}, {"f": 1}), msg="Match boolean")
+
+    def test_values(self):
+        """
+        Test values of indexed columns
+        """
+        for wanted, expected in (
+            (None, None),
+            ("door", ["door"]),
+            ("*", None),
+            (or_dict(["door", "window"]), ["door", "window"]),
+            (["door", 1], ["door", "1"]),
+            (and_list([["door"]]), None),
+            ({"sub": "door"}, None),
+        ):
+            with self.subTest(wanted=wanted):
+                self.assertEqual(_values(wanted), expected, msg="Values")
+
+
+class TestMirrorQuery(TestCase):
+    """
+    Test queries of the mirror
+    """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+        self.mirror = Mirror(self.arch, ":memory:")
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.side_effect = [
+                MockResponse(200, events=[OPEN, CLOSE, SHUT]),
+                MockResponse(200, assets=[WINDOW, DOOR]),
+            ]
+            self.mirror.sync()
+
+    def tearDown(self):
+        self.mirror.close()
+        self.arch.close()
+
+    def test_mirror_query_str(self):
+        """
+        Test str
+        """
+        self.assertEqual(str(self.mirror.assets), "MirrorAssets()", msg="str")
+        self.assertEqual(str(self.mirror.events), "MirrorEvents()", msg="str")
+
+    def test_mirror_query_read(self):
+        """
+        Test read
+        """
+        asset = self.mirror.assets.read(DOOR_ID)
+        self.assertIsInstance(asset, Asset, msg="Not an asset")
+        self.assertEqual(asset, DOOR, msg="Incorrect asset")
+        event = self.mirror.events.read(CLOSE["identity"])
+        self.assertIsInstance(event, Event, msg="Not an event")
+        self.assertEqual(event, CLOSE, msg="Incorrect event")
+        with self.assertRaises(ArchivistNotFoundError):
+            self.mirror.assets.read(f"{ASSETS_LABEL}/missing")
+
+    def test_mirror_query_assets(self):
+        """
+        Test assets list and count
+        """
+        assets = self.mirror.assets
+        self.assertEqual(
+            list(assets.list()), [DOOR, WINDOW], msg="Incorrect assets order"
+        )
+        self.assertEqual(
+            list(assets.list(attrs={"arc_display_type": "door"})),
+            [DOOR],
+            msg="Incorrect display type filter",
+        )
+        self.assertEqual(
+            list(assets.list(props={"confirmation_status": "PENDING"})),
+            [WINDOW],
+            msg="Incorrect props filter",
+        )
+        self.assertEqual(
+            list(assets.list(attrs={"colour": "*"}, fields=("identity",))),
+            [(DOOR_ID,)],
+            msg="Incorrect fields",
+        )
+        self.assertEqual(
+            assets.count(attrs={"arc_display_type": or_dict(["door", "window"])}),
+            2,
+            msg="Incorrect count",
+        )
+
+    def test_mirror_query_same_as_api(self):
+        """
+        Test filters match in the mirror as they are sent to the API
+        """
+        for attrs, count in (
+            ({"weight": 1}, 1),
+            ({"weight": "1"}, 1),
+            ({"weight": 1.0}, 0),
+            ({"weight": None}, 2),
+        ):
+            with self.subTest(attrs=attrs):
+                with mock.patch.object(self.arch.session, "get") as mock_get:
+                    mock_get.return_value = MockResponse(
+                        200, headers={HEADERS_TOTAL_COUNT: count}
+                    )
+                    self.arch.assets.count(attrs=attrs)
+
+                weight = attrs["weight"]
+                self.assertEqual(
+                    mock_get.call_args.kwargs["params"],
+                    (
+                        "page_size=1"
+                        if weight is None
+                        else f"attributes.weight={weight}&page_size=1"
+                    ),
+                    msg="Incorrect query",
+                )
+                self.assertEqual(
+                    self.mirror.assets.count(attrs=attrs),
+                    count,
+                    msg="Mirror should match as the API",
+                )
+
+    def test_mirror_query_assets_fixtures(self):
+        """
+        Test assets fixtures
+        """
+        self.arch.fixtures = {ASSETS_LABEL: {"attributes": {"colour": "red"}}}
+        self.assertEqual(
+            self.mirror.assets.count(), 1, msg="Fixtures should be applied"
+        )
+
+    def test_mirror_query_events(self):
+        """
+        Test events list and count
+        """
+        events = self.mirror.events
+        self.assertEqual(
+            list(events.list()),
+            [SHUT, CLOSE, OPEN],
+            msg="Events should be most recent first",
+        )
+        self.assertEqual(
+            list(events.list(asset_id=ASSETS_WILDCARD)),
+            [SHUT, CLOSE, OPEN],
+            msg="Incorrect wildcard",
+        )
+        self.assertEqual(
+            list(events.list(asset_id=DOOR_ID)),
+            [CLOSE, OPEN],
+            msg="Incorrect asset filter",
+        )
+        self.assertEqual(
+            list(events.list(asset_id=DOOR_ID, attrs={"arc_display_type": "close"})),
+            [CLOSE],
+            msg="Incorrect asset and display type filter",
+        )
+        self.assertEqual(
+            list(events.list(asset_attrs={"arc_display_type": "door"})),
+            [OPEN],
+            msg="Incorrect asset_attrs filter",
+        )
+        self.assertEqual(
+            list(
+                events.list(
+                    fields=("identity",),
+                    attrs={"arc_display_type": or_dict(["open", "close"])},
+                )
+            ),
+            [(SHUT["identity"],), (CLOSE["identity"],), (OPEN["identity"],)],
+            msg="Incorrect fields",
+        )
+        self.assertEqual(events.count(asset_id=WINDOW_ID), 1, msg="Incorrect count")
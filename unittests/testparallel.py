@@ -0,0 +1,287 @@
+"""
+Test parallel listing
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+# pylint: disable=too-few-public-methods
+
+from concurrent.futures import Future
+from threading import Event, Lock, Thread
+from unittest import TestCase, mock
+
+from archivist.errors import (
+    Archivist5xxError,
+    ArchivistError,
+    ArchivistNotFoundError,
+    ArchivistShardError,
+)
+from archivist.parallel import _parallel_pages, _Shards
+
+# each shard has 3 pages of 2 records
+SHARDS = ("a", "b", "c", "d")
+TOKENS = {None: "1", "1": "2", "2": None}
+
+
+class Pages:
+    """Pages of each shard that optionally fail"""
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.lock = Lock()
+
+    def __call__(self, shard, page_token):
+        with self.lock:
+            self.calls.append((shard, page_token))
+
+        while True:
+            key = (shard, page_token)
+            with self.lock:
+                failure = self.failures.get(key)
+                if failure is not None:
+                    count, ex = failure
+                    self.failures[key] = (count - 1, ex) if count > 1 else None
+
+            if failure is not None:
+                raise ex
+
+            next_token = TOKENS[page_token]
+            yield [f"{shard}{page_token}-0", f"{shard}{page_token}-1"], next_token
+            if next_token is None:
+                return
+
+            page_token = next_token
+
+
+def records(shard):
+    return [f"{shard}{t}-{i}" for t in (None, "1", "2") for i in (0, 1)]
+
+
+class TestParallel(TestCase):
+    """
+    Test parallel listing
+    """
+
+    maxDiff = None
+
+    def test_parallel_empty(self):
+        """
+        Test no shards
+        """
+        self.assertEqual(list(_parallel_pages(Pages(), [])), [], msg="No pages")
+
+    def test_parallel_unordered(self):
+        """
+        Test unordered listing returns all records
+        """
+        listed = [r for page in _parallel_pages(Pages(), SHARDS) for r in page]
+        self.assertEqual(
+            sorted(listed),
+            sorted(r for s in SHARDS for r in records(s)),
+            msg="Incorrect records",
+        )
+
+    def test_parallel_ordered(self):
+        """
+        Test ordered listing returns records in shard order
+        """
+        listed = [
+            r
+            for page in _parallel_pages(Pages(), SHARDS, ordered=True, max_workers=3)
+            for r in page
+        ]
+        self.assertEqual(
+            listed,
+            [r for s in SHARDS for r in records(s)],
+            msg="Incorrect order",
+        )
+
+    def test_parallel_ordered_bounded(self):
+        """
+        Test ordered listing holds shards that get ahead of a slow shard
+        """
+        listed = []
+        ahead = []
+        released = Event()
+
+        def pages(shard, _):
+            if shard == "slow":
+                # give the other shard time to get ahead
+                released.wait(0.3)
+                ahead.append(len(listed))
+                yield ["slow"], None
+                return
+
+            for i in range(50):
+                listed.append(i)
+                yield [i], None
+
+        pages_listed = [
+            r
+            for page in _parallel_pages(pages, ("slow", "fast"), ordered=True)
+            for r in page
+        ]
+        self.assertEqual(
+            pages_listed,
+            ["slow", *range(50)],
+            msg="Incorrect order",
+        )
+        # the queue holds 4 items and one more page is listed before blocking
+        self.assertLessEqual(ahead[0], 5, msg="Fast shard should be held")
+
+    def test_parallel_worker_died(self):
+        """
+        Test the listing stops if a worker dies without finishing its shard
+        """
+
+        class Died(BaseException):
+            pass
+
+        def pages(shard, _):
+            raise Died(shard)
+
+        with (
+            mock.patch("archivist.parallel.POLL_INTERVAL", 0.01),
+            self.assertRaises(Died),
+        ):
+            list(_parallel_pages(pages, SHARDS))
+
+    def test_parallel_retry(self):
+        """
+        Test a transient failure is retried from the failed page
+        """
+        pages = Pages({("b", "1"): (2, Archivist5xxError("busy"))})
+        listed = [
+            r
+            for page in _parallel_pages(pages, SHARDS, ordered=True, retry_delay=0)
+            for r in page
+        ]
+        self.assertEqual(
+            listed,
+            [r for s in SHARDS for r in records(s)],
+            msg="Records should not be repeated",
+        )
+        self.assertEqual(
+            [c for c in pages.calls if c[0] == "b"],
+            [("b", None), ("b", "1"), ("b", "1")],
+            msg="Shard should resume at the failed page",
+        )
+
+    def test_parallel_failed(self):
+        """
+        Test failed shards are reported after the other shards
+        """
+        pages = Pages(
+            {
+                ("b", "1"): (3, Archivist5xxError("busy")),
+                ("c", None): (1, ArchivistNotFoundError("gone")),
+            }
+        )
+        listed = []
+        with self.assertRaises(ArchivistShardError) as ctx:
+            for page in _parallel_pages(
+                pages, SHARDS, ordered=True, retries=2, retry_delay=0
+            ):
+                listed.extend(page)
+
+        self.assertEqual(
+            [shard for shard, _ in ctx.exception.failed],
+            ["b", "c"],
+            msg="Incorrect failed shards",
+        )
+        self.assertIsInstance(ctx.exception.failed[0][1], Archivist5xxError)
+        self.assertIsInstance(ctx.exception.failed[1][1], ArchivistNotFoundError)
+        self.assertEqual(
+            listed,
+            [*records("a"), *records("b")[:2], *records("d")],
+            msg="Other shards should be listed",
+        )
+        self.assertEqual(
+            len([c for c in pages.calls if c[0] == "c"]),
+            1,
+            msg="Only transient errors are retried",
+        )
+
+    def test_parallel_close(self):
+        """
+        Test abandoning the listing
+        """
+        listing = _parallel_pages(Pages(), SHARDS, max_workers=1)
+        self.assertEqual(len(next(listing)), 2, msg="Incorrect page")
+        listing.close()
+
+
+class TestShards(TestCase):
+    """
+    Test abandoned shards
+    """
+
+    def setUp(self):
+        self.shards = _Shards(Pages(), max_workers=1, retries=0, retry_delay=0)
+
+    def test_shards_stopped(self):
+        """
+        Test a stopped worker lists nothing
+        """
+        self.shards.stop.set()
+        self.shards.worker(0, "a")
+        self.assertTrue(self.shards._results.empty(), msg="Nothing listed")
+
+    def test_shards_stopped_while_listing(self):
+        """
+        Test a worker stops after the current page
+        """
+
+        def pages(shard, _):
+            self.shards.stop.set()
+            yield [shard], "1"
+
+        self.shards._pages = pages
+        self.shards.worker(0, "a")
+        self.assertTrue(self.shards._results.empty(), msg="Nothing queued")
+
+    def test_shards_workers_finished(self):
+        """
+        Test arrivals fails if the workers finished without finishing
+        """
+        future = Future()
+        future.set_result(None)
+        with (
+            mock.patch("archivist.parallel.POLL_INTERVAL", 0.01),
+            self.assertRaisesRegex(ArchivistError, "stopped before"),
+        ):
+            next(self.shards.arrivals([future]))
+
+    def test_shards_ordered_stopped_while_ahead(self):
+        """
+        Test a worker held while ahead of the current shard stops
+        """
+        shards = _Shards(Pages(), max_workers=1, retries=0, retry_delay=0, ordered=True)
+        shards.put((1, ["a"]))
+        shards.put((1, ["b"]))
+        with mock.patch("archivist.parallel.POLL_INTERVAL", 0.01):
+            thread = Thread(target=shards.put, args=((1, ["c"]),))
+            thread.start()
+            thread.join(0.05)
+            self.assertTrue(thread.is_alive(), msg="Put should block")
+            shards.stop.set()
+            thread.join()
+
+        self.assertEqual(shards._results.qsize(), 2, msg="Put should not queue")
+
+    def test_shards_stopped_while_full(self):
+        """
+        Test a worker blocked on a full queue stops
+        """
+        self.shards.put((0, ["a"]))
+        self.shards.put((0, ["b"]))
+        with mock.patch("archivist.parallel.POLL_INTERVAL", 0.01):
+            thread = Thread(target=self.shards.put, args=((0, ["c"]),))
+            thread.start()
+            thread.join(0.05)
+            self.assertTrue(thread.is_alive(), msg="Put should block")
+            self.shards.stop.set()
+            thread.join()
+
+        self.assertEqual(self.shards._results.qsize(), 2, msg="Put should not queue")
@@ -0,0 +1,296 @@
+"""
+Test create and confirm pipeline
+"""
+
+from threading import Event
+from time import sleep
+from unittest import TestCase, mock
+
+from archivist.archivist import Archivist
+from archivist.constants import ASSETS_SUBPATH, EVENTS_LABEL, ROOT
+from archivist.errors import ArchivistBadRequestError, ArchivistUnconfirmedError
+from archivist.pipeline import Pipeline
+
+from .mock_response import MockResponse
+from .testassetsconstants import REQUEST as ASSET_REQUEST
+from .testassetsconstants import RESPONSE as ASSET_RESPONSE
+from .testassetsconstants import RESPONSE_FAILED as ASSET_RESPONSE_FAILED
+from .testassetsconstants import RESPONSE_PENDING as ASSET_RESPONSE_PENDING
+from .testeventsconstants import ASSET_ID
+from .testeventsconstants import REQUEST as EVENT_REQUEST
+from .testeventsconstants import RESPONSE as EVENT_RESPONSE
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+
+def by_endpoint(assets, events):
+    """Returns the asset or event response depending on the url"""
+
+    def response(url, *args, **kwargs):  # pylint: disable=unused-argument
+        return events if "/events" in url else assets
+
+    return response
+
+
+def reads(assets, events, *, unconfirmed=None):
+    """Returns the asset or event read depending on the url
+
+    Lists of unconfirmed events return the next of unconfirmed (default
+    nothing).
+    """
+    unconfirmed = iter(unconfirmed or ())
+    read = by_endpoint(assets, events)
+
+    def response(url, *args, **kwargs):
+        if url.endswith(f"/{EVENTS_LABEL}"):
+            return MockResponse(200, events=next(unconfirmed, []))
+
+        return read(url, *args, **kwargs)
+
+    return response
+
+
+class TestPipeline(TestCase):
+    """
+    Test create and confirm pipeline
+    """
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+        self.arch.assets.confirmation_policy.min_interval = 0.01
+        self.arch.events.confirmation_policy.min_interval = 0.01
+        self.pipeline = Pipeline(self.arch, create_workers=2, queue_size=2)
+
+    def tearDown(self):
+        self.arch.close()
+
+    def test_pipeline_str(self):
+        self.assertEqual(str(self.pipeline), "Pipeline(url)", msg="Incorrect str")
+
+    def test_pipeline_run(self):
+        """
+        Test assets and events are created and confirmed
+        """
+        requests = [(None, ASSET_REQUEST), (ASSET_ID, EVENT_REQUEST)] * 3
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.side_effect = by_endpoint(
+                MockResponse(200, **ASSET_RESPONSE_PENDING),
+                MockResponse(200, **EVENT_RESPONSE),
+            )
+            mock_get.side_effect = reads(
+                MockResponse(200, **ASSET_RESPONSE),
+                MockResponse(200, **EVENT_RESPONSE),
+            )
+            results = list(self.pipeline.run(requests))
+
+        self.assertCountEqual(
+            results,
+            [
+                ((None, ASSET_REQUEST), ASSET_RESPONSE),
+                ((ASSET_ID, EVENT_REQUEST), EVENT_RESPONSE),
+            ]
+            * 3,
+            msg="Each request should be confirmed",
+        )
+        metrics = self.pipeline.metrics.snapshot()
+        self.assertGreater(metrics.pop("create_seconds"), 0, msg="No create time")
+        self.assertGreaterEqual(metrics.pop("max_queued"), 1, msg="Nothing queued")
+        self.assertEqual(
+            metrics,
+            {
+                "requested": 6,
+                "created": 6,
+                "create_failed": 0,
+                "queued": 0,
+                "confirming": 0,
+                "confirmed": 6,
+                "confirm_failed": 0,
+            },
+            msg="Incorrect metrics",
+        )
+
+    def test_pipeline_run_failures(self):
+        """
+        Test failures to create or confirm are yielded as exceptions
+        """
+        requests = [(None, ASSET_REQUEST), (ASSET_ID, EVENT_REQUEST)]
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.side_effect = by_endpoint(
+                MockResponse(200, **ASSET_RESPONSE_PENDING),
+                MockResponse(400, error="bad event"),
+            )
+            mock_get.side_effect = reads(
+                MockResponse(200, **ASSET_RESPONSE_FAILED), None
+            )
+            results = {
+                request[0]: result for request, result in self.pipeline.run(requests)
+            }
+
+        self.assertIsInstance(
+            results[None], ArchivistUnconfirmedError, msg="Asset should fail"
+        )
+        self.assertIsInstance(
+            results[ASSET_ID], ArchivistBadRequestError, msg="Event should fail"
+        )
+        metrics = self.pipeline.metrics.snapshot()
+        self.assertEqual(metrics["create_failed"], 1, msg="Incorrect create_failed")
+        self.assertEqual(metrics["confirm_failed"], 1, msg="Incorrect confirm_failed")
+
+    def test_pipeline_run_requests_error(self):
+        """
+        Test an error from the requests is raised after confirming earlier requests
+        """
+
+        def requests():
+            yield (None, ASSET_REQUEST)
+            raise ValueError("bad request")
+
+        results = []
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **ASSET_RESPONSE_PENDING)
+            mock_get.side_effect = reads(MockResponse(200, **ASSET_RESPONSE), None)
+            with self.assertRaisesRegex(ValueError, "bad request"):
+                for result in self.pipeline.run(requests()):
+                    results.append(result)
+
+        self.assertEqual(
+            results,
+            [((None, ASSET_REQUEST), ASSET_RESPONSE)],
+            msg="Earlier request should be confirmed",
+        )
+
+    def test_pipeline_run_close(self):
+        """
+        Test closing the results stops creating and confirming
+        """
+        pipeline = Pipeline(self.arch, create_workers=1, queue_size=1, confirm_limit=1)
+        requests = [(None, ASSET_REQUEST)] * 100
+        polling = Event()
+        release = Event()
+        urls = []
+
+        def get(url, *args, **kwargs):  # pylint: disable=unused-argument
+            urls.append(url)
+            if len(urls) == 2:
+                polling.set()
+                release.wait()
+
+            return MockResponse(200, **ASSET_RESPONSE)
+
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **ASSET_RESPONSE_PENDING)
+            mock_get.side_effect = get
+            results = pipeline.run(requests)
+            self.assertEqual(
+                next(results),
+                ((None, ASSET_REQUEST), ASSET_RESPONSE),
+                msg="Incorrect result",
+            )
+            polling.wait()
+            # one created entity queued and another waiting to be queued
+            while pipeline.metrics.snapshot()["queued"] < 2:
+                sleep(0.01)
+
+            results.close()
+            release.set()
+            self.arch.confirmations.shutdown()
+
+        self.assertEqual(len(urls), 2, msg="Confirming should stop")
+        self.assertLess(
+            pipeline.metrics.snapshot()["requested"],
+            100,
+            msg="Creating should stop",
+        )
+
+    def test_pipeline_run_backpressure(self):
+        """
+        Test creating waits while the confirm stage is at its limit
+        """
+        pipeline = Pipeline(self.arch, create_workers=1, queue_size=1, confirm_limit=1)
+        requests = [(None, ASSET_REQUEST)] * 4
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+            mock.patch("archivist.pipeline.POLL_INTERVAL", 0.01),
+        ):
+            mock_post.return_value = MockResponse(200, **ASSET_RESPONSE_PENDING)
+            responses = iter(
+                [MockResponse(200, **ASSET_RESPONSE_PENDING)] * 5
+                + [MockResponse(200, **ASSET_RESPONSE)] * 4
+            )
+            mock_get.side_effect = lambda url, **kwargs: next(responses)
+            results = list(pipeline.run(requests))
+
+        self.assertEqual(
+            results,
+            [((None, ASSET_REQUEST), ASSET_RESPONSE)] * 4,
+            msg="Each request should be confirmed",
+        )
+        self.assertEqual(
+            pipeline.metrics.snapshot()["max_queued"], 2, msg="Queue should be bounded"
+        )
+
+    def test_pipeline_run_confirmations_shutdown(self):
+        """
+        Test entities that cannot be submitted for confirmation fail
+        """
+        self.arch.confirmations.shutdown()
+        with mock.patch.object(self.arch.session, "post") as mock_post:
+            mock_post.return_value = MockResponse(200, **ASSET_RESPONSE_PENDING)
+            results = list(self.pipeline.run([(None, ASSET_REQUEST)]))
+
+        self.assertEqual(len(results), 1, msg="Incorrect number of results")
+        self.assertIsInstance(
+            results[0][1], ArchivistUnconfirmedError, msg="Confirmation should fail"
+        )
+
+    def test_pipeline_run_batch(self):
+        """
+        Test unconfirmed events are listed once for each batch of polls
+        """
+        policy = self.arch.events.confirmation_policy
+        policy.min_interval = policy.max_interval = 0.2
+        requests = [(ASSET_ID, EVENT_REQUEST)] * 5
+        with (
+            mock.patch.object(self.arch.session, "post") as mock_post,
+            mock.patch.object(self.arch.session, "get") as mock_get,
+        ):
+            mock_post.return_value = MockResponse(200, **EVENT_RESPONSE)
+            mock_get.side_effect = reads(
+                None,
+                MockResponse(200, **EVENT_RESPONSE),
+                unconfirmed=[[{"identity": EVENT_RESPONSE["identity"]}]],
+            )
+            results = list(self.pipeline.run(requests))
+            urls = [c.args[0] for c in mock_get.call_args_list]
+
+        self.assertEqual(
+            results,
+            [((ASSET_ID, EVENT_REQUEST), EVENT_RESPONSE)] * 5,
+            msg="Each request should be confirmed",
+        )
+        listed = [u for u in urls if u.endswith(f"/{EVENTS_LABEL}")]
+        self.assertEqual(
+            set(listed),
+            {f"url/{ROOT}/{ASSETS_SUBPATH}/{ASSET_ID}/{EVENTS_LABEL}"},
+            msg="Should only list the events of the asset",
+        )
+        self.assertEqual(
+            len(listed), 2 * 2, msg="Should list each status once for each batch"
+        )
+        self.assertEqual(
+            len(urls) - len(listed), 5, msg="Should read each entity once confirmed"
+        )
@@ -0,0 +1,238 @@
+"""
+Test profiler
+"""
+
+import json
+from copy import copy
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, mock
+
+from requests import Request, Response
+
+from archivist.archivist import Archivist
+from archivist.assets import Asset
+from archivist.confirmation_policy import ConfirmationPolicy
+from archivist.profiler import Profiler
+
+from .mock_response import MockResponse
+from .testassetsconstants import RESPONSE, RESPONSE_PENDING
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+
+def response(status_code=200, *, sent=b"", received=b"", length=None):
+    """Returns a response to a POST of sent"""
+    r = Response()
+    r.status_code = status_code
+    r._content = received
+    if length is not None:
+        r.headers["Content-Length"] = str(length)
+
+    r.request = Request("POST", "https://app.datatrails.ai", data=sent).prepare()
+    return r
+
+
+class TestProfiler(TestCase):
+    """
+    Test profiler
+    """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.arch = Archivist("url", "authauthauth")
+        self.profiler = self.arch.profiler = Profiler()
+
+    def tearDown(self):
+        self.arch.close()
+
+    def test_profiler_str(self):
+        with self.profiler.step("ASSETS_CREATE"):
+            pass
+
+        self.assertEqual(str(self.profiler), "Profiler(1 steps)", msg="Incorrect str")
+
+    def test_profiler_session(self):
+        """
+        Test the profiler is a response hook of the session
+        """
+        self.assertIn(
+            self.profiler.response_hook,
+            self.arch.session.hooks["response"],
+            msg="Profiler should be a response hook",
+        )
+        self.assertIs(copy(self.arch).profiler, self.profiler, msg="Should be copied")
+
+    def test_profiler_set_after_session(self):
+        """
+        Test the profiler is a response hook if set after the session exists
+        """
+        arch = Archivist("url", "authauthauth")
+        hooks = arch.session.hooks["response"]
+        arch.profiler = self.profiler
+        self.assertEqual(hooks, [self.profiler.response_hook], msg="Hook not set")
+        other = arch.profiler = Profiler()
+        self.assertEqual(hooks, [other.response_hook], msg="Hook not replaced")
+        arch.profiler = None
+        self.assertEqual(hooks, [], msg="Hook not removed")
+        arch.close()
+
+    def test_profiler_requests(self):
+        """
+        Test requests are recorded against the step on the same thread
+        """
+        with self.profiler.step(
+            "ASSETS_CREATE", description="create", label="Drum 1"
+        ) as step:
+            self.profiler.response_hook(response(sent=b"12345", received=b"abc"))
+            self.profiler.response_hook(response(429))
+            self.profiler.response_hook(response(length=10), stream=True)
+
+        self.profiler.response_hook(response(received=b"ab"))
+        self.assertEqual(
+            self.profiler.report(),
+            {
+                "steps": [
+                    {
+                        "index": 0,
+                        "action": "ASSETS_CREATE",
+                        "description": "create",
+                        "label": "Drum 1",
+                        "seconds": step.seconds,
+                        "requests": 3,
+                        "bytes_sent": 5,
+                        "bytes_received": 13,
+                        "retries": 1,
+                        "confirm_seconds": 0.0,
+                    }
+                ],
+                "unattributed": {
+                    "index": -1,
+                    "action": "unattributed",
+                    "description": None,
+                    "label": None,
+                    "seconds": 0.0,
+                    "requests": 1,
+                    "bytes_sent": 0,
+                    "bytes_received": 2,
+                    "retries": 0,
+                    "confirm_seconds": 0.0,
+                },
+            },
+            msg="Incorrect report",
+        )
+
+    def test_profiler_other_threads(self):
+        """
+        Test requests from other threads are recorded against the only step
+        """
+
+        def request():
+            thread = Thread(target=self.profiler.response_hook, args=(response(),))
+            thread.start()
+            thread.join()
+
+        with self.profiler.step("EVENTS_LIST") as first:
+            request()
+            with self.profiler.step("ASSETS_LIST") as second:
+                request()
+
+        self.assertEqual(first.requests, 1, msg="Only step should record request")
+        self.assertEqual(second.requests, 0, msg="Request is not attributable")
+        self.assertEqual(
+            self.profiler.unattributed.requests, 1, msg="Request is not attributable"
+        )
+
+    def test_profiler_confirmation(self):
+        """
+        Test time waiting for confirmation is recorded
+        """
+        policy = ConfirmationPolicy(min_interval=0.01)
+        with (
+            mock.patch.object(self.arch.session, "get") as mock_get,
+            self.profiler.step("ASSETS_WAIT_FOR_CONFIRMATION") as step,
+        ):
+            mock_get.side_effect = [
+                MockResponse(200, **RESPONSE_PENDING),
+                MockResponse(200, **RESPONSE),
+            ]
+            self.arch.assets.wait_for_confirmation(RESPONSE["identity"], policy=policy)
+
+        self.assertGreater(step.confirm_seconds, 0, msg="Wait should be recorded")
+        self.assertLessEqual(step.confirm_seconds, step.seconds, msg="Within step")
+
+    def test_profiler_runner(self):
+        """
+        Test each runner step is profiled
+        """
+        with (
+            mock.patch.object(self.arch.assets, "create_from_data") as mock_create,
+            mock.patch.object(self.arch.assets, "count") as mock_count,
+        ):
+            mock_create.return_value = Asset(**RESPONSE)
+            mock_count.return_value = 1
+            self.arch.runner(
+                {
+                    "steps": [
+                        {
+                            "step": {
+                                "action": "ASSETS_CREATE",
+                                "description": "Create drum",
+                                "asset_label": "Drum 1",
+                            },
+                            "attributes": {"arc_display_name": "Drum 1"},
+                        },
+                        {
+                            "step": {"action": "ASSETS_COUNT"},
+                        },
+                    ],
+                }
+            )
+
+        self.assertEqual(
+            [(s.action, s.description, s.label) for s in self.profiler.steps],
+            [("ASSETS_CREATE", "Create drum", "Drum 1"), ("ASSETS_COUNT", None, None)],
+            msg="Incorrect steps",
+        )
+
+    def test_profiler_summary(self):
+        """
+        Test the summary lists the most costly steps first
+        """
+        with mock.patch("archivist.profiler.monotonic", side_effect=[0, 1, 2, 5]):
+            with self.profiler.step("ASSETS_CREATE", label="Drum 1"):
+                pass
+
+            with self.profiler.step("ASSETS_LIST"):
+                pass
+
+        self.assertEqual(
+            self.profiler.summary().splitlines(),
+            [
+                "   1 ASSETS_LIST: 3.000s requests=0 sent=0 received=0 retries=0 "
+                "confirm=0.000s",
+                "   0 ASSETS_CREATE Drum 1: 1.000s requests=0 sent=0 received=0 "
+                "retries=0 confirm=0.000s",
+                "  -1 unattributed: 0.000s requests=0 sent=0 received=0 retries=0 "
+                "confirm=0.000s",
+            ],
+            msg="Incorrect summary",
+        )
+
+    def test_profiler_write(self):
+        """
+        Test the report is written as JSON
+        """
+        with self.profiler.step("ASSETS_LIST"):
+            pass
+
+        with TemporaryDirectory() as directory:
+            filename = join(directory, "profile.json")
+            self.profiler.write(filename)
+            with open(filename, encoding="utf-8") as fd:
+                self.assertEqual(
+                    json.load(fd), self.profiler.report(), msg="Incorrect report"
+                )
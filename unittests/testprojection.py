@@ -0,0 +1,75 @@
+"""
+Test projection
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+# pylint: disable=too-few-public-methods
+
+from unittest import TestCase
+
+from archivist.errors import ArchivistInvalidOperationError
+from archivist.projection import _Projection
+
+ENTITY = {
+    "identity": "assets/xxxxxxxxxxxxxxxxxxxx/events/yyyyyyyyyyyyyyyyyyyy",
+    "confirmation_status": "CONFIRMED",
+    "event_attributes": {
+        "arc_display_type": "open",
+        "arc-odd-name": "odd",
+    },
+    "asset_attributes": None,
+}
+
+
+class TestProjection(TestCase):
+    """
+    Test projection
+    """
+
+    def test_projection(self):
+        """
+        Test projection
+        """
+        projection = _Projection(
+            (
+                "identity",
+                "event_attributes.arc_display_type",
+                "event_attributes.arc-odd-name",
+                "event_attributes.missing",
+                "asset_attributes.arc_display_type",
+                "missing",
+            )
+        )
+        record = projection(ENTITY)
+        self.assertEqual(
+            record,
+            (ENTITY["identity"], "open", "odd", None, None, None),
+            msg="Incorrect record",
+        )
+        self.assertEqual(
+            record.event_attributes__arc_display_type,
+            "open",
+            msg="Incorrect record field",
+        )
+        self.assertEqual(
+            projection.fields[1],
+            "event_attributes.arc_display_type",
+            msg="Incorrect fields",
+        )
+        self.assertEqual(
+            projection.record._fields[2],
+            "_2",
+            msg="Invalid field name not renamed",
+        )
+        self.assertFalse(
+            hasattr(record, "__dict__"),
+            msg="Record is not compact",
+        )
+
+    def test_projection_no_fields(self):
+        """
+        Test projection with no fields
+        """
+        with self.assertRaises(ArchivistInvalidOperationError):
+            _Projection(())
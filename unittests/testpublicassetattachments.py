@@ -165,7 +165,7 @@ class TestPublicAssetAttachmentsDownload(TestPublicAssetAttachmentsBase):
         Test attachment download
         """
 
-        self.common_assetattachments_download(None, {})
+        self.common_assetattachments_download(None, None)
 
     def test_assetattachments_download_with_allow_insecure(self):
         """
@@ -174,7 +174,7 @@ class TestPublicAssetAttachmentsDownload(TestPublicAssetAttachmentsBase):
 
         self.common_assetattachments_download(
             {"allow_insecure": "true"},
-            {"allow_insecure": "true"},
+            "allow_insecure=true",
         )
 
     def test_assetattachments_download_with_strict(self):
@@ -184,7 +184,7 @@ class TestPublicAssetAttachmentsDownload(TestPublicAssetAttachmentsBase):
 
         self.common_assetattachments_download(
             {"strict": "true"},
-            {"strict": "true"},
+            "strict=true",
         )
 
 
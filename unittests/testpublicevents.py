@@ -170,11 +170,11 @@ class TestPublicEvents(TestCase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "asset_attributes.external_container": "assets/xxxx",
-                            "event_attributes.arc_firmware_version": "1.0",
-                            "page_size": 1,
-                        },
+                        "params": (
+                            "event_attributes.arc_firmware_version=1.0"
+                            "&asset_attributes.external_container=assets%2Fxxxx"
+                            "&page_size=1"
+                        ),
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -218,11 +218,11 @@ class TestPublicEvents(TestCase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "asset_attributes.external_container": "assets/xxxx",
-                            "event_attributes.arc_firmware_version": "1.0",
-                            "page_size": 1,
-                        },
+                        "params": (
+                            "event_attributes.arc_firmware_version=1.0"
+                            "&asset_attributes.external_container=assets%2Fxxxx"
+                            "&page_size=1"
+                        ),
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -268,7 +268,7 @@ class TestPublicEvents(TestCase):
                             "headers": {
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {},
+                            "params": None,
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -314,7 +314,7 @@ class TestPublicEvents(TestCase):
                             "headers": {
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {},
+                            "params": None,
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -353,7 +353,7 @@ class TestPublicEvents(TestCase):
                         "headers": {
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 2},
+                        "params": "page_size=2",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -14,7 +14,7 @@ from archivist.archivist import Archivist
 from archivist.assets import Asset
 from archivist.constants import ASSET_BEHAVIOURS
 from archivist.logger import set_logger
-from archivist.runner import tree
+from archivist.runner import _dependencies, tree
 
 if "DATATRAILS_LOGLEVEL" in environ and environ["DATATRAILS_LOGLEVEL"]:
     set_logger(environ["DATATRAILS_LOGLEVEL"])
@@ -86,3 +86,23 @@ class TestRunner(TestCase):
             runner.identity(ASSET_NAME + "garbage"),
             msg="Incorrect ID",
         )
+
+    def test_runner_dependencies(self):
+        """
+        Test steps depend on earlier steps with the same label
+        """
+        steps = [
+            {"step": {"action": "ASSETS_CREATE", "asset_label": "a"}},
+            {"step": {"action": "ASSETS_CREATE", "asset_label": "b"}},
+            {"step": {"action": "EVENTS_CREATE", "asset_label": "a"}},
+            {"step": {"action": "SUBJECTS_CREATE", "subject_label": "s"}},
+            {"step": {"action": "EVENTS_CREATE", "asset_label": "b"}},
+            {"step": {"action": "ASSETS_LIST"}},
+            {"step": {"action": "EVENTS_CREATE", "asset_label": "a"}},
+            {"step": {"action": "ASSETS_COUNT"}},
+        ]
+        self.assertEqual(
+            _dependencies(steps),
+            [set(), set(), {0}, set(), {1}, {2, 3, 4}, {5}, {5, 6}],
+            msg="Incorrect dependencies",
+        )
@@ -2,8 +2,13 @@
 Test runner assets
 """
 
+import json
+from copy import deepcopy
 from logging import getLogger
 from os import environ
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Event as ThreadEvent
 from unittest import TestCase, mock
 
 # from archivist.errors import ArchivistBadRequestError
@@ -12,6 +17,7 @@ from unittest import TestCase, mock
 # pylint: disable=unused-variable
 from archivist.archivist import Archivist
 from archivist.assets import Asset
+from archivist.checkpoint import save_checkpoint
 from archivist.constants import ASSET_BEHAVIOURS
 from archivist.errors import ArchivistInvalidOperationError
 from archivist.events import Event
@@ -456,3 +462,273 @@ class TestRunnerAssetsCreate(TestCase):
                 0,
                 msg="assets.create incorrectly called",
             )
+
+
+class TestRunnerConcurrent(TestCase):
+    """
+    Test Archivist Runner with concurrent steps
+    """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.arch = Archivist("https://app.datatrails.ai", "authauthauth")
+        self.steps = [
+            {
+                "step": {"action": "ASSETS_CREATE", "asset_label": label},
+                "attributes": {"arc_display_name": label},
+            }
+            for label in ("Asset 1", "Asset 2")
+        ] + [
+            {
+                "step": {"action": "EVENTS_CREATE", "asset_label": label},
+                "event_attributes": {"arc_display_type": "open"},
+            }
+            for label in ("Asset 1", "Asset 2", "Asset 1")
+        ]
+
+    def tearDown(self):
+        self.arch.close()
+
+    @staticmethod
+    def create_asset(data):
+        name = data["attributes"]["arc_display_name"]
+        if name == "Failed":
+            raise ArchivistInvalidOperationError("failed")
+
+        return Asset(identity=f"assets/{name}", **data)
+
+    def test_runner_concurrent(self):
+        """
+        Test steps for different labels run concurrently and in order otherwise
+        """
+        with (
+            mock.patch.object(self.arch.assets, "create_from_data") as mock_create,
+            mock.patch.object(self.arch.events, "create_from_data") as mock_events,
+            mock.patch.object(self.arch.assets, "count") as mock_count,
+        ):
+            mock_create.side_effect = self.create_asset
+            mock_events.return_value = Event(**EVENT_RESPONSE)
+            mock_count.return_value = 2
+            self.arch.runner.run_steps(
+                {"steps": [*self.steps, {"step": {"action": "ASSETS_COUNT"}}]},
+                max_workers=4,
+            )
+
+        self.assertEqual(
+            sorted(c.args[0] for c in mock_events.call_args_list),
+            ["assets/Asset 1", "assets/Asset 1", "assets/Asset 2"],
+            msg="Events should be created on the labelled assets",
+        )
+        self.assertEqual(
+            self.arch.runner.entities["Asset 2"]["identity"],
+            "assets/Asset 2",
+            msg="Incorrect asset created",
+        )
+        mock_count.assert_called_once_with()
+
+    def test_runner_concurrent_exception(self):
+        """
+        Test a failed step stops the steps that depend on it
+        """
+        self.steps[1]["attributes"]["arc_display_name"] = "Failed"
+        with (
+            mock.patch.object(self.arch.assets, "create_from_data") as mock_create,
+            mock.patch.object(self.arch.events, "create_from_data") as mock_events,
+        ):
+            mock_create.side_effect = self.create_asset
+            mock_events.return_value = Event(**EVENT_RESPONSE)
+            with self.assertRaises(ArchivistInvalidOperationError):
+                self.arch.runner.run_steps({"steps": self.steps}, max_workers=4)
+
+        self.assertNotIn(
+            "assets/Asset 2",
+            [c.args[0] for c in mock_events.call_args_list],
+            msg="Steps depending on the failed step should not run",
+        )
+
+    def test_runner_concurrent_exception_checkpoint(self):
+        """
+        Test a step completing after a concurrent step fails is checkpointed
+        """
+        failed = ThreadEvent()
+
+        def create_asset(data):
+            if data["attributes"]["arc_display_name"] == "Asset 1":
+                failed.set()
+                raise ArchivistInvalidOperationError("failed")
+
+            failed.wait()
+            return self.create_asset(data)
+
+        with (
+            TemporaryDirectory() as directory,
+            mock.patch.object(self.arch.assets, "create_from_data") as mock_create,
+        ):
+            mock_create.side_effect = create_asset
+            checkpoint = join(directory, "checkpoint.json")
+            with self.assertRaises(ArchivistInvalidOperationError):
+                self.arch.runner.run_steps(
+                    {"steps": self.steps[:2]}, max_workers=2, checkpoint=checkpoint
+                )
+
+            with open(checkpoint, encoding="utf-8") as fd:
+                completed = json.load(fd)
+
+        self.assertEqual(
+            (completed["next"], completed["completed"], completed["entities"]),
+            (0, [1], {"Asset 2": "assets/Asset 2"}),
+            msg="Completed step should be checkpointed",
+        )
+
+
+class TestRunnerCheckpoint(TestCase):
+    """
+    Test Archivist Runner checkpoint and resume
+    """
+
+    maxDiff = None
+
+    def setUp(self):
+        self.arch = Archivist("https://app.datatrails.ai", "authauthauth")
+        self.directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.checkpoint = join(self.directory.name, "checkpoint.json")
+        self.calls = 0
+        self.events = []
+
+    def tearDown(self):
+        self.arch.close()
+        self.directory.cleanup()
+
+    @staticmethod
+    def config():
+        return {
+            "steps": [
+                {
+                    "step": {"action": "ASSETS_CREATE", "asset_label": "Drum"},
+                    "attributes": {"arc_display_name": "Drum"},
+                },
+                {
+                    "step": {"action": "EVENTS_CREATE", "asset_label": "Drum"},
+                    "event_attributes": {"arc_display_type": "open"},
+                },
+                {
+                    "step": {"action": "EVENTS_CREATE", "asset_label": "Drum"},
+                    "event_attributes": {"arc_display_type": "close"},
+                },
+            ],
+        }
+
+    def run_steps(self, events, **kwargs):
+        with (
+            mock.patch.object(self.arch.assets, "create_from_data") as mock_create,
+            mock.patch.object(self.arch.events, "create_from_data") as mock_events,
+        ):
+            mock_create.return_value = Asset(**ASSETS_RESPONSE)
+            mock_events.side_effect = events
+            try:
+                self.arch.runner.run_steps(
+                    self.config(), checkpoint=self.checkpoint, **kwargs
+                )
+            finally:
+                self.calls = mock_create.call_count + mock_events.call_count
+                self.events = mock_events.call_args_list
+
+    def test_runner_checkpoint_resume(self):
+        """
+        Test resuming skips the completed steps
+        """
+        with self.assertRaises(ArchivistInvalidOperationError):
+            self.run_steps(
+                [Event(**EVENT_RESPONSE), ArchivistInvalidOperationError("failed")]
+            )
+
+        checkpoint = self.load()
+        self.assertEqual(checkpoint["next"], 2, msg="Incorrect next step")
+        self.assertEqual(checkpoint["completed"], [], msg="Incorrect completed")
+        self.assertEqual(
+            checkpoint["entities"], {"Drum": ASSET_ID}, msg="Incorrect entities"
+        )
+
+        self.run_steps([Event(**EVENT_RESPONSE)], resume=True)
+        self.assertEqual(self.calls, 1, msg="Only the failed step should be run")
+        self.assertEqual(
+            self.events,
+            [mock.call(ASSET_ID, {"event_attributes": {"arc_display_type": "close"}})],
+            msg="Label should be restored from the checkpoint",
+        )
+        self.assertEqual(self.load()["next"], 3, msg="All steps completed")
+
+    def test_runner_checkpoint_resume_concurrent(self):
+        """
+        Test resuming concurrently skips the completed steps
+        """
+        with self.assertRaises(ArchivistInvalidOperationError):
+            self.run_steps([ArchivistInvalidOperationError("failed")])
+
+        self.run_steps([Event(**EVENT_RESPONSE)] * 2, resume=True, max_workers=2)
+        self.assertEqual(self.calls, 2, msg="Only the events should be created")
+        self.assertEqual(self.load()["next"], 3, msg="All steps completed")
+
+    def test_runner_checkpoint_resume_gap(self):
+        """
+        Test resuming runs steps before the last completed step
+        """
+        self.run_steps([Event(**EVENT_RESPONSE)] * 2)
+        save_checkpoint(self.checkpoint, {**self.load(), "next": 1, "completed": [2]})
+        self.run_steps([Event(**EVENT_RESPONSE)], resume=True)
+        self.assertEqual(
+            self.events,
+            [mock.call(ASSET_ID, {"event_attributes": {"arc_display_type": "open"}})],
+            msg="Only the step not completed should be run",
+        )
+
+    def test_runner_checkpoint_resume_none(self):
+        """
+        Test resuming without a checkpoint file runs all the steps
+        """
+        self.run_steps([Event(**EVENT_RESPONSE)] * 2, resume=True)
+        self.assertEqual(self.calls, 3, msg="All steps should be run")
+
+    def test_runner_checkpoint_interval(self):
+        """
+        Test the checkpoint file is written after each step that changes the
+        estate and at most once an interval after other steps
+        """
+        config = self.config()
+        config["steps"] += [{"step": {"action": "ASSETS_COUNT"}} for _ in range(3)]
+        for interval, writes in ((60.0, 4), (0.0, 6)):
+            with (
+                mock.patch.object(self.arch.assets, "create_from_data") as mock_create,
+                mock.patch.object(self.arch.events, "create_from_data") as mock_events,
+                mock.patch.object(self.arch.assets, "count") as mock_count,
+                mock.patch(
+                    "archivist.runner.save_checkpoint", wraps=save_checkpoint
+                ) as mock_save,
+            ):
+                mock_create.return_value = Asset(**ASSETS_RESPONSE)
+                mock_events.return_value = Event(**EVENT_RESPONSE)
+                mock_count.return_value = 1
+                self.arch.runner.run_steps(
+                    deepcopy(config),
+                    checkpoint=self.checkpoint,
+                    checkpoint_interval=interval,
+                )
+
+            self.assertEqual(mock_save.call_count, writes, msg="Incorrect writes")
+            self.assertEqual(self.load()["next"], 6, msg="All steps completed")
+
+    def test_runner_checkpoint_different_story(self):
+        """
+        Test resuming from the checkpoint of a different story
+        """
+        for checkpoint in ({"story": "other", "next": 1}, {"story": "", "next": 9}):
+            save_checkpoint(self.checkpoint, checkpoint)
+            with self.assertRaisesRegex(ArchivistInvalidOperationError, "different"):
+                self.run_steps([], resume=True)
+
+            self.assertEqual(self.calls, 0, msg="No steps should be run")
+
+    def load(self):
+        with open(self.checkpoint, encoding="utf-8") as fd:
+            return json.load(fd)
@@ -0,0 +1,115 @@
+"""
+Test streaming story reader
+"""
+
+from io import StringIO
+from os import environ
+from unittest import TestCase, mock
+
+from yaml import YAMLError
+
+from archivist.errors import ArchivistInvalidOperationError
+from archivist.story import iter_steps
+
+# pylint: disable=missing-docstring
+
+STORY = """
+---
+description: read and discarded
+steps:
+  - step: &create
+      action: ASSETS_CREATE
+      asset_label: Drum 1
+    attributes:
+      arc_display_name: !ENV ${DRUM_NAME:drum}
+      arc_namespace: !ENV ${STORY_NAMESPACE}
+      weight: !ENV tag:yaml.org,2002:int ${DRUM_WEIGHT:10}
+  - step: *create
+    confirm: true
+trailer:
+  - 1
+"""
+
+
+class TestStory(TestCase):
+    """
+    Test streaming story reader
+    """
+
+    maxDiff = None
+
+    def test_story_steps(self):
+        """
+        Test steps are read with environment variables substituted
+        """
+        with mock.patch.dict(environ, {"STORY_NAMESPACE": "ns"}):
+            steps = list(iter_steps(StringIO(STORY)))
+
+        step = {"action": "ASSETS_CREATE", "asset_label": "Drum 1"}
+        self.assertEqual(
+            steps,
+            [
+                {
+                    "step": step,
+                    "attributes": {
+                        "arc_display_name": "drum",
+                        "arc_namespace": "ns",
+                        "weight": 10,
+                    },
+                },
+                {"step": step, "confirm": True},
+            ],
+            msg="Incorrect steps",
+        )
+
+    def test_story_streamed(self):
+        """
+        Test each step is returned before later steps are read
+        """
+        steps = iter_steps(StringIO("steps:\n  - action: first\n  - [unterminated\n"))
+        self.assertEqual(next(steps), {"action": "first"}, msg="Incorrect step")
+        with self.assertRaises(YAMLError):
+            next(steps)
+
+    def test_story_no_steps(self):
+        """
+        Test stories without steps
+        """
+        for story in ("", "description: nothing\n", "steps:\n"):
+            self.assertEqual(
+                list(iter_steps(StringIO(story))), [], msg=f"No steps in {story!r}"
+            )
+
+    def test_story_not_mapping(self):
+        """
+        Test a story that is not a mapping
+        """
+        with self.assertRaisesRegex(ArchivistInvalidOperationError, "not a mapping"):
+            list(iter_steps(StringIO("- step\n")))
+
+    def test_story_steps_alias(self):
+        """
+        Test steps that are an alias of an earlier list
+        """
+        self.assertEqual(
+            list(iter_steps(StringIO("other: &s\n  - action: first\nsteps: *s\n"))),
+            [{"action": "first"}],
+            msg="Incorrect steps",
+        )
+
+    def test_story_steps_not_list(self):
+        """
+        Test steps that are not a list
+        """
+        for story in ("steps:\n  action: first\n", "steps: none\n"):
+            with self.assertRaisesRegex(ArchivistInvalidOperationError, "not a list"):
+                list(iter_steps(StringIO(story)))
+
+    def test_story_steps_repeated(self):
+        """
+        Test a story with more than one steps key
+        """
+        steps = iter_steps(StringIO("steps:\n  - action: first\nsteps: []\n"))
+        self.assertEqual(next(steps), {"action": "first"}, msg="Incorrect step")
+        with self.assertRaisesRegex(ArchivistInvalidOperationError, "more than one"):
+            next(steps)
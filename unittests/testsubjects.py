@@ -415,7 +415,7 @@ class TestSubjects(TestCase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {"page_size": 1},
+                        "params": "page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -452,10 +452,7 @@ class TestSubjects(TestCase):
                             HEADERS_REQUEST_TOTAL_COUNT: "true",
                             USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                         },
-                        "params": {
-                            "page_size": 1,
-                            "display_name": "Subject display name",
-                        },
+                        "params": "display_name=Subject+display+name&page_size=1",
                     },
                 ),
                 msg="GET method called incorrectly",
@@ -496,7 +493,7 @@ class TestSubjects(TestCase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {},
+                            "params": None,
                         },
                     ),
                     msg="GET method called incorrectly",
@@ -541,7 +538,7 @@ class TestSubjects(TestCase):
                                 "authorization": "Bearer authauthauth",
                                 USER_AGENT: f"{USER_AGENT_PREFIX}{VERSION}",
                             },
-                            "params": {"display_name": "Subject display name"},
+                            "params": "display_name=Subject+display+name",
                         },
                     ),
                     msg="GET method called incorrectly",
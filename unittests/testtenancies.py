@@ -128,3 +128,77 @@ class TestTenanciesRead(TestTenanciesBase):
                 RESPONSE_PUBLICINFO,
                 msg="Public info is incorrect",
             )
+
+
+class TestTenanciesResolve(TestTenanciesBase):
+    """
+    Test Archivist Tenancies batch resolution
+    """
+
+    def test_tenancies_publicinfo_many(self):
+        """
+        Test both identity forms of the same tenant are fetched once
+        """
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(200, **RESPONSE_PUBLICINFO)
+
+            tenants = self.arch.tenancies.publicinfo_many(
+                [IDENTITY, RESPONSE_IDENTITY, IDENTITY]
+            )
+            self.assertEqual(
+                mock_get.call_count,
+                1,
+                msg="GET method called incorrect number of times",
+            )
+            self.assertEqual(
+                tenants,
+                {
+                    IDENTITY: RESPONSE_PUBLICINFO,
+                    RESPONSE_IDENTITY: RESPONSE_PUBLICINFO,
+                },
+                msg="Public info is incorrect",
+            )
+
+            # second call is served from the cache
+            self.arch.tenancies.publicinfo_many([RESPONSE_IDENTITY])
+            self.assertEqual(
+                mock_get.call_count,
+                1,
+                msg="GET method called for cached tenant",
+            )
+
+    def test_tenancies_resolve(self):
+        """
+        Test resolving tenants of a stream of events
+        """
+        other = f"{TENANCIES_PREFIX}/00000000-32bf-4f5f-a8c6-b342a8356480"
+        events = [
+            {"identity": "e1", "tenant_identity": RESPONSE_IDENTITY},
+            {"identity": "e2", "tenant_identity": other},
+            {"identity": "e3"},
+            {"identity": "e4", "tenant_identity": RESPONSE_IDENTITY},
+        ]
+        with mock.patch.object(self.arch.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(200, **RESPONSE_PUBLICINFO)
+
+            resolved = list(self.arch.tenancies.resolve(iter(events), batch_size=3))
+            self.assertEqual(
+                mock_get.call_count,
+                2,
+                msg="GET method called incorrect number of times",
+            )
+            self.assertEqual(
+                [e for e, _ in resolved],
+                events,
+                msg="Events are incorrect",
+            )
+            self.assertEqual(
+                [t for _, t in resolved],
+                [
+                    RESPONSE_PUBLICINFO,
+                    RESPONSE_PUBLICINFO,
+                    None,
+                    RESPONSE_PUBLICINFO,
+                ],
+                msg="Tenants are incorrect",
+            )
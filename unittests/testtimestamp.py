@@ -0,0 +1,75 @@
+"""
+Test timestamp
+"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=too-few-public-methods
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from archivist.timestamp import parse_timestamp, parse_timestamps
+
+TIMESTAMPS = (
+    "2019-11-27T14:44:19Z",
+    "2019-11-27T14:44:19.5Z",
+    "2019-11-27T14:44:19.123456789Z",
+    "2019-11-28T00:00:00.000001Z",
+    "1969-12-31T23:59:59Z",
+    "2019-11-27T14:44:19+01:00",
+    "2019-11-27",
+    "2019-11-27T14:44:19.Z",
+    "2019-11-27T14:44:19-Z",
+    "2019-11-27T23:59:60Z",
+    "2_19-11-27T14:44:19Z",
+    "+019-11-27T14:44:19Z",
+    " 019-11-27T14:44:19Z",
+    "2019-11-27T14:44:1\u0669Z",
+)
+
+
+class TestTimestamp(TestCase):
+    """
+    Test timestamp
+    """
+
+    def test_parse_timestamps(self):
+        """
+        Test parse timestamps as epoch microseconds
+        """
+        expected = [
+            (parse_timestamp(t) - datetime(1970, 1, 1, tzinfo=timezone.utc))
+            // timedelta(microseconds=1)
+            for t in TIMESTAMPS[:7]
+        ]
+        self.assertEqual(
+            parse_timestamps(TIMESTAMPS[:7] + (None, "")),
+            expected + [0, 0],
+            msg="Incorrect epoch",
+        )
+        self.assertEqual(
+            expected[:2],
+            [1574865859000000, 1574865859500000],
+            msg="Incorrect epoch",
+        )
+
+    def test_parse_timestamps_datetime(self):
+        """
+        Test parse timestamps as datetimes
+        """
+        self.assertEqual(
+            parse_timestamps(TIMESTAMPS[:7] + (None,), epoch=False),
+            [parse_timestamp(t) for t in TIMESTAMPS[:7]] + [None],
+            msg="Incorrect datetime",
+        )
+
+    def test_parse_timestamps_invalid(self):
+        """
+        Test invalid timestamps are rejected as by iso8601
+        """
+        for t in TIMESTAMPS[7:]:
+            with self.assertRaises(ValueError, msg=t):
+                parse_timestamp(t)
+
+            with self.assertRaises(ValueError, msg=t):
+                parse_timestamps((t,))